@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for DecoyCards hot paths.
+
+Measures, for every card type in CARD_TYPES:
+- per-code latency of a single generate(card_type, 1) call
+- batch throughput of generate() across batch sizes (1 ... 10M)
+- memory per code for string lists and compact CardBatch records
+plus the cost of get_card_info(), calculate_travel_time() and format_time()
+calls, throughput with 1, 4 and 16 threads (a thread-pool batch and threads
+calling generate() side by side; only free-threaded builds can scale), the
+TimerManager.run_due() scheduler loop with 1 to 2000 store timers, and the
+CLI cold start.
+
+Results are written as JSON. With --baseline the run is compared against a
+stored result file and the exit status is 1 when any metric got worse by
+more than --tolerance.
+
+Usage:
+    python benchmarks/bench_decoycards.py --out results.json
+    python benchmarks/bench_decoycards.py --baseline benchmarks/baseline.json
+    python benchmarks/bench_decoycards.py --sizes 1,1000,10000000 --types xbox
+    python3.13t benchmarks/bench_decoycards.py --skip generation,memory,calls,timers,cold_start --types xbox
+    python benchmarks/bench_decoycards.py --save-baseline benchmarks/baseline.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import timeit
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+sys.path.insert(0, HERE)
+
+import decoycards  # noqa: E402
+from decoy_timers import TimerManager  # noqa: E402
+from decoycards import CARD_TYPES, DecoyCards  # noqa: E402
+
+DEFAULT_SIZES = [1, 100, 10000, 1000000]
+FULL_SIZES = [1, 100, 10000, 1000000, 10000000]
+MEMORY_SAMPLE = 100000
+THREAD_COUNTS = [1, 4, 16]
+THREAD_BATCH = 1000000
+# Cards per generate() call and calls per thread in the side-by-side run
+CALLER_BATCH = 10000
+CALLER_CALLS = 20
+# Running store timers per scheduler run, and how long each run lasts on the
+# simulated clock
+TIMER_SESSIONS = [1, 100, 500, 2000]
+TIMER_SECONDS = 30
+
+
+def _metric(value, unit, better):
+    return {'value': value, 'unit': unit, 'better': better}
+
+
+def _per_call(stmt, min_time=0.2):
+    """Seconds per call of stmt, using timeit's autorange and best of 5."""
+    timer = timeit.Timer(stmt)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    return min(timer.repeat(5, number)) / number
+
+
+def bench_generation(decoy, card_types, sizes, results):
+    for card_type in card_types:
+        latency = _per_call(lambda: decoy.generate(card_type, 1))
+        results[f'latency/{card_type}'] = _metric(latency * 1e6, 'us', 'lower')
+
+        for size in sizes:
+            if size <= 10000:
+                seconds = _per_call(lambda: decoy.generate(card_type, size))
+            else:
+                gc.collect()
+                start = time.perf_counter()
+                decoy.generate(card_type, size)
+                seconds = time.perf_counter() - start
+            results[f'throughput/{card_type}/{size}'] = _metric(
+                size / seconds, 'codes/s', 'higher')
+            print(f"  {card_type:12} {size:>9} codes: {size / seconds:>12,.0f} codes/s",
+                  flush=True)
+
+
+def _bytes_per_code(build):
+    build()  # lazy imports and compiled layouts must not count as per-code cost
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return current / MEMORY_SAMPLE
+
+
+def bench_memory(decoy, card_types, results):
+    for card_type in card_types:
+        strings = _bytes_per_code(lambda: decoy.generate(card_type, MEMORY_SAMPLE)[0])
+        records = _bytes_per_code(
+            lambda: decoy.generate(card_type, MEMORY_SAMPLE, records=True)[0])
+        results[f'memory/{card_type}/strings'] = _metric(strings, 'bytes/code', 'lower')
+        results[f'memory/{card_type}/records'] = _metric(records, 'bytes/code', 'lower')
+        print(f"  {card_type:12} strings {strings:6.1f} B/code, "
+              f"records {records:6.1f} B/code", flush=True)
+
+
+def bench_helpers(decoy, results):
+    calls = {
+        'get_card_info': lambda: decoy.get_card_info('xbox'),
+        'calculate_travel_time': lambda: decoy.calculate_travel_time(2.5, 'miles', 'car'),
+        'format_time': lambda: decoy.format_time(1, 23, 45),
+    }
+    for name, call in calls.items():
+        seconds = _per_call(call)
+        results[f'call/{name}'] = _metric(seconds * 1e9, 'ns', 'lower')
+        print(f"  {name:22} {seconds * 1e9:8.0f} ns/call", flush=True)
+
+
+def _gil_enabled():
+    check = getattr(sys, '_is_gil_enabled', None)
+    return True if check is None else check()
+
+
+def _run_callers(decoy, card_type, threads):
+    import threading
+
+    start_line = threading.Barrier(threads + 1)
+
+    def caller():
+        start_line.wait()
+        for _ in range(CALLER_CALLS):
+            decoy.generate(card_type, CALLER_BATCH)
+
+    workers = [threading.Thread(target=caller, name=f'caller-{i}') for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    start_line.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def bench_threads(card_type, results):
+    """Thread-pool batches and concurrent generate() callers, per thread count."""
+    for threads in THREAD_COUNTS:
+        decoy = DecoyCards(seed=threads)
+        gc.collect()
+        start = time.perf_counter()
+        decoy.generate(card_type, THREAD_BATCH, threads=threads, seed=1)
+        pool = THREAD_BATCH / (time.perf_counter() - start)
+        callers = threads * CALLER_CALLS * CALLER_BATCH / _run_callers(decoy, card_type, threads)
+        results[f'threads/pool/{threads}'] = _metric(pool, 'codes/s', 'higher')
+        results[f'threads/callers/{threads}'] = _metric(callers, 'codes/s', 'higher')
+        print(f"  {threads:>2} threads: pool {pool:>12,.0f} codes/s, "
+              f"callers {callers:>12,.0f} codes/s", flush=True)
+
+
+class _SimulatedClock:
+    """Clock the timer benchmark moves forward itself, so runs don't sleep."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _run_timers(sessions):
+    """
+    Drive `sessions` store timers for TIMER_SECONDS of simulated time the way
+    the scheduler thread does: run_due(), then skip ahead to the next tick.
+
+    Returns:
+        tuple: (seconds spent in run_due, wake-ups, session ticks)
+    """
+    clock = _SimulatedClock()
+    ticks = [0]
+
+    def on_tick(session):
+        ticks[0] += 1
+
+    manager = TimerManager(on_tick=on_tick, clock=clock)
+    for index in range(sessions):
+        # Started over one second, like calls coming in one after another
+        clock.now = index / sessions
+        manager.add(f'call {index}', 3600)
+    manager.run_due()
+    ticks[0] = 0
+
+    wakeups = 0
+    busy = 0.0
+    end = clock.now + TIMER_SECONDS
+    while clock.now < end:
+        start = time.perf_counter()
+        delay = manager.run_due()
+        busy += time.perf_counter() - start
+        wakeups += 1
+        clock.now += delay
+    return busy, wakeups, ticks[0]
+
+
+def bench_timers(results):
+    """TimerManager heap scheduler: cost per session tick and per wake-up, wake-up rate."""
+    for sessions in TIMER_SESSIONS:
+        gc.collect()
+        busy, wakeups, ticks = _run_timers(sessions)
+        results[f'timers/{sessions}/tick'] = _metric(busy / ticks * 1e9, 'ns', 'lower')
+        results[f'timers/{sessions}/wakeup'] = _metric(busy / wakeups * 1e6, 'us', 'lower')
+        results[f'timers/{sessions}/wakeups'] = _metric(
+            wakeups / TIMER_SECONDS, 'wake-ups/s', 'lower')
+        print(f"  {sessions:>5} timers: {busy / ticks * 1e9:8.0f} ns/tick, "
+              f"{wakeups / TIMER_SECONDS:6.1f} wake-ups/s, "
+              f"{busy / wakeups * 1e6:8.1f} us/wake-up, "
+              f"{busy / TIMER_SECONDS * 100:6.3f}% of a core", flush=True)
+
+
+def bench_cold_start(results, runs):
+    import startup_budget
+
+    startup_budget.import_times()  # warm the bytecode cache
+    bare = startup_budget.median_run_ms([sys.executable, '-c', 'pass'], runs)
+    cli = startup_budget.median_run_ms(
+        [sys.executable, startup_budget.SCRIPT] + startup_budget.CLI_ARGS, runs)
+    imports = startup_budget.import_times().get('decoycards', 0) / 1000
+    results['cold_start/cli'] = _metric(cli, 'ms', 'lower')
+    results['cold_start/overhead'] = _metric(cli - bare, 'ms', 'lower')
+    results['cold_start/import'] = _metric(imports, 'ms', 'lower')
+    print(f"  CLI {cli:.1f} ms (bare python {bare:.1f} ms), "
+          f"import decoycards {imports:.1f} ms", flush=True)
+
+
+def compare(results, baseline, tolerance):
+    """Print a comparison table, returns the names of regressed metrics."""
+    regressions = []
+    print(f"\n{'metric':40} {'baseline':>14} {'current':>14} {'change':>9}")
+    for name, current in results.items():
+        base = baseline.get(name)
+        if not base or not base['value']:
+            continue
+        change = current['value'] / base['value'] - 1
+        worse = -change if current['better'] == 'higher' else change
+        flag = ''
+        if worse > tolerance:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        print(f"{name:40} {base['value']:>14.1f} {current['value']:>14.1f} "
+              f"{change:>+8.0%}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="DecoyCards benchmark suite")
+    parser.add_argument('--sizes', default=None,
+                        help="comma separated batch sizes (default: 1,100,10000,1000000)")
+    parser.add_argument('--full', action='store_true',
+                        help="include 10M-code batches")
+    parser.add_argument('--types', default='all',
+                        help="comma separated card types (default: all)")
+    parser.add_argument('--skip', default='',
+                        help="comma separated sections to skip: "
+                             "generation,memory,calls,threads,timers,cold_start")
+    parser.add_argument('--cold-start-runs', type=int, default=10)
+    parser.add_argument('--out', help="write results JSON here")
+    parser.add_argument('--baseline', help="compare against this results JSON")
+    parser.add_argument('--save-baseline', metavar='PATH',
+                        help="write results JSON as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="allowed slowdown before failing (default: 0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    if args.sizes:
+        sizes = [int(size) for size in args.sizes.split(',')]
+    else:
+        sizes = FULL_SIZES if args.full else DEFAULT_SIZES
+    card_types = list(CARD_TYPES) if args.types == 'all' else args.types.split(',')
+    skip = set(filter(None, args.skip.split(',')))
+
+    decoy = DecoyCards()
+    results = {}
+    if 'generation' not in skip:
+        print("Generation:")
+        bench_generation(decoy, card_types, sizes, results)
+    if 'memory' not in skip:
+        print("Memory:")
+        bench_memory(decoy, card_types, results)
+    if 'calls' not in skip:
+        print("Calls:")
+        bench_helpers(decoy, results)
+    if 'threads' not in skip:
+        print(f"Threads ({card_types[0]}, GIL {'on' if _gil_enabled() else 'off'}):")
+        bench_threads(card_types[0], results)
+    if 'timers' not in skip:
+        print("Timers:")
+        bench_timers(results)
+    if 'cold_start' not in skip:
+        print("Cold start:")
+        bench_cold_start(results, args.cold_start_runs)
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'gil': _gil_enabled(),
+            'numpy': decoycards._numpy() is not None,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+    for path in filter(None, [args.out, args.save_baseline]):
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}")
+            return 1
+        print("\nNo regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
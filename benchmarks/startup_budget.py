@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Startup budget check for the DecoyCards command line.
+
+Scripts call the CLI thousands of times a day, so a one-off generation
+(`gift_card_generator.py --type xbox --count 1`) must stay cheap to start.
+This check fails (exit status 1) when:
+- a module that only the GUI, timers or optional features need gets imported
+- importing decoycards takes longer than IMPORT_BUDGET_MS
+- a whole CLI run costs more than RUN_BUDGET_MS on top of a bare interpreter
+
+Usage:
+    python benchmarks/startup_budget.py [--runs 20]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, 'gift_card_generator.py')
+CLI_ARGS = ['--type', 'xbox', '--count', '1', '--no-header']
+
+# Measured on a single-core container: decoycards ~17 ms cumulative (most of
+# it is `re`, which argparse needs anyway), CLI run ~30 ms over bare Python
+IMPORT_BUDGET_MS = 40
+RUN_BUDGET_MS = 60
+
+# Must never be imported for a plain CLI generation
+FORBIDDEN_MODULES = [
+    'customtkinter', 'tkinter', 'decoy_gui', 'subprocess', 'platform',
+    'playsound3', 'ctypes', 'sqlite3', 'numpy', 'hashlib', 'threading',
+    'concurrent.futures', 'asyncio', 'json', 'csv', 'gzip',
+]
+
+
+def _env():
+    env = dict(os.environ)
+    # Measure with cached bytecode, like a normal installation
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    return env
+
+
+def import_times():
+    """Run the CLI once under -X importtime, returns {module: cumulative_us}."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', SCRIPT] + CLI_ARGS,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+        env=_env(), check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|')
+        try:
+            times[name.strip()] = int(cumulative)
+        except ValueError:
+            continue  # header line
+    return times
+
+
+def median_run_ms(command, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, env=_env(), check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=20,
+                        help="CLI runs to take the median of (default: 20)")
+    args = parser.parse_args(argv)
+
+    # Warm-up run writes the bytecode cache
+    import_times()
+    times = import_times()
+    failures = []
+
+    loaded = [name for name in FORBIDDEN_MODULES if name in times]
+    if loaded:
+        failures.append(f"imported at startup: {', '.join(loaded)}")
+
+    import_ms = times.get('decoycards', 0) / 1000
+    print(f"import decoycards: {import_ms:.1f} ms (budget {IMPORT_BUDGET_MS} ms)")
+    if import_ms > IMPORT_BUDGET_MS:
+        failures.append(f"decoycards import {import_ms:.1f} ms > {IMPORT_BUDGET_MS} ms")
+
+    bare_ms = median_run_ms([sys.executable, '-c', 'pass'], args.runs)
+    cli_ms = median_run_ms([sys.executable, SCRIPT] + CLI_ARGS, args.runs)
+    overhead = cli_ms - bare_ms
+    print(f"CLI run: {cli_ms:.1f} ms, bare python: {bare_ms:.1f} ms, "
+          f"overhead: {overhead:.1f} ms (budget {RUN_BUDGET_MS} ms)")
+    if overhead > RUN_BUDGET_MS:
+        failures.append(f"CLI overhead {overhead:.1f} ms > {RUN_BUDGET_MS} ms")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if not failures:
+        print("OK: startup within budget")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1364 @@
+"""
+DecoyCards GUI - CustomTkinter interface for DecoyCards
+By Baitrix
+
+Imported only when the GUI is launched (--gui or 'G' in the menu), so the
+command line never pays for loading customtkinter.
+"""
+
+import platform
+import subprocess
+
+import customtkinter as ctk
+
+from decoy_timers import DEFAULT_TIMER_STATE_PATH, TimerManager
+from decoycards import (CodeReservoir, DecoyCards, card_menu, discover_plugins,
+                        format_countdown, instrumented, open_default_ledger)
+
+
+# Display text per phase of a store trip: label, label color, status line
+SESSION_PHASE_TEXT = (
+    ("🚗 Going to store...", "#ff9800",
+     "Phase 1: Journey started - Tell the scammer you're heading to the store!"),
+    ("🏠 Returning home...", "#4caf50",
+     "Return journey - Tell the scammer you're coming back!"),
+)
+
+
+class DecoyCardsGUI:
+    """
+    Modern GUI interface for DecoyCards using CustomTkinter.
+    
+    Provides a user-friendly graphical interface with:
+    - Gift card generation with copy-to-clipboard functionality
+    - Visual store timers (one per call, any number at once) with progress
+      bars and dialogs
+    - Dark theme with modern styling
+    - Real-time timer updates and notifications
+    - Cross-platform window management for attention-getting
+    """
+    def __init__(self):
+        # Initialize core components (plugin card types get buttons too)
+        discover_plugins()
+        self.decoy = DecoyCards(ledger=open_default_ledger())
+        # Cards are handed out from ready-made pools so buttons never wait on
+        # generation (the dialogs ask for at most 100 at a time)
+        self.reservoir = CodeReservoir(self.decoy, low=100, high=500).start()
+        
+        # Timer state management: every store trip is a session of one
+        # TimerManager driven by the Tk loop, the big display follows
+        # current_session and the session list shows them all. Sessions are
+        # checkpointed to disk, so a crash or reboot mid-call loses nothing
+        self.timers = TimerManager(on_tick=self.update_timer,
+                                   on_phase_end=self.phase_complete,
+                                   state_path=DEFAULT_TIMER_STATE_PATH)
+        self.current_session = None
+        self.session_rows = {}
+        self.sessions_started = 0
+
+        # Set up modern dark theme
+        ctk.set_appearance_mode("dark")
+        ctk.set_default_color_theme("blue")
+
+        # Create main window
+        self.root = ctk.CTk()
+        self.root.title("DecoyCards - Scambait tool thingie by Baitrix")
+        self.root.geometry("900x650")
+        self.root.resizable(True, True)
+        self.root.minsize(800, 600)
+
+        # Configure grid layout
+        self.root.grid_rowconfigure(0, weight=1)
+        self.root.grid_columnconfigure(0, weight=1)
+
+        self.setup_ui()
+        self.restore_sessions()
+        self.timers.attach(self.root)
+        # Closing the window has to stop the reservoir thread, the timer job
+        # and the ledger too, the CLI menu keeps running after the GUI is gone
+        self.closed = False
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+
+    def setup_ui(self):
+        main_container = ctk.CTkFrame(self.root, corner_radius=10)
+        main_container.grid(row=0, column=0, sticky="nsew", padx=15, pady=15)
+        main_container.grid_rowconfigure(1, weight=1)
+        main_container.grid_columnconfigure(0, weight=1)
+
+        header_frame = ctk.CTkFrame(main_container, height=75, corner_radius=8)
+        header_frame.grid(row=0, column=0, sticky="ew", padx=15, pady=(15, 8))
+        header_frame.grid_propagate(False)
+
+        title_label = ctk.CTkLabel(
+            header_frame,
+            text="DecoyCards",
+            font=ctk.CTkFont(size=28, weight="bold")
+        )
+        title_label.pack(pady=(8, 1))
+
+        subtitle_label = ctk.CTkLabel(
+            header_frame,
+            text="Scambait tool thingie by Baitrix",
+            font=ctk.CTkFont(size=12),
+            text_color="gray70"
+        )
+        subtitle_label.pack()
+
+        warning_label = ctk.CTkLabel(
+            header_frame,
+            text="⚠ FAKE CODES FOR SCAMBAITING ONLY ⚠",
+            font=ctk.CTkFont(size=10, weight="bold"),
+            text_color="#ff6b35"
+        )
+        warning_label.pack(pady=(1, 0))
+
+        self.tabview = ctk.CTkTabview(main_container, corner_radius=8)
+        self.tabview.grid(row=1, column=0, sticky="nsew",
+                          padx=15, pady=(0, 15))
+
+        self.tabview.add("Gift Cards")
+        self.setup_gift_cards_tab()
+
+        self.tabview.add("Store Timer")
+        self.setup_timer_tab()
+
+    def setup_gift_cards_tab(self):
+        tab = self.tabview.tab("Gift Cards")
+        tab.grid_rowconfigure(2, weight=1)
+        tab.grid_columnconfigure(0, weight=1)
+
+        instruction_frame = ctk.CTkFrame(tab, corner_radius=8)
+        instruction_frame.grid(
+            row=0, column=0, sticky="ew", padx=15, pady=(15, 8))
+
+        ctk.CTkLabel(
+            instruction_frame,
+            text="Generate Fake Gift Card Codes",
+            font=ctk.CTkFont(size=18, weight="bold")
+        ).pack(pady=(10, 3))
+
+        ctk.CTkLabel(
+            instruction_frame,
+            text="Select a gift card type below to generate fake codes for scambaiting",
+            font=ctk.CTkFont(size=12),
+            text_color="gray70"
+        ).pack(pady=(0, 10))
+
+        quantity_frame = ctk.CTkFrame(tab, corner_radius=8)
+        quantity_frame.grid(row=1, column=0, sticky="ew", padx=15, pady=8)
+
+        ctk.CTkLabel(
+            quantity_frame,
+            text="Number of cards to generate:",
+            font=ctk.CTkFont(size=14, weight="bold")
+        ).pack(side="left", padx=(15, 8), pady=10)
+
+        self.card_count_var = ctk.StringVar(value="1")
+        self.card_count_entry = ctk.CTkEntry(
+            quantity_frame,
+            textvariable=self.card_count_var,
+            width=80,
+            font=ctk.CTkFont(size=14, weight="bold"),
+            justify="center"
+        )
+        self.card_count_entry.pack(side="left", padx=(0, 15), pady=10)
+
+        cards_frame = ctk.CTkFrame(tab, corner_radius=8)
+        cards_frame.grid(row=2, column=0, sticky="nsew", padx=15, pady=(0, 15))
+
+        for i in range(3):
+            cards_frame.grid_columnconfigure(i, weight=1)
+
+        card_types = [(label, code, color) for code, label, color in card_menu()]
+
+        for i, (name, code, color) in enumerate(card_types):
+            row = i // 3
+            col = i % 3
+
+            btn = ctk.CTkButton(
+                cards_frame,
+                text=name,
+                font=ctk.CTkFont(size=14, weight="bold"),
+                fg_color=color,
+                hover_color=self.adjust_color(color, -20),
+                height=50,
+                width=220,
+                corner_radius=8,
+                command=lambda c=code, n=name: self.generate_main_cards(c, n)
+            )
+            btn.grid(row=row, column=col, padx=10, pady=10, sticky="ew")
+
+    def setup_timer_tab(self):
+        tab = self.tabview.tab("Store Timer")
+        tab.grid_rowconfigure(2, weight=1)
+        tab.grid_columnconfigure(0, weight=1)
+
+        header_frame = ctk.CTkFrame(tab, corner_radius=8)
+        header_frame.grid(row=0, column=0, sticky="ew", padx=15, pady=(15, 5))
+
+        ctk.CTkLabel(
+            header_frame,
+            text="⏰ Store Timer - ⚠️ ROUND TRIP (Going + Returning)",
+            font=ctk.CTkFont(size=16, weight="bold"),
+            text_color="#ff6b35"
+        ).pack(pady=8)
+
+        config_frame = ctk.CTkFrame(tab, corner_radius=8)
+        config_frame.grid(row=1, column=0, sticky="ew", padx=15, pady=5)
+        config_frame.grid_columnconfigure(1, weight=1)
+
+        self.live_calc_frame = ctk.CTkFrame(
+            config_frame, fg_color="#1a4d3a", corner_radius=6)
+        self.live_calc_frame.grid(
+            row=0, column=0, columnspan=3, sticky="ew", padx=10, pady=(8, 6))
+
+        self.live_calc_label = ctk.CTkLabel(
+            self.live_calc_frame,
+            text="📊 Configure settings to see live calculation",
+            font=ctk.CTkFont(size=10, weight="bold"),
+            text_color="#4caf50",
+            wraplength=400
+        )
+        self.live_calc_label.pack(pady=4)
+
+        controls_frame = ctk.CTkFrame(config_frame, fg_color="transparent")
+        controls_frame.grid(row=1, column=0, columnspan=3,
+                            sticky="ew", padx=10, pady=4)
+
+        ctk.CTkLabel(controls_frame, text="Unit:", font=ctk.CTkFont(size=10, weight="bold")).grid(
+            row=0, column=0, sticky="w", padx=(0, 3), pady=2
+        )
+
+        self.unit_var = ctk.StringVar(value="miles")
+        self.unit_menu = ctk.CTkOptionMenu(
+            controls_frame,
+            values=["miles", "km", "manual"],
+            variable=self.unit_var,
+            command=self.on_unit_change,
+            width=80,
+            height=26,
+            font=ctk.CTkFont(size=10)
+        )
+        self.unit_menu.grid(row=1, column=0, padx=(0, 8), pady=2)
+
+        self.distance_label = ctk.CTkLabel(
+            controls_frame, text="Distance:", font=ctk.CTkFont(size=10, weight="bold"))
+        self.distance_label.grid(
+            row=0, column=1, sticky="w", padx=(0, 3), pady=2)
+
+        self.distance_entry = ctk.CTkEntry(
+            controls_frame,
+            placeholder_text="Distance",
+            width=90,
+            height=26,
+            font=ctk.CTkFont(size=10)
+        )
+        self.distance_entry.grid(row=1, column=1, padx=(0, 8), pady=2)
+        self.distance_entry.bind('<KeyRelease>', self.update_live_calculation)
+
+        self.transport_label = ctk.CTkLabel(
+            controls_frame, text="Transport:", font=ctk.CTkFont(size=10, weight="bold"))
+        self.transport_label.grid(
+            row=0, column=2, sticky="w", padx=(0, 3), pady=2)
+
+        self.transport_var = ctk.StringVar(value="walking")
+        self.transport_menu = ctk.CTkOptionMenu(
+            controls_frame,
+            values=["walking", "biking", "car"],
+            variable=self.transport_var,
+            command=self.update_live_calculation,
+            width=90,
+            height=26,
+            font=ctk.CTkFont(size=10)
+        )
+        self.transport_menu.grid(row=1, column=2, padx=(0, 8), pady=2)
+
+        self.manual_label = ctk.CTkLabel(
+            controls_frame, text="Time (min):", font=ctk.CTkFont(size=10, weight="bold"))
+        self.manual_entry = ctk.CTkEntry(
+            controls_frame,
+            placeholder_text="Minutes",
+            width=90,
+            height=26,
+            font=ctk.CTkFont(size=10)
+        )
+        self.manual_entry.bind('<KeyRelease>', self.update_live_calculation)
+
+        ctk.CTkLabel(controls_frame, text="Call name:", font=ctk.CTkFont(size=10, weight="bold")).grid(
+            row=0, column=3, sticky="w", padx=(0, 3), pady=2
+        )
+
+        self.session_name_entry = ctk.CTkEntry(
+            controls_frame,
+            placeholder_text="Call 1",
+            width=110,
+            height=26,
+            font=ctk.CTkFont(size=10)
+        )
+        self.session_name_entry.grid(row=1, column=3, padx=(0, 8), pady=2)
+
+        button_frame = ctk.CTkFrame(config_frame, fg_color="transparent")
+        button_frame.grid(row=2, column=0, columnspan=3, pady=6)
+
+        self.start_btn = ctk.CTkButton(
+            button_frame,
+            text="🚀 START",
+            font=ctk.CTkFont(size=12, weight="bold"),
+            height=32,
+            width=100,
+            corner_radius=6,
+            fg_color="#4caf50",
+            hover_color="#388e3c",
+            command=self.start_timer
+        )
+        self.start_btn.pack(side="left", padx=6)
+
+        self.stop_btn = ctk.CTkButton(
+            button_frame,
+            text="⏹ STOP",
+            font=ctk.CTkFont(size=12, weight="bold"),
+            height=32,
+            width=80,
+            corner_radius=6,
+            fg_color="#f44336",
+            hover_color="#d32f2f",
+            command=self.stop_timer,
+            state="disabled"
+        )
+        self.stop_btn.pack(side="left", padx=6)
+
+        display_frame = ctk.CTkFrame(tab, corner_radius=8)
+        display_frame.grid(row=2, column=0, sticky="nsew",
+                           padx=15, pady=(0, 5))
+        display_frame.grid_rowconfigure(1, weight=1)
+        display_frame.grid_columnconfigure(0, weight=1)
+
+        self.phase_label = ctk.CTkLabel(
+            display_frame,
+            text="⏱️ Ready to Start",
+            font=ctk.CTkFont(size=14, weight="bold"),
+            text_color="gray60"
+        )
+        self.phase_label.grid(row=0, column=0, pady=(8, 2))
+
+        self.time_label = ctk.CTkLabel(
+            display_frame,
+            text="--:--",
+            font=ctk.CTkFont(size=48, weight="bold", family="Consolas"),
+            text_color="#4caf50"
+        )
+        self.time_label.grid(row=1, column=0, pady=3)
+
+        self.progress_bar = ctk.CTkProgressBar(
+            display_frame,
+            width=300,
+            height=10,
+            corner_radius=5,
+            progress_color="#4caf50"
+        )
+        self.progress_bar.grid(row=2, column=0, pady=5, padx=25, sticky="ew")
+        self.progress_bar.set(0)
+
+        self.status_label = ctk.CTkLabel(
+            display_frame,
+            text="Configure settings above and click START to begin",
+            font=ctk.CTkFont(size=11),
+            text_color="gray60",
+            wraplength=350
+        )
+        self.status_label.grid(row=3, column=0, pady=(2, 8))
+
+        # One row per store trip; only rows whose time changed get redrawn
+        self.sessions_frame = ctk.CTkScrollableFrame(
+            tab,
+            label_text="Running calls",
+            height=110,
+            corner_radius=8
+        )
+        self.sessions_frame.grid(row=3, column=0, sticky="ew",
+                                 padx=15, pady=(0, 15))
+        self.sessions_frame.grid_columnconfigure(1, weight=1)
+
+    def adjust_color(self, hex_color, adjustment):
+        """Adjust hex color brightness"""
+        hex_color = hex_color.lstrip('#')
+        rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        rgb = tuple(max(0, min(255, c + adjustment)) for c in rgb)
+        return f"#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}"
+
+    def on_unit_change(self, choice):
+        if choice == "manual":
+            self.distance_label.grid_remove()
+            self.distance_entry.grid_remove()
+            self.transport_label.grid_remove()
+            self.transport_menu.grid_remove()
+
+            self.manual_label.grid(
+                row=0, column=1, sticky="w", padx=(0, 3), pady=2)
+            self.manual_entry.grid(row=1, column=1, padx=(0, 8), pady=2)
+        else:
+            self.manual_label.grid_remove()
+            self.manual_entry.grid_remove()
+
+            self.distance_label.grid(
+                row=0, column=1, sticky="w", padx=(0, 3), pady=2)
+            self.distance_entry.grid(row=1, column=1, padx=(0, 8), pady=2)
+            self.transport_label.grid(
+                row=0, column=2, sticky="w", padx=(0, 3), pady=2)
+            self.transport_menu.grid(row=1, column=2, padx=(0, 8), pady=2)
+
+        self.update_live_calculation()
+
+    def update_live_calculation(self, event=None):
+        """Update the live travel time calculation display"""
+        try:
+            unit = self.unit_var.get()
+
+            if unit == "manual":
+                time_text = self.manual_entry.get().strip()
+                if time_text:
+                    try:
+                        total_minutes = float(time_text)
+                        if total_minutes > 0:
+                            one_way_str = self.decoy.format_time(
+                                int(total_minutes // 60), int(total_minutes % 60), 0)
+                            round_trip_minutes = total_minutes * 2
+                            round_trip_str = self.decoy.format_time(
+                                int(round_trip_minutes // 60), int(round_trip_minutes % 60), 0)
+
+                            calc_text = f"✅ One-way: {one_way_str} | Total round trip: {round_trip_str}\n"
+                            calc_text += f"Phase 1: Going to store ({one_way_str}) + Phase 2: Returning home ({one_way_str})"
+
+                            self.live_calc_label.configure(
+                                text=calc_text,
+                                text_color="#4caf50"
+                            )
+                            return
+                    except ValueError:
+                        pass
+
+                self.live_calc_label.configure(
+                    text="⏳ Enter travel time in minutes to see calculation",
+                    text_color="gray60"
+                )
+            else:
+                distance_text = self.distance_entry.get().strip()
+                transport = self.transport_var.get()
+
+                if distance_text:
+                    try:
+                        distance = float(distance_text)
+                        if distance > 0:
+                            unit_display = unit
+
+                            travel_time = self.decoy.calculate_travel_time(
+                                distance, unit_display, transport)
+                            if travel_time:
+                                hours, minutes, seconds, total_minutes = travel_time
+                                one_way_str = self.decoy.format_time(
+                                    hours, minutes, seconds)
+
+                                round_trip_minutes = total_minutes * 2
+                                round_trip_str = self.decoy.format_time(
+                                    int(round_trip_minutes // 60), int(round_trip_minutes % 60), 0)
+
+                                calc_text = f"✅ {distance} {unit_display} by {transport}\n"
+                                calc_text += f"One-way: {one_way_str} | Total round trip: {round_trip_str}\n"
+                                calc_text += f"Phase 1: Going to store ({one_way_str}) + Phase 2: Returning home ({one_way_str})"
+
+                                self.live_calc_label.configure(
+                                    text=calc_text,
+                                    text_color="#4caf50"
+                                )
+                                return
+                    except ValueError:
+                        pass
+
+                unit_display = unit
+                self.live_calc_label.configure(
+                    text=f"⏳ Enter distance in {unit_display} to see live calculation",
+                    text_color="gray60"
+                )
+
+        except Exception:
+            self.live_calc_label.configure(
+                text="📊 Configure settings below to see live travel time calculation",
+                text_color="gray60"
+            )
+
+    def copy_to_clipboard(self, text):
+        """Copy text to clipboard"""
+        try:
+            self.root.clipboard_clear()
+            self.root.clipboard_append(text)
+            self.root.update()
+        except Exception:
+            pass
+
+    def generate_main_cards(self, card_type, card_name):
+        try:
+            count = int(self.card_count_var.get()
+                        ) if self.card_count_var.get().strip() else 1
+            count = max(1, min(count, 100))
+        except ValueError:
+            count = 1
+
+        cards, card_info = self.reservoir.generate(card_type, count)
+
+        if cards:
+            self.show_main_card_results(card_type, card_name, cards, card_info)
+        else:
+            self.show_error("Card Type Unavailable", card_info)
+
+    def show_main_card_results(self, card_type, card_name, cards, card_info):
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.title(f"{card_name} Cards Generated" if len(
+            cards) > 1 else f"{card_name} Card Generated")
+
+        if len(cards) == 1:
+            dialog.geometry("450x400")
+            height = 400
+        elif len(cards) <= 3:
+            dialog.geometry("450x500")
+            height = 500
+        else:
+            dialog.geometry("450x550")
+            height = 550
+
+        dialog.transient(self.root)
+        dialog.grab_set()
+        dialog.resizable(False, False)
+
+        self.center_window(dialog, 450, height)
+
+        header_text = "🎁 Gift Cards Generated!" if len(
+            cards) > 1 else "🎁 Gift Card Generated!"
+        ctk.CTkLabel(
+            dialog,
+            text=header_text,
+            font=ctk.CTkFont(size=20, weight="bold")
+        ).pack(pady=(15, 8))
+
+        subtitle_text = f"{len(cards)} {card_name} Cards" if len(
+            cards) > 1 else f"{card_name} Card"
+        ctk.CTkLabel(
+            dialog,
+            text=subtitle_text,
+            font=ctk.CTkFont(size=14),
+            text_color="gray70"
+        ).pack()
+
+        cards_frame = ctk.CTkFrame(dialog, corner_radius=8)
+        cards_frame.pack(fill="x", padx=15, pady=15)
+
+        if len(cards) == 1:
+            ctk.CTkLabel(
+                cards_frame,
+                text="Gift Card Code:",
+                font=ctk.CTkFont(size=12, weight="bold")
+            ).pack(pady=(15, 5))
+
+            code_container = ctk.CTkFrame(cards_frame, fg_color="transparent")
+            code_container.pack(fill="x", padx=15, pady=(0, 8))
+
+            code_text = ctk.CTkEntry(
+                code_container,
+                font=ctk.CTkFont(size=14, family="Consolas", weight="bold"),
+                height=35,
+                justify="center"
+            )
+            code_text.pack(side="left", fill="x", expand=True, padx=(0, 8))
+            code_text.insert(0, cards[0])
+            code_text.configure(state="readonly")
+
+            copy_btn = ctk.CTkButton(
+                code_container,
+                text="📋",
+                font=ctk.CTkFont(size=14, weight="bold"),
+                width=40,
+                height=35,
+                fg_color="#4caf50",
+                hover_color="#388e3c",
+                command=lambda: self.copy_to_clipboard(cards[0])
+            )
+            copy_btn.pack(side="right")
+
+        else:
+            ctk.CTkLabel(
+                cards_frame,
+                text="Generated Codes:",
+                font=ctk.CTkFont(size=12, weight="bold")
+            ).pack(pady=(15, 8))
+
+            scrollable_frame = ctk.CTkScrollableFrame(cards_frame, height=200)
+            scrollable_frame.pack(fill="x", padx=15, pady=(0, 8))
+
+            for i, card in enumerate(cards, 1):
+                card_row = ctk.CTkFrame(
+                    scrollable_frame, fg_color="transparent")
+                card_row.pack(fill="x", pady=2)
+
+                ctk.CTkLabel(
+                    card_row,
+                    text=f"{i}.",
+                    font=ctk.CTkFont(size=11, weight="bold"),
+                    width=25
+                ).pack(side="left", padx=(5, 0))
+
+                code_text = ctk.CTkEntry(
+                    card_row,
+                    font=ctk.CTkFont(
+                        size=11, family="Consolas", weight="bold"),
+                    height=30
+                )
+                code_text.pack(side="left", fill="x", expand=True, padx=5)
+                code_text.insert(0, card)
+                code_text.configure(state="readonly")
+
+                copy_btn = ctk.CTkButton(
+                    card_row,
+                    text="📋",
+                    font=ctk.CTkFont(size=10, weight="bold"),
+                    width=30,
+                    height=30,
+                    fg_color="#4caf50",
+                    hover_color="#388e3c",
+                    command=lambda c=card: self.copy_to_clipboard(c)
+                )
+                copy_btn.pack(side="right", padx=(0, 5))
+
+        test_url = card_info.get('test_url')
+        if test_url:
+            ctk.CTkLabel(
+                cards_frame,
+                text=f"Test at: {test_url}",
+                font=ctk.CTkFont(size=10),
+                text_color="gray60"
+            ).pack(pady=(0, 8))
+
+        warning_text = "⚠️ FAKE CODES - Test first to ensure invalid!" if len(
+            cards) > 1 else "⚠️ FAKE CODE - Test first to ensure invalid!"
+        ctk.CTkLabel(
+            cards_frame,
+            text=warning_text,
+            font=ctk.CTkFont(size=10, weight="bold"),
+            text_color="#ff6b35"
+        ).pack(pady=(0, 15))
+
+        ctk.CTkButton(
+            dialog,
+            text="CLOSE",
+            font=ctk.CTkFont(size=12, weight="bold"),
+            height=35,
+            width=100,
+            command=dialog.destroy
+        ).pack(pady=(0, 15))
+
+    def open_card_generator(self, card_type, card_name):
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.title(f"Generate {card_name} Cards")
+        dialog.geometry("550x650")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        dialog.resizable(False, False)
+
+        self.center_window(dialog, 550, 650)
+
+        header_frame = ctk.CTkFrame(dialog, corner_radius=10, height=80)
+        header_frame.pack(fill="x", padx=20, pady=(20, 10))
+        header_frame.pack_propagate(False)
+
+        ctk.CTkLabel(
+            header_frame,
+            text=f"Generate {card_name} Cards",
+            font=ctk.CTkFont(size=24, weight="bold")
+        ).pack(pady=20)
+
+        input_frame = ctk.CTkFrame(dialog, corner_radius=10)
+        input_frame.pack(fill="x", padx=20, pady=10)
+
+        ctk.CTkLabel(
+            input_frame,
+            text="Number of cards to generate:",
+            font=ctk.CTkFont(size=14, weight="bold")
+        ).pack(pady=(20, 5))
+
+        count_entry = ctk.CTkEntry(
+            input_frame,
+            placeholder_text="Enter number (default: 1)",
+            width=200,
+            font=ctk.CTkFont(size=14),
+            justify="center"
+        )
+        count_entry.pack(pady=(0, 20))
+
+        generate_btn = ctk.CTkButton(
+            input_frame,
+            text="GENERATE CARDS",
+            font=ctk.CTkFont(size=16, weight="bold"),
+            height=45,
+            command=lambda: self.generate_cards_gui(
+                card_type, count_entry, result_text)
+        )
+        generate_btn.pack(pady=(0, 20))
+
+        results_frame = ctk.CTkFrame(dialog, corner_radius=10)
+        results_frame.pack(fill="both", expand=True, padx=20, pady=10)
+
+        ctk.CTkLabel(
+            results_frame,
+            text="Generated Cards:",
+            font=ctk.CTkFont(size=16, weight="bold")
+        ).pack(pady=(20, 10))
+
+        result_text = ctk.CTkTextbox(
+            results_frame,
+            height=300,
+            font=ctk.CTkFont(size=12, family="Consolas"),
+            wrap="word"
+        )
+        result_text.pack(fill="both", expand=True, padx=20, pady=(0, 20))
+
+        ctk.CTkButton(
+            dialog,
+            text="CLOSE",
+            font=ctk.CTkFont(size=14, weight="bold"),
+            height=40,
+            width=100,
+            command=dialog.destroy
+        ).pack(pady=(0, 20))
+
+    def generate_cards_gui(self, card_type, count_entry, result_text):
+        try:
+            count = int(count_entry.get()) if count_entry.get().strip() else 1
+            count = max(1, min(count, 100))
+        except ValueError:
+            count = 1
+
+        cards, card_info = self.reservoir.generate(card_type, count)
+
+        if cards:
+            result_text.delete("1.0", "end")
+
+            result_text.insert(
+                "1.0", f"Generated {len(cards)} {card_type.upper()} cards:\n")
+            result_text.insert("end", "=" * 50 + "\n\n")
+
+            for i, card in enumerate(cards, 1):
+                result_text.insert("end", f"{i:2d}. {card}\n")
+
+            result_text.insert("end", "\n" + "=" * 50 + "\n")
+
+            test_url = card_info.get('test_url')
+            if test_url:
+                result_text.insert("end", f"Test at: {test_url}\n")
+
+            result_text.insert(
+                "end", "\nIMPORTANT: Test these codes first to ensure they are invalid!\n")
+            result_text.insert(
+                "end", "These are FAKE codes for scambaiting purposes only.")
+        else:
+            result_text.delete("1.0", "end")
+            result_text.insert("1.0", f"Error: {card_info}")
+
+    def start_timer(self):
+        try:
+            details = {}
+            if self.unit_var.get() == "manual":
+                time_text = self.manual_entry.get().strip()
+                if not time_text:
+                    self.show_error(
+                        "Missing Time", "Please enter travel time in minutes.")
+                    return
+                total_minutes = float(time_text)
+                if total_minutes <= 0:
+                    raise ValueError("Time must be positive")
+            else:
+                distance_text = self.distance_entry.get().strip()
+                if not distance_text:
+                    self.show_error("Missing Distance",
+                                    "Please enter a distance value.")
+                    return
+                distance = float(distance_text)
+                if distance <= 0:
+                    raise ValueError("Distance must be positive")
+
+                unit = self.unit_var.get()
+                transport = self.transport_var.get()
+
+                travel_time = self.decoy.calculate_travel_time(
+                    distance, unit, transport)
+                if not travel_time:
+                    raise ValueError("Could not calculate travel time")
+
+                _, _, _, total_minutes = travel_time
+                details = {'distance': distance, 'unit': unit, 'transport': transport}
+
+        except (ValueError, TypeError) as e:
+            error_msg = str(e) if str(e) != "Time must be positive" and str(
+                e) != "Distance must be positive" else "Please enter valid positive numbers for all fields."
+            self.show_error("Invalid Input", error_msg)
+            return
+
+        name = self.session_name_entry.get().strip() or self.default_session_name()
+        try:
+            session = self.timers.add(name, int(total_minutes * 60), details=details)
+        except ValueError:
+            self.show_error("Name In Use",
+                            f"'{name}' already has a timer running. Pick another call name.")
+            return
+        self.sessions_started += 1
+        self.session_name_entry.delete(0, "end")
+        self.session_name_entry.configure(placeholder_text=self.default_session_name())
+
+        self.add_session_row(session)
+        self.show_session(session)
+
+    def default_session_name(self):
+        number = self.sessions_started + 1
+        while f"Call {number}" in self.timers.sessions:
+            number += 1
+        return f"Call {number}"
+
+    def restore_sessions(self):
+        """Pick the timers of the last run back up, with the time they have left."""
+        restored = self.timers.restore()
+        for session in restored:
+            self.add_session_row(session)
+        if restored:
+            self.show_session(restored[0])
+            self.session_name_entry.configure(placeholder_text=self.default_session_name())
+
+    def show_session(self, session):
+        """Point the big display at one session and show its state."""
+        self.current_session = session
+        self.stop_btn.configure(state="normal" if session.active else "disabled")
+
+        if session.state == 'running':
+            text, color, status = SESSION_PHASE_TEXT[min(session.phase_index, 1)]
+            self.phase_label.configure(text=f"{text} ({session.name})", text_color=color)
+            self.status_label.configure(text=status)
+            self.update_timer(session)
+        elif session.state == 'waiting':
+            self.phase_label.configure(
+                text=f"🏪 At the store ({session.name})", text_color="#ff9800")
+            self.time_label.configure(text=format_countdown(0))
+            self.progress_bar.set(1)
+            self.status_label.configure(
+                text="Start the return trip when the scammer has waited long enough.")
+        elif session.state == 'done':
+            self.phase_label.configure(
+                text=f"✅ Timer Complete! ({session.name})", text_color="#4caf50")
+            self.time_label.configure(text="DONE")
+            self.progress_bar.set(1)
+            self.status_label.configure(
+                text="You can now tell the scammer you're back with the gift card!")
+        else:
+            self.phase_label.configure(
+                text=f"⏸ Timer Stopped ({session.name})", text_color="gray60")
+            self.time_label.configure(text="--:--")
+            self.progress_bar.set(0)
+            self.status_label.configure(
+                text="Timer stopped. Configure settings and click START to begin.")
+
+    @instrumented('update_timer')
+    def update_timer(self, session):
+        # Called by the timer manager only when a session's shown time
+        # changed, so a tick costs one label per session plus the big display
+        row = self.session_rows.get(session.name)
+        if row is not None:
+            row[1].configure(text=session.status())
+        if session is self.current_session:
+            self.time_label.configure(text=format_countdown(session.remaining))
+            self.progress_bar.set(session.timer.progress)
+
+    @instrumented('phase_complete')
+    def phase_complete(self, session):
+        self.decoy.play_sound()
+        self.bring_gui_to_foreground()
+        self.update_session_row(session)
+
+        if session.state == 'waiting':
+            self.show_session(session)
+            self.show_store_reached_dialog(session)
+        else:
+            self.timer_complete(session)
+
+    def start_return_phase(self, session=None):
+        session = session or self.current_session
+        if session is None or session.state != 'waiting':
+            return
+        self.timers.advance(session.name)
+        self.update_session_row(session)
+        self.show_session(session)
+
+    def timer_complete(self, session):
+        self.show_session(session)
+        self.show_completion_dialog()
+
+    # === SESSION LIST ===
+
+    def add_session_row(self, session):
+        old = self.session_rows.pop(session.name, None)
+        if old is not None:
+            old[0].destroy()
+
+        row = ctk.CTkFrame(self.sessions_frame, fg_color="transparent")
+        row.pack(fill="x", pady=1)
+        row.grid_columnconfigure(1, weight=1)
+
+        ctk.CTkButton(
+            row,
+            text=session.name,
+            font=ctk.CTkFont(size=11, weight="bold"),
+            width=110,
+            height=24,
+            fg_color="transparent",
+            border_width=1,
+            command=lambda: self.show_session(session)
+        ).grid(row=0, column=0, padx=(0, 6))
+
+        status_label = ctk.CTkLabel(
+            row,
+            text=session.status(),
+            font=ctk.CTkFont(size=11, family="Consolas"),
+            anchor="w"
+        )
+        status_label.grid(row=0, column=1, sticky="ew")
+
+        next_btn = ctk.CTkButton(
+            row,
+            text="🏠 RETURN",
+            font=ctk.CTkFont(size=10, weight="bold"),
+            width=80,
+            height=24,
+            command=lambda: self.start_return_phase(session),
+            state="disabled"
+        )
+        next_btn.grid(row=0, column=2, padx=3)
+
+        close_btn = ctk.CTkButton(
+            row,
+            text="⏹",
+            font=ctk.CTkFont(size=10, weight="bold"),
+            width=30,
+            height=24,
+            fg_color="#f44336",
+            hover_color="#d32f2f",
+            command=lambda: self.close_session(session)
+        )
+        close_btn.grid(row=0, column=3)
+
+        self.session_rows[session.name] = (row, status_label, next_btn, close_btn)
+        self.update_session_row(session)
+
+    def update_session_row(self, session):
+        """Redraw a session's row after it changed state."""
+        row = self.session_rows.get(session.name)
+        if row is None:
+            return
+        _, status_label, next_btn, close_btn = row
+        status_label.configure(text=session.status())
+        next_btn.configure(state="normal" if session.state == 'waiting' else "disabled")
+        close_btn.configure(text="⏹" if session.active else "✖")
+
+    def close_session(self, session):
+        """Row close button: stops a running session, removes a finished one."""
+        if session.active:
+            self.stop_timer(session)
+            return
+        if self.timers.sessions.get(session.name) is session:
+            self.timers.remove(session.name)
+        row = self.session_rows.pop(session.name, None)
+        if row is not None:
+            row[0].destroy()
+        if session is self.current_session:
+            self.current_session = None
+            self.stop_btn.configure(state="disabled")
+            self.phase_label.configure(text="⏱️ Ready to Start", text_color="gray60")
+            self.time_label.configure(text="--:--")
+            self.progress_bar.set(0)
+            self.status_label.configure(
+                text="Configure settings above and click START to begin")
+
+    def show_store_reached_dialog(self, session=None):
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.title(f"Store Reached! ({session.name})" if session else "Store Reached!")
+        dialog.geometry("380x280")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        dialog.resizable(False, False)
+
+        self.center_window(dialog, 380, 280)
+
+        ctk.CTkLabel(
+            dialog,
+            text="🏪",
+            font=ctk.CTkFont(size=40)
+        ).pack(pady=(15, 8))
+
+        ctk.CTkLabel(
+            dialog,
+            text="Store Reached!",
+            font=ctk.CTkFont(size=20, weight="bold")
+        ).pack(pady=8)
+
+        ctk.CTkLabel(
+            dialog,
+            text="You've reached the store!\nWhat would you like to do next?",
+            font=ctk.CTkFont(size=12),
+            justify="center"
+        ).pack(pady=15)
+
+        button_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        button_frame.pack(pady=15)
+
+        generate_btn = ctk.CTkButton(
+            button_frame,
+            text="🎁 GENERATE GIFT CARD",
+            font=ctk.CTkFont(size=12, weight="bold"),
+            height=40,
+            width=180,
+            fg_color="#4caf50",
+            hover_color="#388e3c",
+            command=lambda: [dialog.destroy(), self.show_gift_card_selection(session)]
+        )
+        generate_btn.pack(pady=4)
+
+        return_btn = ctk.CTkButton(
+            button_frame,
+            text="🏠 START RETURN TRIP",
+            font=ctk.CTkFont(size=12, weight="bold"),
+            height=40,
+            width=180,
+            command=lambda: [dialog.destroy(), self.start_return_phase(session)]
+        )
+        return_btn.pack(pady=4)
+
+    def show_gift_card_selection(self, session=None):
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.title("Select Gift Card Type")
+        dialog.geometry("350x500")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        dialog.resizable(False, False)
+
+        self.center_window(dialog, 350, 500)
+
+        ctk.CTkLabel(
+            dialog,
+            text="🎁 Generate Gift Card",
+            font=ctk.CTkFont(size=20, weight="bold")
+        ).pack(pady=(15, 8))
+
+        ctk.CTkLabel(
+            dialog,
+            text="Select gift card type:",
+            font=ctk.CTkFont(size=12)
+        ).pack(pady=(0, 15))
+
+        cards_frame = ctk.CTkFrame(dialog)
+        cards_frame.pack(fill="both", expand=True, padx=15, pady=10)
+
+        card_types = [(label, code, color) for code, label, color in card_menu()]
+
+        for name, code, color in card_types:
+            btn = ctk.CTkButton(
+                cards_frame,
+                text=name,
+                font=ctk.CTkFont(size=12, weight="bold"),
+                fg_color=color,
+                hover_color=self.adjust_color(color, -20),
+                height=35,
+                width=280,
+                corner_radius=6,
+                command=lambda c=code, n=name: [
+                    dialog.destroy(), self.generate_from_timer(c, n, session)]
+            )
+            btn.pack(pady=3, padx=15)
+
+        ctk.CTkButton(
+            dialog,
+            text="CLOSE",
+            font=ctk.CTkFont(size=12, weight="bold"),
+            height=35,
+            width=80,
+            command=dialog.destroy
+        ).pack(pady=15)
+
+    def generate_from_timer(self, card_type, card_name, session=None):
+        cards, card_info = self.reservoir.generate(card_type, 1)
+
+        if cards:
+            result_dialog = ctk.CTkToplevel(self.root)
+            result_dialog.title(f"{card_name} Card Generated")
+            result_dialog.geometry("450x350")
+            result_dialog.transient(self.root)
+            result_dialog.grab_set()
+            result_dialog.resizable(False, False)
+
+            self.center_window(result_dialog, 450, 350)
+
+            ctk.CTkLabel(
+                result_dialog,
+                text="🎁 Gift Card Generated!",
+                font=ctk.CTkFont(size=20, weight="bold")
+            ).pack(pady=(15, 8))
+
+            ctk.CTkLabel(
+                result_dialog,
+                text=f"{card_name} Gift Card",
+                font=ctk.CTkFont(size=14),
+                text_color="gray70"
+            ).pack()
+
+            card_frame = ctk.CTkFrame(result_dialog, corner_radius=8)
+            card_frame.pack(fill="x", padx=15, pady=15)
+
+            ctk.CTkLabel(
+                card_frame,
+                text="Gift Card Code:",
+                font=ctk.CTkFont(size=12, weight="bold")
+            ).pack(pady=(15, 5))
+
+            code_container = ctk.CTkFrame(card_frame, fg_color="transparent")
+            code_container.pack(fill="x", padx=15, pady=(0, 8))
+
+            code_text = ctk.CTkEntry(
+                code_container,
+                font=ctk.CTkFont(size=14, family="Consolas", weight="bold"),
+                height=35,
+                justify="center"
+            )
+            code_text.pack(side="left", fill="x", expand=True, padx=(0, 8))
+            code_text.insert(0, cards[0])
+            code_text.configure(state="readonly")
+
+            copy_btn = ctk.CTkButton(
+                code_container,
+                text="📋",
+                font=ctk.CTkFont(size=14, weight="bold"),
+                width=40,
+                height=35,
+                fg_color="#4caf50",
+                hover_color="#388e3c",
+                command=lambda: self.copy_to_clipboard(cards[0])
+            )
+            copy_btn.pack(side="right")
+
+            test_url = card_info.get('test_url')
+            if test_url:
+                ctk.CTkLabel(
+                    card_frame,
+                    text=f"Test at: {test_url}",
+                    font=ctk.CTkFont(size=10),
+                    text_color="gray60"
+                ).pack(pady=(0, 8))
+
+            ctk.CTkLabel(
+                card_frame,
+                text="⚠️ FAKE CODE - Test first to ensure it's invalid!",
+                font=ctk.CTkFont(size=10, weight="bold"),
+                text_color="#ff6b35"
+            ).pack(pady=(0, 15))
+
+            button_frame = ctk.CTkFrame(result_dialog, fg_color="transparent")
+            button_frame.pack(pady=15)
+
+            ctk.CTkButton(
+                button_frame,
+                text="🏠 START RETURN",
+                font=ctk.CTkFont(size=12, weight="bold"),
+                height=35,
+                width=140,
+                command=lambda: [
+                    result_dialog.destroy(), self.start_return_phase(session)]
+            ).pack(side="left", padx=8)
+
+            ctk.CTkButton(
+                button_frame,
+                text="🎁 GENERATE ANOTHER",
+                font=ctk.CTkFont(size=12, weight="bold"),
+                height=35,
+                width=160,
+                fg_color="#4caf50",
+                hover_color="#388e3c",
+                command=lambda: [
+                    result_dialog.destroy(), self.show_gift_card_selection(session)]
+            ).pack(side="left", padx=8)
+        else:
+            self.show_error("Card Type Unavailable", card_info)
+
+    def stop_timer(self, session=None):
+        session = session or self.current_session
+        if session is None or not session.active:
+            return
+        self.timers.stop(session.name)
+        self.update_session_row(session)
+        if session is self.current_session:
+            self.show_session(session)
+
+    def show_phase_dialog(self, title, message, button_text, callback):
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.title(title)
+        dialog.geometry("400x250")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        dialog.resizable(False, False)
+
+        self.center_window(dialog, 400, 250)
+
+        ctk.CTkLabel(
+            dialog,
+            text=title,
+            font=ctk.CTkFont(size=24, weight="bold")
+        ).pack(pady=(30, 10))
+
+        ctk.CTkLabel(
+            dialog,
+            text=message,
+            font=ctk.CTkFont(size=14),
+            wraplength=350
+        ).pack(pady=20, padx=20)
+
+        ctk.CTkButton(
+            dialog,
+            text=button_text,
+            font=ctk.CTkFont(size=16, weight="bold"),
+            height=45,
+            width=200,
+            command=lambda: [callback(), dialog.destroy()]
+        ).pack(pady=20)
+
+    def show_completion_dialog(self):
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.title("Timer Complete!")
+        dialog.geometry("450x300")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        dialog.resizable(False, False)
+
+        self.center_window(dialog, 450, 300)
+
+        ctk.CTkLabel(
+            dialog,
+            text="🎉",
+            font=ctk.CTkFont(size=48)
+        ).pack(pady=(30, 10))
+
+        ctk.CTkLabel(
+            dialog,
+            text="Timer Complete!",
+            font=ctk.CTkFont(size=24, weight="bold")
+        ).pack(pady=10)
+
+        ctk.CTkLabel(
+            dialog,
+            text="You can now tell the scammer you're back\nwith the gift card and ready to provide the codes!",
+            font=ctk.CTkFont(size=14),
+            wraplength=400,
+            justify="center"
+        ).pack(pady=20, padx=20)
+
+        ctk.CTkButton(
+            dialog,
+            text="AWESOME!",
+            font=ctk.CTkFont(size=16, weight="bold"),
+            height=45,
+            width=150,
+            command=dialog.destroy
+        ).pack(pady=20)
+
+    def show_error(self, title, message):
+        dialog = ctk.CTkToplevel(self.root)
+        dialog.title(title)
+        dialog.geometry("350x200")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        dialog.resizable(False, False)
+
+        self.center_window(dialog, 350, 200)
+
+        ctk.CTkLabel(
+            dialog,
+            text="⚠️",
+            font=ctk.CTkFont(size=32)
+        ).pack(pady=(20, 10))
+
+        ctk.CTkLabel(
+            dialog,
+            text=title,
+            font=ctk.CTkFont(size=18, weight="bold")
+        ).pack()
+
+        ctk.CTkLabel(
+            dialog,
+            text=message,
+            font=ctk.CTkFont(size=12),
+            wraplength=300
+        ).pack(pady=20, padx=20)
+
+        ctk.CTkButton(
+            dialog,
+            text="OK",
+            command=dialog.destroy
+        ).pack(pady=(0, 20))
+
+    def center_window(self, window, width, height):
+        window.update_idletasks()
+        x = (window.winfo_screenwidth() // 2) - (width // 2)
+        y = (window.winfo_screenheight() // 2) - (height // 2)
+        window.geometry(f"{width}x{height}+{x}+{y}")
+
+    @instrumented('bring_to_foreground', labels=lambda self: (('source', 'gui'),))
+    def bring_gui_to_foreground(self):
+        """Bring the GUI window to the front"""
+        try:
+            self.root.lift()
+            self.root.attributes('-topmost', True)
+            self.root.after(
+                100, lambda: self.root.attributes('-topmost', False))
+            self.root.focus_force()
+
+            system = platform.system().lower()
+            if system == 'windows':
+                try:
+                    import ctypes
+                    from ctypes import wintypes
+
+                    user32 = ctypes.WinDLL('user32', use_last_error=True)
+
+                    hwnd = self.root.winfo_id()
+                    if hwnd:
+                        user32.SetForegroundWindow(hwnd)
+                        user32.ShowWindow(hwnd, 9)
+                except:
+                    pass
+            elif system == 'darwin':
+                subprocess.run(['osascript', '-e', 'tell application "Python" to activate'],
+                               capture_output=True, check=False)
+            elif system == 'linux':
+                try:
+                    subprocess.run(['wmctrl', '-a', self.root.title()],
+                                   capture_output=True, check=False)
+                except:
+                    pass
+        except Exception:
+            pass
+
+    def close(self):
+        """Stop the background work and destroy the window (safe to call twice)."""
+        if self.closed:
+            return
+        self.closed = True
+        self.timers.close()
+        self.reservoir.stop(timeout=1)
+        if self.decoy.ledger is not None:
+            self.decoy.ledger.close()
+        self.root.destroy()
+
+    def run(self):
+        try:
+            self.root.mainloop()
+        finally:
+            self.close()
@@ -0,0 +1,212 @@
+"""
+DecoyCards metrics - counters, gauges and histograms for --stats / --metrics-port
+By Baitrix
+
+The registry behind decoycards.METRICS. Imported only once metrics are
+turned on (--stats, --metrics-port or METRICS.enable()), so normal runs never
+load it; while metrics are off, instrumented calls only check
+METRICS.enabled.
+"""
+
+from bisect import bisect_left
+
+from decoycards import _NO_LOCK, LATENCY_BUCKETS
+
+# HELP lines for the metrics recorded by decoycards, decoy_gui and decoy_timers
+METRIC_HELP = {
+    'generate_seconds': "Time spent in DecoyCards.generate()",
+    'generate_codes_total': "Cards returned by DecoyCards.generate()",
+    'generate_many_seconds': "Time spent in DecoyCards.generate_many()",
+    'generate_many_codes_total': "Cards returned by DecoyCards.generate_many()",
+    'export_seconds': "Time spent in DecoyCards.export()",
+    'export_codes_total': "Cards written by DecoyCards.export()",
+    'countdown_timer_seconds': "Length of command line timer phases",
+    'acountdown_timer_seconds': "Length of async timer phases",
+    'arun_store_timer_seconds': "Length of whole async store timers",
+    'update_timer_seconds': "Time spent in one GUI timer tick",
+    'phase_complete_seconds': "Time spent handling a finished GUI timer phase",
+    'timer_run_due_seconds': "Time spent in one TimerManager scheduler wake-up",
+    'play_sound_seconds': "Time spent playing the notification sound",
+    'bring_to_foreground_seconds': "Time spent raising the window",
+    'timers_active': "Store timers currently running",
+    'reservoir_depth': "Ready-made codes in the reservoir after its last refill",
+    'reservoir_refill_rate': "Codes per second generated by the reservoir refill thread",
+}
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """Upper bucket bound holding the q-quantile (inf past the last bucket)."""
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float('inf')
+
+
+class Metrics:
+    """
+    Registry of counters, gauges and histograms.
+
+    Series are keyed by metric name plus a tuple of (label, value) pairs, e.g.
+    ('generate_codes_total', (('type', 'xbox'),)). Names are exported with a
+    `decoycards_` prefix.
+    """
+
+    PREFIX = 'decoycards_'
+
+    def __init__(self):
+        self.enabled = False
+        self.counters = {}
+        self.gauges = {}
+        self.histograms = {}
+        self.help = {}
+        self.server = None
+        self._lock = None
+
+    def enable(self):
+        """Start recording (threading is only imported once metrics are used)."""
+        import threading
+
+        if self._lock is None:
+            self._lock = threading.Lock()
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        self.counters.clear()
+        self.gauges.clear()
+        self.histograms.clear()
+
+    def inc(self, name, labels=(), value=1):
+        with self._lock:
+            key = (name, labels)
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def set_gauge(self, name, value, labels=()):
+        with self._lock:
+            self.gauges[(name, labels)] = value
+
+    def add_gauge(self, name, value, labels=()):
+        with self._lock:
+            key = (name, labels)
+            self.gauges[key] = self.gauges.get(key, 0) + value
+
+    def observe(self, name, seconds, labels=(), buckets=LATENCY_BUCKETS):
+        with self._lock:
+            key = (name, labels)
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(buckets)
+            histogram.observe(seconds)
+
+    @staticmethod
+    def _labels(labels, extra=()):
+        pairs = tuple(labels) + tuple(extra)
+        if not pairs:
+            return ''
+        body = ','.join('{}="{}"'.format(
+            key, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+            for key, value in pairs)
+        return '{' + body + '}'
+
+    def render(self):
+        """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        with self._lock or _NO_LOCK:
+            for kind, series in (('counter', self.counters), ('gauge', self.gauges)):
+                for name in sorted({name for name, _ in series}):
+                    full = self.PREFIX + name
+                    if name in self.help:
+                        lines.append(f"# HELP {full} {self.help[name]}")
+                    lines.append(f"# TYPE {full} {kind}")
+                    for (other, labels), value in sorted(series.items()):
+                        if other == name:
+                            lines.append(f"{full}{self._labels(labels)} {value}")
+
+            for name in sorted({name for name, _ in self.histograms}):
+                full = self.PREFIX + name
+                if name in self.help:
+                    lines.append(f"# HELP {full} {self.help[name]}")
+                lines.append(f"# TYPE {full} histogram")
+                for (other, labels), histogram in sorted(self.histograms.items()):
+                    if other != name:
+                        continue
+                    cumulative = 0
+                    bounds = [repr(float(b)) for b in histogram.buckets] + ['+Inf']
+                    for bound, count in zip(bounds, histogram.counts):
+                        cumulative += count
+                        lines.append(f"{full}_bucket{self._labels(labels, [('le', bound)])} "
+                                     f"{cumulative}")
+                    lines.append(f"{full}_sum{self._labels(labels)} {histogram.sum!r}")
+                    lines.append(f"{full}_count{self._labels(labels)} {histogram.count}")
+        return '\n'.join(lines) + '\n'
+
+    def summary(self):
+        """Short human-readable report, printed by --stats."""
+        lines = ["DecoyCards stats:"]
+        with self._lock or _NO_LOCK:
+            for (name, labels), value in sorted(self.counters.items()):
+                lines.append(f"  {name}{self._labels(labels)}: {value:,}")
+            for (name, labels), value in sorted(self.gauges.items()):
+                lines.append(f"  {name}{self._labels(labels)}: {value:,}")
+            for (name, labels), histogram in sorted(self.histograms.items()):
+                mean = histogram.sum / histogram.count if histogram.count else 0
+                lines.append(
+                    f"  {name}{self._labels(labels)}: {histogram.count:,} calls, "
+                    f"mean {mean * 1000:.3f} ms, p50 <= {histogram.quantile(0.5) * 1000:g} ms, "
+                    f"p99 <= {histogram.quantile(0.99) * 1000:g} ms")
+        if len(lines) == 1:
+            lines.append("  nothing recorded")
+        return '\n'.join(lines)
+
+    def serve(self, port, host='127.0.0.1'):
+        """
+        Serve render() at http://host:port/metrics from a daemon thread.
+
+        Binds to localhost unless told otherwise. Returns the HTTP server; its
+        server_address holds the real port when port is 0.
+        """
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # keep scrapes out of the terminal
+
+        self.enable()
+        self.server = ThreadingHTTPServer((host, port), MetricsHandler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, name='decoycards-metrics',
+                         daemon=True).start()
+        return self.server
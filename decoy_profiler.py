@@ -0,0 +1,176 @@
+"""
+DecoyCards profiler - cProfile/tracemalloc reports for --profile
+By Baitrix
+
+--profile runs the whole session (batch, menu or GUI) under cProfile and,
+with --profile-memory, tracemalloc. Reports are written on exit and every
+time the process gets SIGUSR1 (Ctrl+Break on Windows), so a sluggish GUI can
+be inspected while it is still running. Each report sums the profile up per
+subsystem using the functions below as entry points, so no code has to be
+changed to see where time and memory go.
+
+Imported only for --profile.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import signal
+import sys
+import time
+import tracemalloc
+from bisect import bisect_left
+
+# Entry-point functions per subsystem (names in the files of PROFILE_FILES).
+# Times are inclusive: a dialog that generates cards also shows that time.
+PROFILE_SUBSYSTEMS = {
+    'generation': (
+        'generate', 'export', 'iter_generate', 'generate_sharded',
+        'generate_xbox', 'generate_psn', 'generate_amazon', 'generate_google_play',
+        'generate_apple', 'generate_steam', 'generate_walmart', 'generate_target',
+        'generate_visa', 'generate_main_cards', 'generate_cards_gui',
+        'generate_from_timer', 'agenerate',
+    ),
+    'dialogs': (
+        'show_main_card_results', 'open_card_generator', 'show_store_reached_dialog',
+        'show_gift_card_selection', 'show_phase_dialog', 'show_completion_dialog',
+        'show_error',
+    ),
+    'timer': (
+        'countdown_timer', 'start_timer', 'update_timer', 'phase_complete',
+        'start_return_phase', 'timer_complete', 'stop_timer',
+        'acountdown_timer', 'arun_store_timer', 'run_due',
+    ),
+    'notifications': (
+        'play_sound', 'bring_to_foreground', 'bring_gui_to_foreground',
+    ),
+}
+PROFILE_FILES = ('decoycards.py', 'decoy_gui.py', 'decoy_timers.py')
+
+
+class SessionProfiler:
+    """
+    cProfile (and optionally tracemalloc) around a whole session.
+
+    Every dump() writes, next to each other in `directory`:
+    - <name>.pstats: cProfile data for pstats / snakeviz
+    - <name>.tracemalloc: tracemalloc snapshot (with memory=True)
+    - <name>.txt: time and live memory per subsystem plus the top functions
+    """
+
+    def __init__(self, directory='.', memory=False, frames=25):
+        self.directory = directory
+        self.memory = memory
+        self.frames = frames
+        self.profile = None
+        self.dumps = 0
+        self.name = f"decoycards-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+
+    def start(self):
+        os.makedirs(self.directory, exist_ok=True)
+        if self.memory:
+            tracemalloc.start(self.frames)
+        self.profile = cProfile.Profile()
+
+        dump_signal = getattr(signal, 'SIGUSR1', None) or getattr(signal, 'SIGBREAK', None)
+        if dump_signal is not None:
+            try:
+                signal.signal(dump_signal, lambda signum, frame: self.dump())
+            except ValueError:
+                pass  # not the main thread, dumps only happen on stop()
+        self.profile.enable()
+        return self
+
+    def stop(self):
+        """Stop profiling and write the final reports, returns their base path."""
+        self.profile.disable()
+        path = self.dump()
+        if self.memory:
+            tracemalloc.stop()
+        return path
+
+    def dump(self):
+        """Write reports for everything recorded so far, profiling goes on."""
+        self.dumps += 1
+        base = os.path.join(self.directory, f"{self.name}-{self.dumps}")
+        self.profile.disable()
+        try:
+            self.profile.dump_stats(base + '.pstats')
+            stats = pstats.Stats(self.profile)
+            snapshot = None
+            if self.memory:
+                snapshot = tracemalloc.take_snapshot()
+                snapshot.dump(base + '.tracemalloc')
+            with open(base + '.txt', 'w') as report:
+                report.write(self.report(stats, snapshot))
+        finally:
+            self.profile.enable()
+        print(f"Profile written to {base}.pstats", file=sys.stderr)
+        return base
+
+    @staticmethod
+    def _subsystem_of(filename, name):
+        for subsystem, names in PROFILE_SUBSYSTEMS.items():
+            if name in names:
+                return subsystem
+        return None
+
+    def report(self, stats, snapshot=None, top=25):
+        """Plain-text summary: per-subsystem time and memory, then hot functions."""
+        subsystems = {subsystem: [0, 0.0, []] for subsystem in PROFILE_SUBSYSTEMS}
+        code_ranges = []
+        for (filename, lineno, name), (_, calls, _, cumulative, _) in stats.stats.items():
+            if os.path.basename(filename) not in PROFILE_FILES:
+                continue
+            subsystem = self._subsystem_of(filename, name)
+            # Every function of ours, so allocations find their enclosing one
+            code_ranges.append((filename, lineno, subsystem))
+            if subsystem is None:
+                continue
+            totals = subsystems[subsystem]
+            totals[0] += calls
+            totals[1] = max(totals[1], cumulative)
+            totals[2].append((cumulative, calls, f"{name}:{lineno}"))
+
+        memory = {}
+        if snapshot is not None:
+            memory = self._memory_by_subsystem(snapshot, code_ranges)
+
+        out = io.StringIO()
+        out.write(f"DecoyCards profile ({time.strftime('%Y-%m-%d %H:%M:%S')})\n\n")
+        out.write("Per subsystem (inclusive time of its busiest entry point):\n")
+        for subsystem, (calls, cumulative, entries) in subsystems.items():
+            line = f"  {subsystem:14} {cumulative:10.3f} s  {calls:8} calls"
+            if snapshot is not None:
+                line += f"  {memory.get(subsystem, 0) / 1024:10.1f} KiB live"
+            out.write(line + "\n")
+            for entry_time, entry_calls, name in sorted(entries, reverse=True)[:5]:
+                out.write(f"      {name:28} {entry_time:10.3f} s  {entry_calls:8} calls\n")
+        out.write(f"\nTop {top} functions by cumulative time:\n")
+        stats.stream = out
+        stats.sort_stats('cumulative').print_stats(top)
+        return out.getvalue()
+
+    @staticmethod
+    def _memory_by_subsystem(snapshot, code_ranges):
+        """Live bytes per subsystem, from the innermost subsystem frame of each trace."""
+        starts = {}
+        for filename, lineno, subsystem in code_ranges:
+            starts.setdefault(filename, []).append((lineno, subsystem or ''))
+        for entries in starts.values():
+            entries.sort()
+
+        memory = {}
+        for trace in snapshot.traces:
+            for frame in trace.traceback:  # innermost first
+                entries = starts.get(frame.filename)
+                if not entries:
+                    continue
+                # Closest function starting at or above the allocating line
+                index = bisect_left(entries, (frame.lineno + 1,)) - 1
+                if index >= 0 and entries[index][1]:
+                    subsystem = entries[index][1]
+                    memory[subsystem] = memory.get(subsystem, 0) + trace.size
+                    break
+        return memory
@@ -0,0 +1,382 @@
+"""
+DecoyCards server - local HTTP/JSON generation service
+By Baitrix
+
+Lets other tools get cards over HTTP instead of starting the script for every
+batch. Imported only for --serve, so the normal command line never loads
+asyncio. Listens on localhost only.
+
+Endpoints (all GET, HEAD works too):
+    /cards                      every card type with its info
+    /cards/<type>               {"type", "info", "count", "cards": [...]}
+        ?count=50               number of cards (default 1)
+        &seed=42                reproducible cards, same as --seed
+        &unique=1               never repeat a card while the server runs
+    /cards/<type>/info          get_card_info() for one type
+    /health                     {"status": "ok"}
+
+Connections are kept alive (HTTP/1.1), small batches come straight from a
+CodeReservoir of ready-made codes when it holds enough, big ones (and any
+that touch the ledger) are generated in a worker pool so the event loop keeps
+answering small requests, and very big ones are streamed with chunked
+transfer encoding so they never sit in memory whole.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from decoycards import (BATCH_CHUNK_SIZE, CARD_TYPES, METRICS, CodeReservoir, DecoyCards,
+                        card_type_error, discover_plugins)
+
+SERVE_HOST = '127.0.0.1'
+SERVE_PORT = 8765
+
+# Batches at least this big are generated in the worker pool
+OFFLOAD_MIN_COUNT = 2000
+# Batches at least this big are streamed chunk by chunk
+STREAM_MIN_COUNT = BATCH_CHUNK_SIZE
+MAX_COUNT = 100_000_000
+
+# Idle keep-alive connections are closed after this many seconds
+KEEPALIVE_TIMEOUT = 15
+MAX_HEADER_SIZE = 16384
+
+REASONS = {
+    200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+    431: 'Request Header Fields Too Large', 500: 'Internal Server Error',
+}
+
+
+class HTTPError(Exception):
+    """Request problem reported to the client as a JSON error."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class StreamAborted(Exception):
+    """A streamed response failed after its headers went out; drop the connection."""
+
+
+class CardServer:
+    """
+    Minimal asyncio HTTP/1.1 server in front of a DecoyCards instance.
+
+    Args:
+        decoy: DecoyCards instance to generate with (its ledger is used too)
+        port: TCP port on 127.0.0.1, 0 picks a free one
+        workers: Threads in the pool that generates big batches
+        reservoir: Started CodeReservoir that serves plain (unseeded,
+                   non-unique) requests up to its high watermark
+    """
+
+    def __init__(self, decoy=None, port=SERVE_PORT, workers=None, reservoir=None):
+        self.decoy = decoy or DecoyCards()
+        self.reservoir = reservoir
+        self.port = port
+        self.pool = ThreadPoolExecutor(max_workers=workers or min(4, os.cpu_count() or 1),
+                                       thread_name_prefix='decoycards-serve')
+        # Unique streams and the ledger keep state between batches: those
+        # requests all go through one thread so they never interleave
+        self.serial = ThreadPoolExecutor(max_workers=1,
+                                         thread_name_prefix='decoycards-serial')
+        self.server = None
+        self.requests = 0
+
+    async def start(self):
+        """Start listening, returns the asyncio server (port 0 resolves here)."""
+        self.server = await asyncio.start_server(
+            self.handle, SERVE_HOST, self.port, limit=MAX_HEADER_SIZE)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.server
+
+    async def serve_forever(self):
+        if self.server is None:
+            await self.start()
+        try:
+            async with self.server:
+                await self.server.serve_forever()
+        finally:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.serial.shutdown(wait=False, cancel_futures=True)
+
+    # === CONNECTIONS ===
+
+    async def handle(self, reader, writer):
+        """Serve requests on one connection until it closes or goes idle."""
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'),
+                                                  KEEPALIVE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError,
+                        ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._send_error(writer, 431, "Request headers too large", False)
+                    break
+
+                try:
+                    method, target, version, headers, length = self._parse_head(head)
+                except HTTPError as e:
+                    await self._send_error(writer, e.status, str(e), False)
+                    break
+
+                # GET requests normally have no body, skip one if sent anyway
+                if length:
+                    await reader.readexactly(length)
+
+                connection = headers.get('connection', '').lower()
+                if version == 'HTTP/1.0':
+                    keep_alive = connection == 'keep-alive'
+                else:
+                    keep_alive = connection != 'close'
+
+                if not await self.respond(writer, method, target, version, keep_alive):
+                    break
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    @staticmethod
+    def _parse_head(head):
+        lines = head.decode('latin-1').split('\r\n')
+        try:
+            method, target, version = lines[0].split(' ')
+        except ValueError:
+            raise HTTPError(400, "Malformed request line")
+        if not version.startswith('HTTP/1.'):
+            raise HTTPError(400, f"Unsupported protocol {version}")
+        headers = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get('content-length') or 0)
+        except ValueError:
+            raise HTTPError(400, "Malformed Content-Length header")
+        if length < 0:
+            raise HTTPError(400, "Malformed Content-Length header")
+        return method, target, version, headers, length
+
+    async def respond(self, writer, method, target, version, keep_alive):
+        """Route one request, returns False when the connection must close."""
+        self.requests += 1
+        start = time.perf_counter()
+        status = 200
+        try:
+            if method not in ('GET', 'HEAD'):
+                raise HTTPError(405, f"Method {method} not allowed, use GET")
+            url = urlsplit(target)
+            parts = [unquote(part) for part in url.path.strip('/').split('/')]
+            query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            head_only = method == 'HEAD'
+
+            if parts == ['health']:
+                await self._send_json(writer, {'status': 'ok'}, keep_alive, head_only)
+            elif parts == ['cards']:
+                body = {}
+                for card_type in list(CARD_TYPES):
+                    info = self.decoy.get_card_info(card_type)
+                    if info:  # a broken plugin gives {} and drops out of CARD_TYPES
+                        body[card_type] = info
+                await self._send_json(writer, body, keep_alive, head_only)
+            elif len(parts) == 3 and parts[0] == 'cards' and parts[2] == 'info':
+                await self._send_json(writer, self._card_info(parts[1]), keep_alive,
+                                      head_only)
+            elif len(parts) == 2 and parts[0] == 'cards':
+                await self._send_cards(writer, parts[1], query, version, keep_alive,
+                                       head_only)
+            else:
+                raise HTTPError(404, f"No such endpoint: {url.path}")
+        except HTTPError as e:
+            status = e.status
+            await self._send_error(writer, e.status, str(e), keep_alive)
+        except StreamAborted:
+            # Part of the response is out already, an error body would
+            # corrupt it: closing the connection tells the client it failed
+            status = 500
+            return False
+        except (ConnectionError, asyncio.CancelledError):
+            raise
+        except Exception as e:
+            status = 500
+            await self._send_error(writer, 500, f"{type(e).__name__}: {e}", False)
+            return False
+        finally:
+            if METRICS.enabled:
+                METRICS.observe('http_request_seconds', time.perf_counter() - start)
+                METRICS.inc('http_requests_total', (('status', status),))
+        return True
+
+    # === ENDPOINTS ===
+
+    def _card_info(self, card_type):
+        error = card_type_error(card_type)
+        if error:
+            raise HTTPError(404, error)
+        return self.decoy.get_card_info(card_type)
+
+    async def _send_cards(self, writer, card_type, query, version, keep_alive, head_only):
+        card_info = self._card_info(card_type)
+        try:
+            count = int(query.get('count', 1))
+        except ValueError:
+            raise HTTPError(400, "count must be a whole number")
+        if not 1 <= count <= MAX_COUNT:
+            raise HTTPError(400, f"count must be between 1 and {MAX_COUNT}")
+        seed = query.get('seed')
+        unique = query.get('unique', '').lower() in ('1', 'true', 'yes')
+
+        stateful = unique or self.decoy.ledger is not None
+        executor = self.serial if stateful else self.pool
+
+        if count >= STREAM_MIN_COUNT and version != 'HTTP/1.0':
+            await self._stream_cards(writer, executor, card_type, card_info, count,
+                                     seed, unique, keep_alive, head_only)
+            return
+
+        loop = asyncio.get_running_loop()
+        reservoir = self.reservoir
+        if reservoir is not None and seed is None and not unique and count <= reservoir.high:
+            if stateful:
+                # take() records the codes in the ledger, off the loop
+                cards = await loop.run_in_executor(executor, reservoir.take, card_type, count)
+            else:
+                # Only what is ready, a short pool falls through to generate()
+                cards = reservoir.take_ready(card_type, count)
+            if cards is not None:
+                body = {'type': card_type, 'info': card_info, 'count': len(cards),
+                        'cards': cards}
+                await self._send_json(writer, body, keep_alive, head_only)
+                return
+
+        call = lambda: self.decoy.generate(card_type, count, seed=seed, unique=unique)
+        if stateful or count >= OFFLOAD_MIN_COUNT:
+            cards, _ = await loop.run_in_executor(executor, call)
+        else:
+            cards, _ = call()
+        body = {'type': card_type, 'info': card_info, 'count': len(cards), 'cards': cards}
+        await self._send_json(writer, body, keep_alive, head_only)
+
+    async def _stream_cards(self, writer, executor, card_type, card_info, count, seed,
+                            unique, keep_alive, head_only):
+        """
+        Send a big batch as a chunked JSON document, one generated chunk at a time.
+
+        The first chunk is made before the headers go out, so bad requests
+        (e.g. an exhausted unique stream) still get a proper error response;
+        a failure after that raises StreamAborted.
+        """
+        if head_only:
+            writer.write(self._head(200, 'application/json', None, keep_alive))
+            await writer.drain()
+            return
+
+        loop = asyncio.get_running_loop()
+        chunks = self.decoy.iter_generate(card_type, count, seed=seed, unique=unique)
+        # Generation and encoding both run in the pool, the loop only writes
+        data = await loop.run_in_executor(executor, _encode_next, chunks, True)
+
+        writer.write(self._head(200, 'application/json', None, keep_alive))
+        prefix = json.dumps({'type': card_type, 'info': card_info, 'count': count})
+        self._write_chunk(writer, (prefix[:-1] + ', "cards": [').encode('utf-8'))
+        try:
+            while data is not None:
+                self._write_chunk(writer, data)
+                await writer.drain()
+                data = await loop.run_in_executor(executor, _encode_next, chunks, False)
+        except (ConnectionError, asyncio.CancelledError):
+            raise
+        except Exception as e:
+            raise StreamAborted(f"{type(e).__name__}: {e}") from e
+        self._write_chunk(writer, b']}')
+        writer.write(b'0\r\n\r\n')
+        await writer.drain()
+
+    # === RESPONSES ===
+
+    @staticmethod
+    def _head(status, content_type, length, keep_alive):
+        lines = [f"HTTP/1.1 {status} {REASONS.get(status, '')}",
+                 f"Content-Type: {content_type}"]
+        if length is None:
+            lines.append("Transfer-Encoding: chunked")
+        else:
+            lines.append(f"Content-Length: {length}")
+        lines.append("Connection: keep-alive" if keep_alive else "Connection: close")
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+    @staticmethod
+    def _write_chunk(writer, data):
+        writer.write(b'%x\r\n%s\r\n' % (len(data), data))
+
+    async def _send_json(self, writer, body, keep_alive, head_only=False, status=200):
+        data = json.dumps(body).encode('utf-8')
+        writer.write(self._head(status, 'application/json', len(data), keep_alive))
+        if not head_only:
+            writer.write(data)
+        await writer.drain()
+
+    async def _send_error(self, writer, status, message, keep_alive):
+        await self._send_json(writer, {'error': message}, keep_alive, status=status)
+
+
+def _encode_next(chunks, first):
+    """Next chunk of cards as JSON array items (worker side), None when done."""
+    codes = next(chunks, None)
+    if codes is None:
+        return None
+    data = json.dumps(codes)[1:-1]
+    return (data if first else ', ' + data).encode('utf-8')
+
+
+def serve(port=SERVE_PORT, ledger=None, workers=None):
+    """
+    Run the card server until Ctrl+C (the --serve command line mode).
+
+    Returns:
+        int: exit status
+    """
+    try:
+        decoy = DecoyCards(ledger=ledger)
+    except Exception as e:
+        print(f"Error: could not open ledger {ledger}: {e}", file=sys.stderr)
+        return 1
+
+    reservoir = CodeReservoir(decoy).start()
+    server = CardServer(decoy, port, workers, reservoir)
+    discover_plugins()
+
+    async def run():
+        await server.start()
+        print(f"DecoyCards server on http://{SERVE_HOST}:{server.port} "
+              f"(try /cards/xbox?count=5), Ctrl+C to stop", file=sys.stderr)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        print(f"Error: could not serve on port {port}: {e}", file=sys.stderr)
+        return 1
+    finally:
+        reservoir.stop()
+        if decoy.ledger is not None:
+            decoy.ledger.close()
+    return 0
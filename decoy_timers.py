@@ -0,0 +1,439 @@
+"""
+DecoyCards timer sessions - many store trips on one scheduler
+By Baitrix
+
+Several store trips at once (one per baiting call): every session's next
+tick sits in one min-heap, and a single driver - a scheduler thread, the Tk
+event loop, or a caller of run_due() - sleeps until the earliest one is due.
+Used by the GUI and by bots that run many calls at once; the command line
+never imports it.
+"""
+
+import heapq
+import json
+import math
+import os
+import threading
+import time
+
+from decoycards import (_NO_LOCK, METRICS, TIMER_CLOCK, PhaseTimer, format_countdown,
+                        instrumented)
+
+STORE_PHASES = ("Going to store", "Returning home")
+# Ticks falling due within this long of each other are handled in one
+# wake-up, so hundreds of sessions don't wake the driver hundreds of times
+# a second (displays may update up to this much late)
+TICK_SLACK = 0.05
+
+DEFAULT_TIMER_STATE_PATH = os.path.join(
+    os.path.expanduser('~'), '.decoycards', 'timers.json')
+TIMER_STATE_VERSION = 1
+
+_timer_now = TIMER_CLOCK or time.monotonic
+
+
+class TimerSession:
+    """
+    One named store trip run by a TimerManager, its phases one after another.
+
+    Attributes:
+        name: Session name, unique within the manager
+        total_seconds: Length of each phase
+        phases: Phase names, STORE_PHASES by default
+        details: Free-form dict for the caller, e.g. distance and transport
+        auto_advance: Start the next phase right away instead of waiting
+                      for TimerManager.advance()
+        phase_index: Index of the current phase
+        state: 'running', 'waiting' (phase over, next one not started),
+               'done' or 'stopped'
+        timer: PhaseTimer of the current phase
+        remaining: Whole seconds left as of the last tick
+        clock: Clock passed on to the PhaseTimers (None: TIMER_CLOCK)
+    """
+    def __init__(self, name, total_seconds, phases=STORE_PHASES, details=None,
+                 auto_advance=False, clock=None):
+        self.name = name
+        self.total_seconds = total_seconds
+        self.phases = tuple(phases)
+        self.details = details or {}
+        self.auto_advance = auto_advance
+        self.phase_index = 0
+        self.state = 'running'
+        self.clock = clock
+        self.timer = PhaseTimer(total_seconds, clock)
+        self.remaining = total_seconds
+        # Bumped on every reschedule, older heap entries are then skipped
+        self.version = 0
+
+    @property
+    def phase(self):
+        return self.phases[self.phase_index]
+
+    @property
+    def active(self):
+        return self.state in ('running', 'waiting')
+
+    def status(self):
+        """Short display text, e.g. 'Going to store 12:30' or 'done'."""
+        if self.state == 'running':
+            return f"{self.phase} {format_countdown(self.remaining)}"
+        if self.state == 'waiting':
+            return f"{self.phase} done"
+        return self.state
+
+    def __repr__(self):
+        return f"TimerSession({self.name!r}, {self.status()!r})"
+
+
+class TimerManager:
+    """
+    Any number of named TimerSessions scheduled on one min-heap.
+
+    Heap entries are (next tick, order, version, session). Nothing runs per
+    session in between: the driver pops what is due, ticks it and pushes it
+    back with its next deadline, so 500 running timers cost a few hundred
+    heap operations a second and no threads of their own. Drive it with
+    start() (one scheduler thread), attach(root) (the Tk event loop) or by
+    calling run_due() yourself.
+
+    Callbacks run on the driving thread, outside the manager's lock, and may
+    call add(), advance() or stop().
+
+    With a state_path, active sessions are checkpointed to that file whenever
+    one starts, changes phase, stops or is removed (never on plain ticks, so
+    a phase costs two or three small writes), and restore() picks them up
+    again after a crash or reboot. Deadlines are saved as wall-clock times,
+    the only clock that carries over a reboot.
+
+    Args:
+        on_tick: on_tick(session) whenever a session's displayed time changes
+        on_phase_end: on_phase_end(session) when a phase runs out; the
+                      session is then 'waiting', 'done', or already running
+                      its next phase with auto_advance
+        state_path: Checkpoint file (e.g. DEFAULT_TIMER_STATE_PATH), None
+                    to keep sessions in memory only
+        clock: Monotonic clock to use instead of TIMER_CLOCK (e.g. for tests)
+    """
+    def __init__(self, on_tick=None, on_phase_end=None, state_path=None, clock=None):
+        self.sessions = {}
+        self.on_tick = on_tick
+        self.on_phase_end = on_phase_end
+        self.state_path = state_path
+        self.clock = clock
+        self._now = clock or _timer_now
+        self._heap = []
+        self._order = 0
+        # Replaced by a threading.Condition when a scheduler thread starts
+        self._lock = _NO_LOCK
+        self._thread = None
+        self._stopped = False
+        self._root = None
+        self._job = None
+
+    def add(self, name, total_seconds, phases=STORE_PHASES, details=None,
+            auto_advance=False):
+        """
+        Start a new session, ticking right away.
+
+        Returns:
+            TimerSession: the new session
+
+        Raises:
+            ValueError: if a session with that name is still active
+        """
+        with self._lock:
+            old = self.sessions.get(name)
+            if old is not None and old.active:
+                raise ValueError(f"Timer session '{name}' is already running")
+            session = self.sessions[name] = TimerSession(
+                name, total_seconds, phases, details, auto_advance, self.clock)
+            self._schedule(session, 0.0)
+        if METRICS.enabled:
+            METRICS.add_gauge('timers_active', 1)
+        self._save()
+        self._wakeup()
+        return session
+
+    def advance(self, name):
+        """Start the next phase of a session that is waiting between phases."""
+        with self._lock:
+            session = self.sessions[name]
+            if session.state != 'waiting':
+                return session
+            self._next_phase(session)
+        self._save()
+        self._wakeup()
+        return session
+
+    def stop(self, name):
+        """Stop a session early; it stays listed as 'stopped' until remove()."""
+        with self._lock:
+            session = self.sessions[name]
+            was_active = session.active
+            if was_active:
+                session.state = 'stopped'
+                session.version += 1
+        if was_active:
+            if METRICS.enabled:
+                METRICS.add_gauge('timers_active', -1)
+            self._save()
+        return session
+
+    def remove(self, name):
+        """Forget a session, stopping it first if it is still active."""
+        # Only active sessions are checkpointed, and stop() already saved
+        # without this one, so removing never needs a write of its own
+        if self.sessions[name].active:
+            self.stop(name)
+        with self._lock:
+            return self.sessions.pop(name)
+
+    def active(self):
+        """Sessions that are running or waiting between phases."""
+        with self._lock:
+            return [session for session in self.sessions.values() if session.active]
+
+    @instrumented('timer_run_due')
+    def run_due(self):
+        """
+        Tick every session whose next tick is due and fire the callbacks.
+
+        on_tick comes first, so a phase's final 0 is always shown; phases
+        that ran out then end (or move on with auto_advance) and fire
+        on_phase_end. A session stopped from on_tick doesn't end its phase.
+
+        Returns:
+            float: seconds until the next tick is due, None if none is scheduled
+        """
+        ticked = []
+        ended = []
+        with self._lock:
+            heap = self._heap
+            now = self._now()
+            while heap and heap[0][0] <= now:
+                _, _, version, session = heapq.heappop(heap)
+                if version != session.version or session.state != 'running':
+                    continue
+                remaining, changed = session.timer.tick()
+                session.remaining = remaining
+                if changed:
+                    ticked.append(session)
+                delay = session.timer.delay()
+                if delay is None:
+                    ended.append((session, session.version))
+                else:
+                    self._schedule(session, delay)
+            delay = self._until_next()
+
+        if self.on_tick is not None:
+            for session in ticked:
+                self.on_tick(session)
+        if ended:
+            with self._lock:
+                # Skip sessions stopped (or restarted) by an on_tick callback
+                ended = [session for session, version in ended
+                         if session.version == version and session.state == 'running']
+                for session in ended:
+                    self._end_phase(session)
+                delay = self._until_next()
+            if ended:
+                self._save()
+        for session in ended:
+            if session.state == 'done' and METRICS.enabled:
+                METRICS.add_gauge('timers_active', -1)
+            if self.on_phase_end is not None:
+                self.on_phase_end(session)
+        return delay
+
+    # --- checkpoints ---
+
+    def _save(self):
+        """Write the active sessions to state_path, atomically."""
+        if not self.state_path:
+            return
+        # Under the lock, so two threads never interleave their writes
+        with self._lock:
+            sessions = []
+            for session in self.sessions.values():
+                if not session.active:
+                    continue
+                sessions.append({
+                    'name': session.name,
+                    'total_seconds': session.total_seconds,
+                    'phases': list(session.phases),
+                    'phase_index': session.phase_index,
+                    'state': session.state,
+                    'wall_deadline': (session.timer.wall_deadline
+                                      if session.state == 'running' else None),
+                    'details': session.details,
+                    'auto_advance': session.auto_advance,
+                })
+            state = {'version': TIMER_STATE_VERSION, 'saved_at': time.time(),
+                     'sessions': sessions}
+            tmp_path = self.state_path + '.tmp'
+            try:
+                os.makedirs(os.path.dirname(self.state_path) or '.', exist_ok=True)
+                with open(tmp_path, 'w') as f:
+                    json.dump(state, f, indent=1)
+                    f.flush()
+                    # On disk before the rename, or a crash could leave an empty file
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.state_path)
+            except OSError:
+                pass  # timers keep running, only the checkpoint is missing
+
+    def restore(self):
+        """
+        Bring back the sessions saved in state_path, with the time they have
+        left now. A phase that ran out while nothing was running ends on the
+        next tick (sound, dialog), or with auto_advance its later phases are
+        caught up too.
+
+        Returns:
+            list: the restored TimerSessions (empty if there was nothing to
+                  restore or the file is unreadable)
+        """
+        if not self.state_path:
+            return []
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+            if state.get('version') != TIMER_STATE_VERSION:
+                return []
+            saved = state['sessions']
+        except (OSError, ValueError, KeyError, AttributeError):
+            return []
+
+        restored = []
+        now = time.time()
+        with self._lock:
+            for entry in saved:
+                try:
+                    session = self._restore_session(entry, now)
+                except (KeyError, TypeError, ValueError, IndexError):
+                    continue  # skip a damaged entry, keep the rest
+                if session is not None:
+                    restored.append(session)
+        if restored:
+            if METRICS.enabled:
+                METRICS.add_gauge('timers_active', len(restored))
+            self._wakeup()
+        return restored
+
+    def _restore_session(self, entry, now):
+        name = entry['name']
+        old = self.sessions.get(name)
+        if old is not None and old.active:
+            return None
+        session = TimerSession(name, entry['total_seconds'], entry['phases'],
+                               entry.get('details'), entry.get('auto_advance', False),
+                               self.clock)
+        session.phase_index = int(entry['phase_index'])
+        if not 0 <= session.phase_index < len(session.phases):
+            raise ValueError(session.phase_index)
+        if entry['state'] == 'waiting':
+            session.state = 'waiting'
+        elif entry['state'] == 'running':
+            left = float(entry['wall_deadline']) - now
+            while (left <= 0 and session.auto_advance
+                   and session.phase_index + 1 < len(session.phases)):
+                session.phase_index += 1
+                left += session.total_seconds
+            session.timer = PhaseTimer(session.total_seconds, self.clock, left=left)
+            session.remaining = math.ceil(session.timer.remaining())
+        else:
+            raise ValueError(entry['state'])
+        self.sessions[name] = session
+        if session.state == 'running':
+            self._schedule(session, 0.0)
+        return session
+
+    def _schedule(self, session, delay):
+        session.version += 1
+        self._order += 1
+        heapq.heappush(self._heap, (self._now() + delay, self._order,
+                                    session.version, session))
+
+    def _end_phase(self, session):
+        if session.phase_index + 1 >= len(session.phases):
+            session.state = 'done'
+        elif session.auto_advance:
+            self._next_phase(session)
+        else:
+            session.state = 'waiting'
+
+    def _next_phase(self, session):
+        session.phase_index += 1
+        session.state = 'running'
+        session.timer = PhaseTimer(session.total_seconds, session.clock)
+        session.remaining = session.total_seconds
+        self._schedule(session, 0.0)
+
+    def _until_next(self):
+        """Seconds to sleep before the next run_due() (call with the lock held)."""
+        heap = self._heap
+        # Drop entries of stopped or rescheduled sessions off the top
+        while heap and heap[0][2] != heap[0][3].version:
+            heapq.heappop(heap)
+        if not heap:
+            return None
+        return max(0.0, heap[0][0] - self._now()) + TICK_SLACK
+
+    # --- drivers ---
+
+    def start(self):
+        """Drive the sessions from one daemon scheduler thread, returns self."""
+        self._lock = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name='decoycards-timers',
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while True:
+            self.run_due()
+            with self._lock:
+                if self._stopped:
+                    return
+                # Computed under the lock, so an add() can't slip in unnoticed
+                self._lock.wait(self._until_next())
+
+    def attach(self, root):
+        """Drive the sessions from a Tk event loop with root.after(), returns self."""
+        self._root = root
+        self._tk_step()
+        return self
+
+    def _tk_step(self):
+        self._job = None
+        self.run_due()
+        self._tk_schedule()
+
+    def _tk_schedule(self):
+        if self._job is not None:
+            self._root.after_cancel(self._job)
+            self._job = None
+        delay = self._until_next()
+        if delay is not None and not self._stopped:
+            self._job = self._root.after(max(1, math.ceil(delay * 1000)), self._tk_step)
+
+    def _wakeup(self):
+        """Let the driver know the earliest deadline may have moved up."""
+        if self._thread is not None:
+            with self._lock:
+                self._lock.notify()
+        elif self._root is not None:
+            self._tk_schedule()
+
+    def close(self):
+        """Stop the driver (sessions keep their state)."""
+        self._stopped = True
+        if self._thread is not None:
+            with self._lock:
+                self._lock.notify()
+            self._thread.join(timeout=1)
+            self._thread = None
+        if self._root is not None and self._job is not None:
+            self._root.after_cancel(self._job)
+            self._job = None
@@ -0,0 +1,3434 @@
+"""
+DecoyCards - Fake Gift Card Generator for Scambaiting
+By Baitrix
+
+Core of DecoyCards: fake gift card generation, the store timer helpers and
+the command line. The GUI lives in decoy_gui.py and gift_card_generator.py is
+the script you run. Parts only some runs need have their own modules,
+imported when first used: decoy_server.py (--serve), decoy_timers.py (many
+timers at once, the GUI), decoy_metrics.py (--stats / --metrics-port) and
+decoy_profiler.py (--profile).
+
+Only cheap modules are imported here so one-off command line runs start
+fast; heavier ones (customtkinter, subprocess, platform, sqlite3, hashlib,
+playsound3, ctypes, ...) are imported where they are first needed.
+
+IMPORTANT: These are FAKE codes for scambaiting purposes only!
+Always test codes first to confirm they are invalid.
+"""
+
+import functools
+import math
+import string
+import os
+import time
+import sys
+from array import array
+from collections.abc import Mapping, Sequence
+from importlib.util import find_spec
+
+# Check for the GUI library without importing it (that alone takes longer
+# than generating a batch of codes)
+GUI_AVAILABLE = find_spec('customtkinter') is not None
+
+
+# === BATCH ENGINE ===
+# Codes are built a whole batch at a time instead of one character at a time:
+# random bytes are pulled in bulk, rejection-sampled so every symbol is equally
+# likely, mapped through precomputed byte tables and written column by column
+# into a preallocated buffer that is finally split into individual codes.
+
+# Number of codes assembled per buffer, keeps memory flat for huge counts
+BATCH_CHUNK_SIZE = 1 << 16
+# Rows filled per step in array mode, bounds the temporary random matrices
+ARRAY_CHUNK_SIZE = 1 << 20
+# Up to this many codes (per alphabet in the layout) a batch is cheaper to
+# build with %-formatting than with one slice assignment per column
+FORMAT_MAX_CODES = 16
+
+
+class AlphabetTable:
+    """
+    Precomputed lookup tables for drawing symbols uniformly from an alphabet.
+
+    Symbols are equal-width ASCII strings (single characters for code segments,
+    or e.g. '01'..'12' for an expiry month). A random byte b is accepted when
+    b < limit, where limit is the largest multiple of the alphabet size that
+    fits in a byte, so b % size is unbiased. Each output column gets its own
+    256-byte translation table, which lets bytes.translate() do the mapping in C.
+    """
+    def __init__(self, symbols):
+        self.symbols = tuple(symbols)
+        size = len(self.symbols)
+        if not 0 < size <= 256:
+            raise ValueError("Alphabet must have between 1 and 256 symbols")
+        self.width = len(self.symbols[0])
+        if any(len(s) != self.width for s in self.symbols):
+            raise ValueError("Alphabet symbols must all have the same width")
+        if not self.width or any(not s.isascii() or '\n' in s for s in self.symbols):
+            raise ValueError("Alphabet symbols must be non-empty ASCII without newlines")
+
+        self.size = size
+        self.limit = 256 - 256 % size
+        self.reject = bytes(range(self.limit, 256))
+        self.columns = [
+            bytes(ord(self.symbols[b % size][col]) if b < self.limit else 0
+                  for b in range(256))
+            for col in range(self.width)
+        ]
+
+    def sample(self, count, randbytes):
+        """Return `count` accepted random bytes (each below self.limit)."""
+        parts = []
+        have = 0
+        while have < count:
+            need = count - have
+            # Ask for enough bytes to cover the expected rejections in one go
+            raw = randbytes(need * 256 // self.limit + 16)
+            accepted = raw.translate(None, self.reject)
+            parts.append(accepted)
+            have += len(accepted)
+        data = b''.join(parts)
+        return data[:count] if len(data) > count else data
+
+
+class SeededStream:
+    """
+    Reproducible drop-in for os.urandom in the batch engine.
+
+    Every call returns SHAKE-256 output keyed by (seed, stream id, call
+    counter), so the bytes are fully determined by the seed and streams with
+    different ids never share output. Instances are picklable and can be
+    handed to worker processes.
+    """
+    def __init__(self, seed, stream=0):
+        self.seed = seed
+        self.stream = stream
+        self.counter = 0
+        self._key = _sha256(str(seed).encode('utf-8'))
+
+    def __call__(self, size):
+        import hashlib
+
+        message = self._key + self.stream.to_bytes(8, 'little') + \
+            self.counter.to_bytes(8, 'little')
+        self.counter += 1
+        return hashlib.shake_256(message).digest(size)
+
+
+class EntropyBuffer:
+    """
+    Drop-in for os.urandom that hands out slices of one bulk read.
+
+    Lets several layouts draw from a single buffer in turn, so a mixed batch
+    costs one read from the source instead of one per alphabet group and
+    card type. Runs past the end refill from the source in blocks of at least
+    the initial size.
+    """
+    def __init__(self, size, source=os.urandom):
+        self.source = source
+        self.block = max(size, 64)
+        self.buffer = source(self.block)
+        self.offset = 0
+
+    def __call__(self, size):
+        start = self.offset
+        end = start + size
+        if end > len(self.buffer):
+            self.buffer = self.buffer[start:] + self.source(max(self.block, size))
+            start, end = 0, size
+        self.offset = end
+        return self.buffer[start:end]
+
+
+class CodeLayout:
+    """
+    Fixed-width code layout assembled in bulk.
+
+    A layout is a list of fields: plain strings are copied literally, and
+    AlphabetTable fields are filled with one random symbol each. Every code in
+    a batch occupies one newline-terminated row of a preallocated buffer, so
+    each random column is written with a single strided slice assignment.
+    """
+    def __init__(self, fields):
+        row = bytearray()
+        groups = {}
+        pieces = []
+        slots = []
+        for field in fields:
+            if isinstance(field, AlphabetTable):
+                groups.setdefault(id(field), (field, []))[1].append(len(row))
+                slots.append((len(pieces), len(row), field))
+                pieces.append(None)
+                row += b'?' * field.width
+            else:
+                pieces.append(field)
+                row += field.encode('ascii')
+        self.pattern = None
+        self.width = len(row)
+        self.row = bytes(row) + b'\n'
+        self.groups = list(groups.values())
+
+        # Expected random bytes per code, including rejected ones
+        self._entropy = sum(len(offsets) * 256 / table.limit for table, offsets in self.groups)
+        # Small batches can instead be rendered with "%c" placeholders, see
+        # _format_batch(); symbols containing '%' would be re-read as one
+        self.formattable = not any('%' in symbol for table, _ in self.groups
+                                   for symbol in table.symbols)
+
+        # Every code is also a mixed-radix number with one digit per random
+        # field, which lets uniqueness mode walk the code space by index
+        self._pieces = pieces
+        self._slots = slots
+        self.space = 1
+        for _, _, table in slots:
+            self.space *= table.size
+
+    def generate(self, count, randbytes=os.urandom):
+        """Generate `count` codes as a list of strings."""
+        codes = []
+        for chunk in self.iter_chunks(count, randbytes=randbytes):
+            codes.extend(chunk)
+        return codes
+
+    def iter_chunks(self, count=None, chunk_size=BATCH_CHUNK_SIZE,
+                    randbytes=os.urandom):
+        """
+        Lazily yield lists of up to `chunk_size` codes.
+
+        Only one chunk is alive at a time, so memory stays flat no matter how
+        many codes are produced. With count=None the stream never ends.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        remaining = count
+        while remaining is None or remaining > 0:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            yield self._assemble(size, randbytes)
+            if remaining is not None:
+                remaining -= size
+
+    def generate_rows(self, count, randbytes=os.urandom):
+        """Generate `count` codes as newline-terminated ASCII rows in one bytes object."""
+        return b''.join(self.iter_rows(count, randbytes=randbytes))
+
+    def iter_rows(self, count=None, chunk_size=BATCH_CHUNK_SIZE, randbytes=os.urandom):
+        """Like iter_chunks(), but yields raw newline-terminated row buffers."""
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        remaining = count
+        while remaining is None or remaining > 0:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            yield bytes(self._fill(size, randbytes))
+            if remaining is not None:
+                remaining -= size
+
+    def generate_array(self, count, randbytes=os.urandom):
+        """
+        Generate `count` codes as a NumPy fixed-width byte array (dtype S<width>).
+
+        Separators are broadcast from the row template and every random column
+        is filled by indexing the alphabet lookup tables with a matrix of
+        random bytes, so no per-code Python objects are created. Without NumPy
+        installed this falls back to a plain list of bytes codes.
+        """
+        np = _numpy()
+        if np is None:
+            codes = []
+            for start in range(0, count, BATCH_CHUNK_SIZE):
+                rows = self._fill(min(BATCH_CHUNK_SIZE, count - start), randbytes)
+                codes.extend(bytes(rows).split(b'\n')[:-1])
+            return codes
+
+        out = np.empty((count, self.width), dtype=np.uint8)
+        out[:] = np.frombuffer(self.row, dtype=np.uint8)[:-1]
+        for start in range(0, count, ARRAY_CHUNK_SIZE):
+            rows = out[start:start + ARRAY_CHUNK_SIZE]
+            for table, offsets in self.groups:
+                fields = len(offsets)
+                picks = np.frombuffer(
+                    table.sample(len(rows) * fields, randbytes),
+                    dtype=np.uint8).reshape(len(rows), fields)
+                columns = np.asarray(offsets)
+                for col, column_table in enumerate(table.columns):
+                    lookup = np.frombuffer(column_table, dtype=np.uint8)
+                    rows[:, columns + col] = lookup[picks]
+        return out.view(f'S{self.width}').reshape(count)
+
+    def entropy_size(self, count):
+        """Random bytes _fill(count) asks for up front (rejections rarely need more)."""
+        return int(count * self._entropy) + 16 * len(self.groups)
+
+    def _fill(self, count, randbytes):
+        """Fill a newline-separated row buffer with `count` random codes."""
+        samples = [table.sample(count * len(offsets), randbytes)
+                   for table, offsets in self.groups]
+        return self._place(count, samples)
+
+    def _place(self, count, samples):
+        """
+        Write accepted bytes into a row buffer. samples[g] holds the picks for
+        group g, code-major: code j, field i is samples[g][j * fields + i].
+        """
+        stride = len(self.row)
+        out = bytearray(self.row * count)
+        for (table, offsets), accepted in zip(self.groups, samples):
+            fields = len(offsets)
+            for i, offset in enumerate(offsets):
+                picks = accepted[i::fields]
+                for col, column_table in enumerate(table.columns):
+                    out[offset + col::stride] = picks.translate(column_table)
+        return out
+
+    def codes_at(self, key, indices):
+        """
+        Compute the codes at the given positions of a counter-based sequence.
+
+        Code n only depends on (key, n): each alphabet group takes its picks
+        from SHAKE-256(key, n, group), so any code can be produced directly
+        without generating the ones before it.
+        """
+        import hashlib
+
+        samples = []
+        for group, (table, offsets) in enumerate(self.groups):
+            need = len(offsets)
+            parts = []
+            for index in indices:
+                message = key + index.to_bytes(8, 'little') + bytes((group,))
+                size = need * 2 + 8
+                while True:
+                    accepted = hashlib.shake_256(message).digest(size).translate(
+                        None, table.reject)
+                    if len(accepted) >= need:
+                        break
+                    size *= 2
+                parts.append(accepted[:need])
+            samples.append(b''.join(parts))
+        codes = self._place(len(indices), samples).decode('ascii').split('\n')
+        codes.pop()
+        return codes
+
+    def codes_for_numbers(self, numbers):
+        """Map integers in [0, space) to their codes (mixed radix, last field fastest)."""
+        codes = []
+        slots = self._slots[::-1]
+        for number in numbers:
+            pieces = self._pieces[:]
+            for piece, _, table in slots:
+                number, digit = divmod(number, table.size)
+                pieces[piece] = table.symbols[digit]
+            codes.append(''.join(pieces))
+        return codes
+
+    def number_for_code(self, code):
+        """Inverse of codes_for_numbers; raises ValueError for foreign codes."""
+        if len(code) != self.width:
+            raise ValueError(f"Code {code!r} does not match this layout")
+        number = 0
+        for _, offset, table in self._slots:
+            try:
+                digit = table.symbols.index(code[offset:offset + table.width])
+            except ValueError:
+                raise ValueError(f"Code {code!r} does not match this layout")
+            number = number * table.size + digit
+        return number
+
+    def formats(self, count):
+        """True when _format_batch() is the cheaper way to build `count` codes."""
+        return self.formattable and count * len(self.groups) <= FORMAT_MAX_CODES
+
+    def format_row(self, stages):
+        """
+        Row template for _format_batch(), where alphabet table T is filled in
+        formatting pass stages[T]: its placeholders carry 2**stages[T] percent
+        signs, so every earlier pass turns them into the next level down.
+        """
+        literal = '%' * (1 << len(stages))
+        parts = []
+        slots = iter(self._slots)
+        for piece in self._pieces:
+            if piece is None:
+                table = next(slots)[2]
+                parts.append(('%' * (1 << stages[table]) + 'c') * table.width)
+            else:
+                parts.append(piece.replace('%', literal))
+        return ''.join(parts) + '\n'
+
+    def _assemble(self, count, randbytes):
+        if self.formats(count):
+            return _format_batch([(self, count)], randbytes)[0]
+        codes = self._fill(count, randbytes).decode('ascii').split('\n')
+        codes.pop()
+        return codes
+
+
+@functools.lru_cache(maxsize=256)
+def _format_plan(layouts):
+    """
+    Work out how _format_batch() renders a tuple of layouts.
+
+    Layouts using the same set of alphabets share one text, so e.g. all
+    letters-and-digits layouts are filled in a single pass.
+
+    Returns:
+        list: (layout_indices, draws, rows) per text, where draws lists
+              (table, [(layout_index, fields)]) in formatting pass order
+    """
+    texts = {}
+    for index, layout in enumerate(layouts):
+        key = frozenset(id(table) for table, _ in layout.groups)
+        texts.setdefault(key, []).append(index)
+
+    plan = []
+    for indices in texts.values():
+        draws = {}
+        for index in indices:
+            for table, offsets in layouts[index].groups:
+                draws.setdefault(table, []).append((index, len(offsets)))
+        # A single layout draws in the order of its groups, like _fill(). In
+        # shared texts the alphabets with the most fields go first, as
+        # placeholders of later passes are re-read by every pass before them
+        if len(indices) > 1:
+            draws = dict(sorted(draws.items(), reverse=True,
+                                key=lambda item: sum(fields for _, fields in item[1])))
+        stages = {table: stage for stage, table in enumerate(draws)}
+        rows = [layouts[index].format_row(stages) for index in indices]
+        plan.append((indices, list(draws.items()), rows))
+    return plan
+
+
+def _format_batch(batches, randbytes):
+    """
+    Build small batches of codes for several layouts with %-formatting.
+
+    Fixed-width columns cost one slice assignment each no matter how few codes
+    there are, so tiny batches are rendered from row templates instead: one
+    formatting pass per alphabet over the text, taking that alphabet's picks
+    in order. Layouts sharing a text take their picks from one sample per
+    alphabet, so a mixed batch costs a handful of draws rather than one per
+    group and layout. A single layout gets the same codes as from _fill()
+    for the same random bytes.
+
+    Args:
+        batches: list of (layout, count) pairs of formattable layouts
+        randbytes: os.urandom compatible byte source
+
+    Returns:
+        list: one list of codes per batch
+    """
+    counts = [count for _, count in batches]
+    groups = [None] * len(batches)
+    for indices, draws, rows in _format_plan(tuple(layout for layout, _ in batches)):
+        text = ''.join([row * counts[index] for row, index in zip(rows, indices)])
+        for table, users in draws:
+            size = sum(counts[index] * fields for index, fields in users)
+            picks = table.sample(size, randbytes)
+            if table.width == 1:
+                symbols = picks.translate(table.columns[0])
+            else:
+                symbols = bytearray(size * table.width)
+                for col, column_table in enumerate(table.columns):
+                    symbols[col::table.width] = picks.translate(column_table)
+            text %= tuple(symbols)
+        codes = text.split('\n')
+        start = 0
+        for index in indices:
+            groups[index] = codes[start:start + counts[index]]
+            start += counts[index]
+    return groups
+
+
+_np = None
+
+
+def _numpy():
+    """Import NumPy on first use, returning None when it is not installed."""
+    global _np
+    if _np is None:
+        try:
+            import numpy
+            _np = numpy
+        except ImportError:
+            _np = False
+    return _np or None
+
+
+def _sha256(data):
+    """SHA-256 digest, importing hashlib (and OpenSSL) only when needed."""
+    import hashlib
+
+    return hashlib.sha256(data).digest()
+
+
+def _bytes_array(codes, width):
+    """Convert string codes to what generate_array() returns."""
+    codes = [code.encode('ascii') for code in codes]
+    np = _numpy()
+    if np is None:
+        return codes
+    return np.array(codes, dtype=f'S{width}')
+
+
+# === FORMAT TEMPLATES ===
+# Card formats are written as templates and compiled once into a CodeLayout:
+#   A          one character from A-Z and 0-9
+#   D          one digit
+#   {name}     one symbol from the named alphabet, {name:N} for N of them
+#   \x         the literal character x
+# Anything else is copied literally, e.g. "Card: DDDD-DDDD | PIN: DDDD".
+
+ALPHABETS = {
+    'alnum': string.ascii_uppercase + string.digits,
+    'digit': string.digits,
+    # Apple excludes confusing letters (no O, U, I, L, Z)
+    'apple': '0123456789ABCDEFGHJKMNPQRSTVWXY',
+    'month': ['%02d' % m for m in range(1, 13)],
+    'year': ['25', '26', '27', '28', '29'],
+}
+
+_TEMPLATE_SHORTHAND = {'A': 'alnum', 'D': 'digit'}
+
+_alphabet_tables = {}
+_compiled_templates = {}
+
+
+def _alphabet_table(symbols):
+    """Return the shared AlphabetTable for a sequence of symbols."""
+    key = tuple(symbols)
+    table = _alphabet_tables.get(key)
+    if table is None:
+        table = _alphabet_tables[key] = AlphabetTable(key)
+    return table
+
+
+def _parse_template(pattern, alphabets):
+    """Turn a template string into CodeLayout fields."""
+    fields = []
+    literal = []
+
+    def table_for(name):
+        if name not in alphabets:
+            raise ValueError(f"Unknown alphabet '{name}' in template {pattern!r}")
+        return _alphabet_table(alphabets[name])
+
+    def flush():
+        if literal:
+            fields.append(''.join(literal))
+            del literal[:]
+
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == '\\':
+            if i + 1 >= len(pattern):
+                raise ValueError(f"Dangling escape in template {pattern!r}")
+            literal.append(pattern[i + 1])
+            i += 2
+            continue
+        if ch == '{':
+            end = pattern.find('}', i)
+            if end < 0:
+                raise ValueError(f"Unclosed '{{' in template {pattern!r}")
+            name, _, repeat = pattern[i + 1:end].partition(':')
+            try:
+                repeat = int(repeat) if repeat else 1
+            except ValueError:
+                raise ValueError(f"Bad repeat count in template {pattern!r}")
+            flush()
+            fields.extend([table_for(name.strip())] * repeat)
+            i = end + 1
+            continue
+        if ch in _TEMPLATE_SHORTHAND:
+            flush()
+            fields.append(table_for(_TEMPLATE_SHORTHAND[ch]))
+        else:
+            if ch == '\n' or not ch.isascii():
+                raise ValueError(f"Unsupported character {ch!r} in template {pattern!r}")
+            literal.append(ch)
+        i += 1
+    flush()
+    return fields
+
+
+def compile_template(pattern, alphabets=None):
+    """
+    Compile a format template into a cached CodeLayout.
+
+    Args:
+        pattern: Template string, e.g. "AAAAA-AAAAA-AAAAA" or "X{apple:15}"
+        alphabets: Optional dict of extra/overriding named alphabets
+
+    Returns:
+        CodeLayout: shared compiled layout for this template
+    """
+    if alphabets:
+        key = (pattern, tuple(sorted((name, tuple(symbols))
+                                     for name, symbols in alphabets.items())))
+    else:
+        key = (pattern, None)
+
+    layout = _compiled_templates.get(key)
+    if layout is None:
+        merged = dict(ALPHABETS, **alphabets) if alphabets else ALPHABETS
+        layout = CodeLayout(_parse_template(pattern, merged))
+        layout.pattern = pattern
+        _compiled_templates[key] = layout
+    return layout
+
+
+# Metadata and template for every card type. 'fields' optionally names runs
+# of random symbols (in template order) for Card records, by default they
+# all form one 'symbols' field ('code' is taken: it is the formatted code on
+# every record, as in csv/jsonl exports). 'label' and 'color' are used for the menu
+# entries and GUI buttons. Plugins add their types here too, see below.
+CARD_TYPES = {
+    'xbox': {
+        'name': 'Xbox Live Gift Card',
+        'format': 'XXXXX-XXXXX-XXXXX-XXXXX-XXXXX',
+        'template': 'AAAAA-AAAAA-AAAAA-AAAAA-AAAAA',
+        'test_url': 'https://www.xbox.com/en-US/redeem',
+        'label': 'Xbox Live',
+        'color': '#107c10'
+    },
+    'psn': {
+        'name': 'PlayStation Network Gift Card',
+        'format': 'XXXX-XXXX-XXXX',
+        'template': 'AAAA-AAAA-AAAA',
+        'test_url': None,
+        'label': 'PlayStation',
+        'color': '#003791'
+    },
+    'amazon': {
+        'name': 'Amazon Gift Card',
+        'format': 'XXXX-XXXXXX-XXXXX',
+        'template': 'AAAA-AAAAAA-AAAAA',
+        'test_url': 'https://www.amazon.com/gc/redeem',
+        'label': 'Amazon',
+        'color': '#ff9900'
+    },
+    'google-play': {
+        'name': 'Google Play Gift Card',
+        'format': 'XXXXXXX-XXXXXXX-XXXXX',
+        'template': 'AAAAAAA-AAAAAAA-AAAAA',
+        'test_url': None,
+        'label': 'Google Play',
+        'color': '#34a853'
+    },
+    'apple': {
+        'name': 'Apple/iTunes Gift Card',
+        'format': 'X + 15 alphanumeric characters (no O, U, I, L, Z)',
+        'template': 'X{apple:15}',
+        'test_url': None,
+        'label': 'Apple iTunes',
+        'color': '#000000'
+    },
+    'steam': {
+        'name': 'Steam Wallet Code',
+        'format': 'XXXXX-XXXXX-XXXXX',
+        'template': 'AAAAA-AAAAA-AAAAA',
+        'test_url': 'https://store.steampowered.com/account/redeemwalletcode',
+        'label': 'Steam',
+        'color': '#1b2838'
+    },
+    'walmart': {
+        'name': 'Walmart Gift Card',
+        'format': '16-digit card + 4-digit PIN',
+        'template': 'Card: DDDD-DDDD-DDDD-DDDD | PIN: DDDD',
+        'fields': (('number', 16), ('pin', 4)),
+        'test_url': None,
+        'label': 'Walmart',
+        'color': '#0071ce'
+    },
+    'target': {
+        'name': 'Target Gift Card',
+        'format': '15-digit card + 4-digit PIN',
+        'template': 'Card: {digit:15} | PIN: DDDD',
+        'fields': (('number', 15), ('pin', 4)),
+        'test_url': None,
+        'label': 'Target',
+        'color': '#cc0000'
+    },
+    'visa': {
+        'name': 'Visa Gift Card',
+        'format': '16-digit + expiry + CVV + claim code',
+        'template': ('Card: DDDD-DDDD-DDDD-DDDD | Exp: {month}/{year} '
+                     '| CVV: DDD | Claim: AAAAAAAA'),
+        'fields': (('number', 16), ('exp_month', 1), ('exp_year', 1),
+                   ('cvv', 3), ('claim', 8)),
+        'test_url': None,
+        'label': 'Visa Gift Card',
+        'color': '#1a1f71'
+    }
+}
+_BUILTIN_CARD_TYPES = frozenset(CARD_TYPES)
+
+
+# === CARD TYPE REGISTRY ===
+# CARD_TYPES is the one registry of card types: the menu, the GUI buttons,
+# the command line and the server all list it. Third-party types come from
+# plugins, either
+# - an installed package with an entry point in the 'decoycards.card_types'
+#   group (entry point name = card type, object = its CARD_TYPES-style dict
+#   or a function returning one), or
+# - a <card_type>.py file in DEFAULT_PLUGIN_DIR that defines CARD_TYPE = {...}
+# discover_plugins() only registers their names; a plugin module is imported
+# the first time its type is actually used.
+
+PLUGIN_ENTRY_POINT_GROUP = 'decoycards.card_types'
+DEFAULT_PLUGIN_DIR = os.path.join(os.path.expanduser('~'), '.decoycards', 'plugins')
+DEFAULT_CARD_COLOR = '#3b3b3b'
+
+
+def _card_type_entry(card_type, entry):
+    """Check a card type definition and fill in the optional keys."""
+    if not isinstance(entry, Mapping) or 'template' not in entry:
+        raise ValueError(f"card type '{card_type}' needs a dict with a 'template'")
+    entry = dict(entry)
+    # Raises ValueError for a bad template or alphabet
+    compile_template(entry['template'], entry.get('alphabets'))
+    if any(name == 'code' for name, _ in entry.get('fields') or ()):
+        raise ValueError(f"card type '{card_type}': field name 'code' is reserved "
+                         f"for the formatted code")
+    label = entry.get('label') or entry.get('name') or card_type.replace('-', ' ').title()
+    entry.setdefault('name', f"{label} Gift Card")
+    entry.setdefault('format', entry['template'])
+    entry.setdefault('test_url', None)
+    entry.setdefault('label', label)
+    entry.setdefault('color', DEFAULT_CARD_COLOR)
+    return entry
+
+
+class PluginCardType(Mapping):
+    """
+    CARD_TYPES entry of a plugin that hasn't been imported yet.
+
+    Behaves like the plugin's dict; the first key access imports the plugin,
+    and the loaded dict then replaces this placeholder in CARD_TYPES.
+    """
+
+    def __init__(self, card_type, loader, source):
+        self.card_type = card_type
+        self.loader = loader
+        self.source = source
+        self.label = card_type.replace('-', ' ').title()
+        self.entry = None
+
+    def load(self):
+        if self.entry is None:
+            try:
+                entry = self.loader()
+                if callable(entry):
+                    entry = entry()
+                self.entry = _card_type_entry(self.card_type, entry)
+            except Exception as e:
+                if CARD_TYPES.get(self.card_type) is self:
+                    del CARD_TYPES[self.card_type]
+                message = (f"Card type plugin '{self.card_type}' "
+                           f"({self.source}) failed to load: {e}")
+                PLUGIN_ERRORS[self.card_type] = message
+                raise ValueError(message) from e
+            if CARD_TYPES.get(self.card_type) is self:
+                CARD_TYPES[self.card_type] = self.entry
+        return self.entry
+
+    def __getitem__(self, key):
+        return self.load()[key]
+
+    def __iter__(self):
+        return iter(self.load())
+
+    def __len__(self):
+        return len(self.load())
+
+    def __repr__(self):
+        return f"PluginCardType({self.card_type!r}, source={self.source!r})"
+
+
+def _load_plugin_file(path):
+    import importlib.util
+
+    name = 'decoycards_plugin_' + os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module.CARD_TYPE
+
+
+def register_card_type(card_type, entry, replace=False):
+    """
+    Add a card type to the registry (for code that builds types at runtime).
+
+    Args:
+        card_type: Key used everywhere, e.g. 'ebay' (--type ebay)
+        entry: Dict with at least 'template'; name, format, test_url, label,
+               color and fields are optional, as in CARD_TYPES
+        replace: Allow replacing an existing type
+
+    Raises:
+        ValueError: for a bad definition or an existing type without replace
+    """
+    if card_type in CARD_TYPES and not replace:
+        raise ValueError(f"Card type '{card_type}' already exists")
+    CARD_TYPES[card_type] = _card_type_entry(card_type, entry)
+    CARD_LAYOUTS.pop(card_type, None)
+
+
+_plugins_discovered = False
+# Why a plugin type is gone: {card_type: load error message}
+PLUGIN_ERRORS = {}
+
+
+def discover_plugins(plugin_dir=None):
+    """
+    Register (without importing) the plugin card types that are installed,
+    and load the card type config files in DEFAULT_CARD_CONFIGS.
+
+    Built-in types always win over a plugin of the same name. Runs once per
+    process unless a plugin_dir is given.
+
+    Args:
+        plugin_dir: Directory of <card_type>.py plugins (default: DEFAULT_PLUGIN_DIR)
+
+    Returns:
+        list: card types that were added
+    """
+    global _plugins_discovered
+    added = []
+    if plugin_dir is None:
+        if _plugins_discovered:
+            return []
+        _plugins_discovered = True
+        plugin_dir = DEFAULT_PLUGIN_DIR
+
+        for path in DEFAULT_CARD_CONFIGS:
+            if os.path.exists(path):
+                try:
+                    added.extend(load_card_config(path))
+                except (ValueError, OSError) as e:
+                    print(f"Warning: skipping card types in {path}: {e}", file=sys.stderr)
+
+    try:
+        names = sorted(os.listdir(plugin_dir))
+    except OSError:
+        names = []
+    for filename in names:
+        if not filename.endswith('.py') or filename.startswith('_'):
+            continue
+        card_type = filename[:-3].replace('_', '-')
+        if card_type not in CARD_TYPES:
+            path = os.path.join(plugin_dir, filename)
+            CARD_TYPES[card_type] = PluginCardType(
+                card_type, functools.partial(_load_plugin_file, path), path)
+            added.append(card_type)
+
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        return added  # Python 3.7: plugin directory only
+    try:
+        found = entry_points(group=PLUGIN_ENTRY_POINT_GROUP)
+    except TypeError:
+        found = entry_points().get(PLUGIN_ENTRY_POINT_GROUP, [])  # Python 3.8/3.9
+    for entry_point in found:
+        if entry_point.name not in CARD_TYPES:
+            CARD_TYPES[entry_point.name] = PluginCardType(
+                entry_point.name, entry_point.load, entry_point.value)
+            added.append(entry_point.name)
+    return added
+
+
+def known_card_type(card_type):
+    """
+    True for a built-in or plugin card type (looks for plugins on a miss).
+
+    A plugin is imported here, and one that fails to load counts as unknown
+    (card_type_error() says why).
+    """
+    return card_type_error(card_type) is None
+
+
+def card_type_error(card_type):
+    """
+    Check that a card type can be used, importing its plugin if needed.
+
+    Returns:
+        str: why it can't be used (unknown type, plugin failed to load), or
+             None when it can
+    """
+    if CARD_CONFIGS:
+        check_card_configs()
+    if card_type not in CARD_TYPES:
+        discover_plugins()
+    entry = CARD_TYPES.get(card_type)
+    if isinstance(entry, PluginCardType):
+        try:
+            entry.load()
+        except ValueError as e:
+            return str(e)
+    elif entry is None:
+        if card_type in PLUGIN_ERRORS:
+            return PLUGIN_ERRORS[card_type]
+        return f"Invalid card type. Available: {', '.join(CARD_TYPES)}"
+    return None
+
+
+def card_menu():
+    """
+    (card_type, label, color) for every registered type, in registry order.
+
+    Used for the command line menu and the GUI buttons; plugins are not
+    imported for this.
+    """
+    menu = []
+    for card_type, entry in CARD_TYPES.items():
+        if isinstance(entry, PluginCardType) and entry.entry is None:
+            menu.append((card_type, entry.label, DEFAULT_CARD_COLOR))
+        else:
+            menu.append((card_type, entry.get('label') or entry['name'],
+                         entry.get('color') or DEFAULT_CARD_COLOR))
+    return menu
+
+
+class _LayoutTable(dict):
+    """card type -> compiled CodeLayout, each filled in on first use."""
+
+    def __missing__(self, card_type):
+        entry = CARD_TYPES[card_type]
+        layout = self[card_type] = compile_template(entry['template'], entry.get('alphabets'))
+        return layout
+
+
+# Dispatch table: generating for a type is one lookup here
+CARD_LAYOUTS = _LayoutTable()
+
+
+# === CARD TYPE CONFIG ===
+# Card types can also be defined in a JSON or TOML file, no code needed:
+#
+#   [alphabets]                         # optional, shared by all types below
+#   hex = "0123456789ABCDEF"
+#
+#   [card_types.xbox-uk]
+#   name = "Xbox Live Gift Card (UK)"
+#   template = "AAAAA-AAAAA-AAAAA-AAAAA-AAAAA"
+#   test_url = "https://www.xbox.com/en-GB/redeem"
+#   alphabets = { vowel = "AEIOU" }     # optional, for this type only
+#
+# (the JSON form has the same "alphabets" / "card_types" objects). The
+# files in DEFAULT_CARD_CONFIGS are loaded with the plugins; more can be
+# given with --card-types. Compiled layouts are pickled under
+# CARD_CONFIG_CACHE_DIR keyed by the file's hash, and a file whose mtime
+# changes is reloaded on the next generate() (checked at most once per
+# CARD_CONFIG_CHECK_INTERVAL seconds).
+
+DEFAULT_CARD_CONFIGS = [
+    os.path.join(os.path.expanduser('~'), '.decoycards', 'card_types.toml'),
+    os.path.join(os.path.expanduser('~'), '.decoycards', 'card_types.json'),
+]
+CARD_CONFIG_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.decoycards', 'cache')
+CARD_CONFIG_CHECK_INTERVAL = 1.0
+# Bump when CodeLayout changes shape so old pickles are ignored
+CARD_CONFIG_CACHE_VERSION = 1
+
+# Loaded config files by path, see check_card_configs()
+CARD_CONFIGS = {}
+_next_config_check = 0.0
+
+
+class CardTypeConfig:
+    """
+    One card type config file and the types it registered.
+
+    Args:
+        path: .json or .toml file
+        cache_dir: Where compiled layouts are cached (None: no cache)
+    """
+
+    def __init__(self, path, cache_dir=CARD_CONFIG_CACHE_DIR):
+        self.path = os.path.abspath(path)
+        self.cache_dir = cache_dir
+        self.mtime = None
+        self.digest = None
+        self.card_types = []
+        self.from_cache = False
+
+    def load(self):
+        """(Re)load the file and register its types, returns their names."""
+        mtime = os.stat(self.path).st_mtime_ns
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        digest = _sha256(data + f"\0{CARD_CONFIG_CACHE_VERSION}\0{sys.version}".encode()).hex()
+        self.mtime = mtime
+        if digest == self.digest:
+            return self.card_types  # touched, not changed
+
+        compiled = self._read_cache(digest)
+        self.from_cache = compiled is not None
+        if compiled is None:
+            compiled = self._compile(self._parse(data))
+            self._write_cache(digest, compiled)
+
+        for card_type in self.card_types:
+            if card_type not in compiled and CARD_TYPES.get(card_type) is not None:
+                del CARD_TYPES[card_type]
+                CARD_LAYOUTS.pop(card_type, None)
+        for card_type, (entry, layout) in compiled.items():
+            CARD_TYPES[card_type] = entry
+            CARD_LAYOUTS[card_type] = layout
+        self.card_types = list(compiled)
+        self.digest = digest
+        return self.card_types
+
+    def changed(self):
+        try:
+            return os.stat(self.path).st_mtime_ns != self.mtime
+        except OSError:
+            return False  # deleted or unreadable: keep what we have
+
+    def _parse(self, data):
+        if self.path.endswith('.toml'):
+            try:
+                import tomllib
+            except ImportError:
+                try:
+                    import tomli as tomllib
+                except ImportError:
+                    raise ValueError("TOML card type files need Python 3.11+ or "
+                                     "'pip install tomli' (or use JSON)")
+            try:
+                return tomllib.loads(data.decode('utf-8'))
+            except tomllib.TOMLDecodeError as e:
+                raise ValueError(f"{self.path}: {e}")
+        import json
+
+        try:
+            return json.loads(data)
+        except ValueError as e:
+            raise ValueError(f"{self.path}: {e}")
+
+    def _compile(self, config):
+        if not isinstance(config, dict) or not isinstance(config.get('card_types'), dict):
+            raise ValueError(f"{self.path}: expected a 'card_types' table")
+        shared = config.get('alphabets') or {}
+        compiled = {}
+        for card_type, definition in config['card_types'].items():
+            entry = CARD_TYPES.get(card_type)
+            if card_type in _BUILTIN_CARD_TYPES or (
+                    entry is not None and card_type not in self.card_types and
+                    not isinstance(entry, PluginCardType)):
+                raise ValueError(f"{self.path}: card type '{card_type}' already exists")
+            if not isinstance(definition, dict):
+                raise ValueError(f"{self.path}: card type '{card_type}' must be a table")
+            definition = dict(definition)
+            alphabets = dict(shared, **(definition.get('alphabets') or {}))
+            if alphabets:
+                definition['alphabets'] = alphabets
+            if 'fields' in definition:
+                definition['fields'] = tuple(tuple(field) for field in definition['fields'])
+            try:
+                entry = _card_type_entry(card_type, definition)
+            except (ValueError, TypeError) as e:
+                raise ValueError(f"{self.path}: {e}")
+            compiled[card_type] = (entry, compile_template(entry['template'], alphabets))
+        return compiled
+
+    def _cache_path(self, digest):
+        return os.path.join(self.cache_dir, f"card_types-{digest}.pickle")
+
+    def _read_cache(self, digest):
+        if not self.cache_dir:
+            return None
+        import pickle
+
+        try:
+            with open(self._cache_path(digest), 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            return None  # missing or stale, compile instead
+
+    def _write_cache(self, digest, compiled):
+        if not self.cache_dir:
+            return
+        import pickle
+
+        path = self._cache_path(digest)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(path + '.tmp', 'wb') as f:
+                pickle.dump(compiled, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(path + '.tmp', path)
+        except OSError:
+            pass  # the cache is only a speed-up
+
+
+def load_card_config(path, cache_dir=CARD_CONFIG_CACHE_DIR):
+    """
+    Load card types from a JSON/TOML file and keep watching it for changes.
+
+    Returns:
+        list: card types defined by the file
+
+    Raises:
+        ValueError: for a malformed file or definition
+        OSError: if the file can't be read
+    """
+    path = os.path.abspath(path)
+    config = CARD_CONFIGS.get(path)
+    if config is None:
+        config = CardTypeConfig(path, cache_dir)
+    card_types = config.load()
+    CARD_CONFIGS[path] = config
+    return card_types
+
+
+def check_card_configs(force=False):
+    """
+    Reload config files whose mtime changed (at most once per interval).
+
+    A broken edit keeps the previous definitions and is reported on stderr.
+    """
+    global _next_config_check
+    now = time.monotonic()
+    if not force and now < _next_config_check:
+        return
+    _next_config_check = now + CARD_CONFIG_CHECK_INTERVAL
+    for config in list(CARD_CONFIGS.values()):
+        if config.changed():
+            try:
+                config.load()
+            except (ValueError, OSError) as e:
+                print(f"Warning: could not reload card types: {e}", file=sys.stderr)
+
+
+class CodeSequence(Sequence):
+    """
+    Lazy, random-access sequence of seeded codes.
+
+    Nothing is generated up front: seq[n] is computed in O(1) from the seed,
+    the card template and n, so any previously handed-out code can be
+    regenerated on demand instead of being stored. Supports len(), negative
+    indexing and slicing (slices are lazy sequences too).
+    """
+    def __init__(self, layout, seed, indices):
+        self.layout = layout
+        self.seed = seed
+        self._indices = indices
+        self._key = _sha256(f"{seed}\0{layout.pattern}".encode('utf-8'))
+
+    def __len__(self):
+        return len(self._indices)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return CodeSequence(self.layout, self.seed, self._indices[item])
+        return self.layout.codes_at(self._key, (self._indices[item],))[0]
+
+    def __iter__(self):
+        for start in range(0, len(self._indices), BATCH_CHUNK_SIZE):
+            yield from self.layout.codes_at(
+                self._key, self._indices[start:start + BATCH_CHUNK_SIZE])
+
+    def __repr__(self):
+        return (f"CodeSequence(pattern={self.layout.pattern!r}, seed={self.seed!r}, "
+                f"indices={self._indices!r})")
+
+
+# === CARD RECORDS ===
+# Instead of one formatted string per card, a CardBatch keeps each named field
+# in a packed column (integers in array.array, text as fixed-width bytes) and
+# only builds records or display strings when they are accessed.
+
+
+class CardField:
+    """One named run of random symbols in a layout, with its packed storage type."""
+    def __init__(self, name, slots):
+        self.name = name
+        # (piece index, row offset, table) of every random field it covers
+        self.slots = slots
+        self.positions = [offset + col for _, offset, table in slots
+                          for col in range(table.width)]
+        self.chars = len(self.positions)
+        self.numeric = all(symbol.isdigit() for _, _, table in slots
+                           for symbol in table.symbols)
+        self.typecode = None
+        if self.numeric:
+            largest = 10 ** self.chars - 1
+            for typecode in 'BHILQ':
+                if largest < 1 << (8 * array(typecode).itemsize):
+                    self.typecode = typecode
+                    break
+
+    def pack(self, rows, stride, count):
+        """Extract this field for `count` rows into its packed column."""
+        chars = self.chars
+        sep = 1 if self.typecode else 0
+        buf = bytearray(count * (chars + sep))
+        for i, position in enumerate(self.positions):
+            buf[i::chars + sep] = rows[position::stride]
+        if not self.typecode:
+            return bytes(buf)
+
+        np = _numpy()
+        if np is not None and count:
+            # Vectorized digits -> integers
+            digits = np.frombuffer(buf, dtype=np.uint8).reshape(count, chars + 1)
+            values = (digits[:, :chars] - 48).astype(np.uint64) @ \
+                10 ** np.arange(chars - 1, -1, -1, dtype=np.uint64)
+            column = array(self.typecode)
+            column.frombytes(values.astype(f'=u{column.itemsize}').tobytes())
+            return column
+
+        buf[chars::chars + 1] = b'\n' * count
+        return array(self.typecode, map(int, buf.split()))
+
+    def value(self, column, index):
+        if self.typecode:
+            return column[index]
+        text = column[index * self.chars:(index + 1) * self.chars].decode('ascii')
+        return int(text) if self.numeric else text
+
+    def text(self, value):
+        return '%0*d' % (self.chars, value) if self.numeric else value
+
+
+class CardSchema:
+    """
+    Named fields of one card type plus the record class built from them.
+
+    Records also have a `code` property with the formatted code, the same
+    value as the 'code' column of csv/jsonl exports.
+    """
+    def __init__(self, card_type, layout, fields):
+        self.card_type = card_type
+        self.layout = layout
+        slots = layout._slots
+        if fields is None:
+            fields = (('symbols', len(slots)),)
+        if sum(size for _, size in fields) != len(slots):
+            raise ValueError(f"Fields of '{card_type}' don't cover its template")
+        if any(name == 'code' for name, _ in fields):
+            raise ValueError(f"Field name 'code' of '{card_type}' is reserved "
+                             f"for the formatted code")
+        self.fields = []
+        start = 0
+        for name, size in fields:
+            self.fields.append(CardField(name, slots[start:start + size]))
+            start += size
+
+        from collections import namedtuple
+
+        schema = self
+        base = namedtuple('Card', [field.name for field in self.fields])
+        self.record = type('Card', (base,), {
+            '__slots__': (),
+            'card_type': card_type,
+            '__str__': lambda record: schema.format(record),
+            'code': property(lambda record: schema.format(record)),
+        })
+
+    def format(self, values):
+        """Build the display string for one card's field values."""
+        pieces = self.layout._pieces[:]
+        for field, value in zip(self.fields, values):
+            text = field.text(value)
+            start = 0
+            for piece, _, table in field.slots:
+                pieces[piece] = text[start:start + table.width]
+                start += table.width
+        return ''.join(pieces)
+
+    def pack_rows(self, rows):
+        """Build a CardBatch from newline-terminated rows (see generate_rows)."""
+        stride = self.layout.width + 1
+        count = len(rows) // stride
+        return CardBatch(self, count,
+                         [field.pack(rows, stride, count) for field in self.fields])
+
+    def pack_codes(self, codes):
+        """Build a CardBatch from formatted code strings."""
+        if not codes:
+            return CardBatch(self, 0, [field.pack(b'', 1, 0) for field in self.fields])
+        return self.pack_rows(('\n'.join(codes) + '\n').encode('ascii'))
+
+
+class CardBatch(Sequence):
+    """
+    Compact batch of cards of one type.
+
+    Fields are stored column-wise (a Visa card takes ~20 bytes instead of a
+    ~120-byte string), batch[i] returns a Card record with named fields
+    (card.number, card.pin, ... or card.symbols for single-field types) and
+    card.code or str(card) gives the usual display format.
+    """
+    def __init__(self, schema, count, columns):
+        self.schema = schema
+        self.count = count
+        self.columns = columns
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.count))]
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("card index out of range")
+        return self.schema.record._make(
+            field.value(column, index)
+            for field, column in zip(self.schema.fields, self.columns))
+
+    def column(self, name):
+        """Packed column of one field (array.array for numbers, bytes for text)."""
+        for field, column in zip(self.schema.fields, self.columns):
+            if field.name == name:
+                return column
+        raise KeyError(name)
+
+    def strings(self):
+        """All cards as display strings."""
+        return [str(card) for card in self]
+
+    def __repr__(self):
+        return f"CardBatch({self.schema.card_type!r}, {self.count} cards)"
+
+
+_card_schemas = {}
+
+
+def card_schema(card_type):
+    """
+    Return the cached CardSchema for a card type.
+
+    The cache follows CARD_LAYOUTS: a type that was re-registered or
+    reloaded from its config file has a new layout and gets a new schema.
+    """
+    layout = CARD_LAYOUTS[card_type]
+    schema = _card_schemas.get(card_type)
+    if schema is None or schema.layout is not layout:
+        schema = _card_schemas[card_type] = CardSchema(
+            card_type, layout, CARD_TYPES[card_type].get('fields'))
+    return schema
+
+
+# === EXPORTERS ===
+# Codes are streamed to files or stdout chunk by chunk. Every output line has
+# a fixed layout, so a whole chunk is reformatted with one strided copy per
+# output column instead of formatting line by line in Python.
+
+EXPORT_FORMATS = ('txt', 'csv', 'jsonl')
+EXPORT_COMPRESSION = (None, 'gzip', 'zstd')
+
+# Write buffer for export files
+EXPORT_BUFFER_SIZE = 1 << 20
+
+
+def open_export_stream(out, compression=None, level=None):
+    """
+    Open a binary output stream for exports.
+
+    Args:
+        out: File path, '-' for stdout, or an open binary file object
+        compression: None, 'gzip' or 'zstd'
+        level: Optional compression level
+
+    Returns:
+        tuple: (binary file object, whether the caller should close it)
+    """
+    if compression not in EXPORT_COMPRESSION:
+        raise ValueError(f"Unknown compression '{compression}'. "
+                         f"Available: gzip, zstd")
+
+    is_path = isinstance(out, (str, bytes, os.PathLike)) and out != '-'
+    target = sys.stdout.buffer if out == '-' else out
+
+    if compression == 'gzip':
+        import gzip
+
+        level = 6 if level is None else level
+        if is_path:
+            return gzip.open(target, 'wb', compresslevel=level), True
+        return gzip.GzipFile(fileobj=target, mode='wb', compresslevel=level), True
+
+    if compression == 'zstd':
+        try:
+            from compression import zstd
+            return zstd.ZstdFile(target, 'wb', level=level), True
+        except ImportError:
+            pass
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError("zstd compression needs Python 3.14+ or the "
+                             "zstandard package (pip install zstandard)")
+        params = {} if level is None else {'level': level}
+        if is_path:
+            target = open(target, 'wb', buffering=EXPORT_BUFFER_SIZE)
+        return zstandard.ZstdCompressor(**params).stream_writer(
+            target, closefd=is_path), True
+
+    if is_path:
+        return open(target, 'wb', buffering=EXPORT_BUFFER_SIZE), True
+    return target, False
+
+
+class CodeExporter:
+    """
+    Formats row buffers (see CodeLayout.iter_rows) as txt, csv or jsonl.
+
+    txt is one code per line. csv has a 'code' column plus one column per
+    named card field (number, pin, ...), jsonl one object per line with the
+    same keys, and csv always starts with its column names. With header=True
+    the card metadata from get_card_info() is written first: '#' comment
+    lines for txt/csv, a {"meta": ...} line for jsonl. Leave it out for csv
+    that csv.DictReader and spreadsheets read as is.
+    """
+    def __init__(self, card_type, stream, fmt='txt', header=True):
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format '{fmt}'. "
+                             f"Available: {', '.join(EXPORT_FORMATS)}")
+        self.card_type = card_type
+        self.stream = stream
+        self.fmt = fmt
+        self.schema = card_schema(card_type)
+        self.layout = self.schema.layout
+        self.written = 0
+
+        fields = self.schema.fields
+        if len(fields) == 1:
+            fields = []
+        self._columns = ['code'] + [field.name for field in fields]
+        code = list(range(self.layout.width))
+
+        if fmt == 'csv':
+            pieces = [code]
+            for field in fields:
+                pieces += [b',', field.positions]
+            pieces.append(b'\n')
+            unsafe = b',"\r'
+        elif fmt == 'jsonl':
+            pieces = [b'{"code": "', code, b'"']
+            for field in fields:
+                pieces += [f', "{field.name}": "'.encode('ascii'), field.positions, b'"']
+            pieces.append(b'}\n')
+            unsafe = b'"\\' + bytes(range(32))
+        else:
+            pieces = None
+            unsafe = b''
+
+        self._line = None
+        if pieces is not None:
+            self._line, self._copies = self._line_spec(pieces)
+            symbols = ''.join(symbol for _, _, table in self.layout._slots
+                              for symbol in table.symbols).encode('ascii')
+            if any(ch in unsafe for ch in self.layout.row[:-1] + symbols):
+                # Needs quoting/escaping, format line by line instead
+                self._line = None
+        self._fields = fields
+
+        if header:
+            self._write_header()
+        if fmt == 'csv':
+            self.stream.write((','.join(self._columns) + '\n').encode('ascii'))
+
+    @staticmethod
+    def _line_spec(pieces):
+        template = bytearray()
+        copies = []
+        for piece in pieces:
+            if isinstance(piece, bytes):
+                template += piece
+            else:
+                for position in piece:
+                    copies.append((len(template), position))
+                    template += b'?'
+        return bytes(template), copies
+
+    def _write_header(self):
+        info = CARD_TYPES[self.card_type]
+        meta = {'card_type': self.card_type, 'name': info['name'],
+                'format': info['format'], 'test_url': info['test_url']}
+        if self.fmt == 'jsonl':
+            import json
+            self.stream.write((json.dumps({'meta': meta}) + '\n').encode('utf-8'))
+            return
+        lines = [f"# {key}: {value}" for key, value in meta.items()]
+        lines.append("# FAKE CODES FOR SCAMBAITING ONLY")
+        self.stream.write(('\n'.join(lines) + '\n').encode('utf-8'))
+
+    def write_rows(self, rows):
+        """Write a buffer of newline-terminated rows."""
+        stride = self.layout.width + 1
+        count = len(rows) // stride
+        if self.fmt == 'txt':
+            self.stream.write(rows)
+        elif self._line is not None:
+            line = len(self._line)
+            out = bytearray(self._line * count)
+            for offset, position in self._copies:
+                out[offset::line] = rows[position::stride]
+            self.stream.write(out)
+        else:
+            self._write_slow(rows.decode('ascii').split('\n')[:-1])
+        self.written += count
+
+    def write_codes(self, codes):
+        """Write a list of formatted code strings."""
+        if codes:
+            self.write_rows(('\n'.join(codes) + '\n').encode('ascii'))
+
+    def _write_slow(self, codes):
+        import io
+        text = io.StringIO()
+        if self.fmt == 'csv':
+            import csv
+            writer = csv.writer(text, lineterminator='\n')
+            for code in codes:
+                writer.writerow([code] + [''.join(code[p] for p in field.positions)
+                                          for field in self._fields])
+        else:
+            import json
+            for code in codes:
+                record = {'code': code}
+                for field in self._fields:
+                    record[field.name] = ''.join(code[p] for p in field.positions)
+                text.write(json.dumps(record) + '\n')
+        self.stream.write(text.getvalue().encode('ascii'))
+
+
+# === UNIQUE CODES ===
+# Uniqueness without remembering issued codes: index i is pushed through a
+# keyed permutation of the card type's whole code space (36^25 for Xbox,
+# 10^20 for Walmart, ...), so distinct indices always give distinct codes.
+
+
+class FeistelPermutation:
+    """
+    Keyed format-preserving permutation of range(domain).
+
+    A balanced Feistel network runs on [0, side)^2 with side = ceil(sqrt(domain))
+    and cycle-walks until the result falls back inside the domain. Each
+    round function is a keyed hash of the round number and the half, with
+    SLACK_BITS more bits than `side` so reducing it mod side stays unbiased:
+    BLAKE2b for sides up to 192 bits, SHAKE-256 sized to the side beyond.
+    """
+    ROUNDS = 8
+    SLACK_BITS = 64
+
+    def __init__(self, domain, key):
+        if domain < 1:
+            raise ValueError("domain must be positive")
+        self.domain = domain
+        side = math.isqrt(domain - 1) + 1 if domain > 1 else 1
+        self.side = side
+
+        import hashlib
+
+        bits = side.bit_length()
+        if bits <= 256 - self.SLACK_BITS:
+            # The original encoding, so saved unique stream positions keep
+            # producing the same codes
+            self._width = 33
+            self._digest_size = None
+            self._hash = hashlib.blake2b(key=key[:64], digest_size=32)
+        else:
+            self._width = bits // 8 + 1
+            self._digest_size = (bits + self.SLACK_BITS) // 8 + 1
+            self._hash = hashlib.shake_256(len(key).to_bytes(2, 'little') + key)
+
+    def _round(self, number, value):
+        h = self._hash.copy()
+        h.update(bytes((number,)) + value.to_bytes(self._width, 'little'))
+        digest = h.digest(self._digest_size) if self._digest_size else h.digest()
+        return int.from_bytes(digest, 'little') % self.side
+
+    def _encrypt(self, x):
+        left, right = divmod(x, self.side)
+        for number in range(self.ROUNDS):
+            left, right = right, (left + self._round(number, right)) % self.side
+        return left * self.side + right
+
+    def _decrypt(self, x):
+        left, right = divmod(x, self.side)
+        for number in reversed(range(self.ROUNDS)):
+            left, right = (right - self._round(number, left)) % self.side, left
+        return left * self.side + right
+
+    def permute(self, index):
+        """Map index in [0, domain) to its unique image in [0, domain)."""
+        if not 0 <= index < self.domain:
+            raise IndexError("index outside the permutation domain")
+        index = self._encrypt(index)
+        while index >= self.domain:
+            index = self._encrypt(index)
+        return index
+
+    def invert(self, value):
+        """Inverse of permute()."""
+        if not 0 <= value < self.domain:
+            raise IndexError("value outside the permutation domain")
+        value = self._decrypt(value)
+        while value >= self.domain:
+            value = self._decrypt(value)
+        return value
+
+
+class UniqueCodes:
+    """
+    Stream of guaranteed-distinct codes for one layout.
+
+    Code i is layout.codes_for_numbers([perm(i)]), so codes never repeat as
+    long as indices don't, and the only state is the next index (`position`),
+    which callers can persist to continue a stream later. The card type is
+    part of the key, so types sharing a template (regional variants) walk
+    different streams.
+    """
+    def __init__(self, layout, seed, position=0, card_type=None):
+        self.layout = layout
+        self.seed = seed
+        self.position = position
+        if card_type is None:
+            key = _sha256(f"{seed}\0{layout.pattern}\0unique".encode('utf-8'))
+        else:
+            key = _sha256(f"{seed}\0{card_type}\0{layout.pattern}\0unique".encode('utf-8'))
+        self.permutation = FeistelPermutation(layout.space, key)
+
+    def take(self, count):
+        """Return the next `count` codes and advance the stream."""
+        if self.position + count > self.layout.space:
+            raise ValueError("Not enough unused codes left for this card type")
+        start = self.position
+        permute = self.permutation.permute
+        codes = self.layout.codes_for_numbers(
+            permute(index) for index in range(start, start + count))
+        self.position = start + count
+        return codes
+
+    def code_at(self, index):
+        """Code number `index` of this stream."""
+        return self.layout.codes_for_numbers([self.permutation.permute(index)])[0]
+
+    def index_of(self, code):
+        """Stream index that produced `code`."""
+        return self.permutation.invert(self.layout.number_for_code(code))
+
+
+# === ISSUED-CODE LEDGER ===
+# Remembers every code handed out so it is never issued again, across CLI
+# and GUI sessions.
+
+DEFAULT_LEDGER_PATH = os.path.join(
+    os.path.expanduser('~'), '.decoycards', 'issued_codes.db')
+# Top-ups in a row that may bring nothing new before the ledger gives up
+# (each one draws twice as many candidates as the one before)
+LEDGER_MAX_MISSES = 24
+
+
+class CodeLedger:
+    """
+    On-disk record of issued codes backed by SQLite in WAL mode.
+
+    Codes are the primary key of a WITHOUT ROWID table, so an existence check
+    is one B-tree lookup, and every call writes its whole batch in a single
+    transaction. Batches are written in sorted order so inserts walk the
+    B-tree instead of jumping around it. Measured on a single-core container:
+    record() of 1M Xbox codes ~3.6s (~275k codes/s), issue() of 1M new codes
+    against a ledger already holding 1M ~5.5s (~180k codes/s), existence
+    checks ~9us each.
+    """
+    # Host parameters per "IN (...)" lookup, below SQLite's historic limit of 999
+    LOOKUP_BATCH = 500
+
+    def __init__(self, path=DEFAULT_LEDGER_PATH):
+        import sqlite3
+        import threading
+
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, isolation_level=None,
+                                     check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('PRAGMA cache_size=-65536')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS issued ('
+            'code TEXT PRIMARY KEY, card_type TEXT NOT NULL, '
+            'issued_at REAL NOT NULL) WITHOUT ROWID')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __contains__(self, code):
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT 1 FROM issued WHERE code = ?', (code,)).fetchone()
+        return row is not None
+
+    def __len__(self):
+        return self.count()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def count(self, card_type=None):
+        """Number of issued codes, optionally for one card type."""
+        with self._lock:
+            if card_type is None:
+                row = self._conn.execute('SELECT COUNT(*) FROM issued').fetchone()
+            else:
+                row = self._conn.execute(
+                    'SELECT COUNT(*) FROM issued WHERE card_type = ?',
+                    (card_type,)).fetchone()
+        return row[0]
+
+    def _existing(self, codes):
+        found = set()
+        for start in range(0, len(codes), self.LOOKUP_BATCH):
+            batch = codes[start:start + self.LOOKUP_BATCH]
+            query = 'SELECT code FROM issued WHERE code IN (%s)' % ','.join('?' * len(batch))
+            found.update(row[0] for row in self._conn.execute(query, batch))
+        return found
+
+    def existing(self, codes):
+        """Return the subset of `codes` that has already been issued."""
+        with self._lock:
+            return self._existing(list(codes))
+
+    def record(self, card_type, codes):
+        """Record codes as issued in one transaction; returns how many were new."""
+        now = time.time()
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                self._conn.executemany(
+                    'INSERT OR IGNORE INTO issued VALUES (?, ?, ?)',
+                    ((code, card_type, now) for code in sorted(codes)))
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+            return self._conn.total_changes - before
+
+    def issue(self, card_type, codes):
+        """
+        Atomically keep and record only the codes never issued before.
+
+        Returns:
+            list: the fresh codes, in their original order, without repeats
+        """
+        now = time.time()
+        candidates = sorted(set(codes))
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                taken = self._existing(candidates)
+                self._conn.executemany(
+                    'INSERT INTO issued VALUES (?, ?, ?)',
+                    ((code, card_type, now) for code in candidates
+                     if code not in taken))
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+        return [code for code in dict.fromkeys(codes) if code not in taken]
+
+
+def open_default_ledger():
+    """Open the shared ledger at DEFAULT_LEDGER_PATH, or None if that fails."""
+    try:
+        return CodeLedger(DEFAULT_LEDGER_PATH)
+    except Exception:
+        return None
+
+
+# === PARALLEL GENERATION ===
+# Large batches are split into shards that each draw from their own
+# SeededStream (same root seed, stream id = shard index). Output only depends
+# on the seed and the number of shards, not on where a shard ran, so small
+# batches run the shards in-process and still match a process-pool run, and a
+# thread-pool run matches both. Shards share no mutable state, so on
+# free-threaded (no-GIL) CPython builds the thread pool scales with cores.
+
+# Below this many codes process start-up costs more than it saves
+PARALLEL_MIN_COUNT = 200000
+# Threads start much faster, but a shard still needs a few chunks of work
+THREADED_MIN_COUNT = 4 * BATCH_CHUNK_SIZE
+# agenerate() runs batches at least this big in the event loop's executor,
+# smaller ones take less time than the hop to a thread
+ASYNC_OFFLOAD_MIN_COUNT = 2000
+
+
+def _generate_shard(template, count, seed, shard, alphabets=None):
+    """Worker entry point: one shard of a sharded batch as raw rows."""
+    layout = compile_template(template, alphabets)
+    return layout.generate_rows(count, SeededStream(seed, shard))
+
+
+def generate_sharded(template, count, workers=1, seed=None, as_array=False,
+                     threads=False, alphabets=None):
+    """
+    Generate codes from a template in `workers` independent shards.
+
+    Args:
+        template: Format template to generate from
+        count: Total number of codes
+        workers: Number of shards / worker processes
+        seed: Root seed; None draws a fresh one from os.urandom
+        as_array: Return a NumPy byte array (or list of bytes) like generate_array
+        threads: Run the shards on a thread pool instead of worker processes
+        alphabets: The card type's extra/overriding named alphabets, as for
+                   compile_template (passed on to every worker)
+
+    Returns:
+        list: codes in shard order, reproducible for the same seed and workers
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if seed is None:
+        seed = int.from_bytes(os.urandom(16), 'little')
+
+    base, extra = divmod(count, workers)
+    jobs = [(template, base + (shard < extra), seed, shard, alphabets)
+            for shard in range(workers)]
+    jobs = [job for job in jobs if job[1]]
+
+    if threads and len(jobs) > 1 and count >= THREADED_MIN_COUNT:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=len(jobs),
+                                thread_name_prefix='decoycards-shard') as pool:
+            blobs = list(pool.map(_generate_shard, *zip(*jobs)))
+    elif not threads and len(jobs) > 1 and count >= PARALLEL_MIN_COUNT:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+            blobs = list(pool.map(_generate_shard, *zip(*jobs)))
+    else:
+        blobs = [_generate_shard(*job) for job in jobs]
+
+    layout = compile_template(template, alphabets)
+    np = _numpy() if as_array else None
+    if np is not None:
+        out = np.empty((count, layout.width), dtype=np.uint8)
+        start = 0
+        for blob in blobs:
+            rows = np.frombuffer(blob, dtype=np.uint8).reshape(-1, layout.width + 1)
+            out[start:start + len(rows)] = rows[:, :-1]
+            start += len(rows)
+        return out.view(f'S{layout.width}').reshape(count)
+
+    codes = []
+    for blob in blobs:
+        if as_array:
+            codes.extend(blob.split(b'\n')[:-1])
+        else:
+            codes.extend(blob.decode('ascii').split('\n')[:-1])
+    return codes
+
+
+# === METRICS ===
+# Counters, gauges and latency histograms for generation, the store timer and
+# notifications. Off by default: instrumented methods then cost one attribute
+# check. Turned on with --stats / --metrics-port, or METRICS.enable() when
+# embedding; metrics can then be dumped as text or served to Prometheus. Only
+# the switch and the decorator live here, the registry itself (decoy_metrics)
+# is imported when metrics are first used.
+
+# Histogram bucket bounds in seconds
+LATENCY_BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01,
+                   0.05, 0.1, 0.5, 1, 5, 10, 60)
+PHASE_BUCKETS = (1, 10, 60, 300, 600, 1200, 1800, 3600, 7200, 14400)
+
+
+class _NoLock:
+    """Stand-in lock for state no second thread is using (yet)."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_LOCK = _NoLock()
+
+
+class MetricsSwitch:
+    """
+    Process-wide METRICS: the flag instrumented code checks, plus the way to
+    the decoy_metrics.Metrics registry.
+
+    Everything except enabled/enable()/disable() (inc, observe, render,
+    summary, help, ...) is forwarded to the registry, which is created on
+    first use.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._registry = None
+
+    @property
+    def registry(self):
+        if self._registry is None:
+            from decoy_metrics import METRIC_HELP, Metrics
+
+            self._registry = Metrics()
+            self._registry.help.update(METRIC_HELP)
+        return self._registry
+
+    def enable(self):
+        self.registry.enable()
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+        if self._registry is not None:
+            self._registry.disable()
+
+    def serve(self, port, host='127.0.0.1'):
+        """Serve the registry to Prometheus, see Metrics.serve()."""
+        self.enable()
+        return self.registry.serve(port, host)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.registry, name)
+
+
+# Process-wide metrics used by the instrumented methods
+METRICS = MetricsSwitch()
+
+# inspect.CO_COROUTINE, without importing inspect
+_CO_COROUTINE = 0x80
+
+
+class _CallRecord:
+    """Context manager doing the METRICS bookkeeping of one instrumented call."""
+    __slots__ = ('name', 'series', 'buckets', 'active', 'start')
+
+    def __init__(self, name, series, buckets, active):
+        self.name = name
+        self.series = series
+        self.buckets = buckets
+        self.active = active
+
+    def __enter__(self):
+        if self.active:
+            METRICS.add_gauge('timers_active', 1)
+        self.start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            METRICS.inc(f'{self.name}_errors_total', self.series)
+        METRICS.observe(f'{self.name}_seconds', time.perf_counter() - self.start,
+                        self.series, self.buckets)
+        if self.active:
+            METRICS.add_gauge('timers_active', -1)
+        return False
+
+
+def instrumented(name, labels=None, counted=None, buckets=LATENCY_BUCKETS, active=False):
+    """
+    Decorator recording calls of a method (plain or async) in METRICS.
+
+    Records the histogram `<name>_seconds` and, when the call raises,
+    `<name>_errors_total`. Disabled metrics cost one attribute check.
+
+    Args:
+        name: Metric base name
+        labels: Function of the call's arguments returning (label, value) pairs
+        counted: Function of the result returning the number of cards it
+                 holds, added to the counter `<name>_codes_total`
+        buckets: Histogram bucket bounds in seconds
+        active: Keep the gauge `timers_active` up while the call runs
+    """
+    def decorate(func):
+        if func.__code__.co_flags & _CO_COROUTINE:
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not METRICS.enabled:
+                    return await func(*args, **kwargs)
+                series = labels(*args, **kwargs) if labels else ()
+                with _CallRecord(name, series, buckets, active):
+                    result = await func(*args, **kwargs)
+                if counted:
+                    METRICS.inc(f'{name}_codes_total', series, counted(result))
+                return result
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not METRICS.enabled:
+                return func(*args, **kwargs)
+            series = labels(*args, **kwargs) if labels else ()
+            with _CallRecord(name, series, buckets, active):
+                result = func(*args, **kwargs)
+            if counted:
+                METRICS.inc(f'{name}_codes_total', series, counted(result))
+            return result
+        return wrapper
+    return decorate
+
+
+def _rechunk(chunks, size):
+    """Re-split an iterator of code lists into lists of exactly `size` (last one shorter)."""
+    pending = []
+    for chunk in chunks:
+        if pending:
+            chunk = pending + chunk
+        end = len(chunk) - len(chunk) % size
+        for start in range(0, end, size):
+            yield chunk[start:start + size]
+        pending = chunk[end:]
+    if pending:
+        yield pending
+
+
+def _type_label(self, card_type, *args, **kwargs):
+    return (('type', card_type),)
+
+
+def _phase_label(self, total_minutes, phase, *args, **kwargs):
+    return (('phase', phase),)
+
+
+def _cards_in_groups(result):
+    if isinstance(result, dict):
+        return sum(map(len, result.values()))
+    return len(result)
+
+
+def _cards_returned(result):
+    cards = result[0]
+    return 0 if cards is None else len(cards)
+
+
+# === CODE RESERVOIR ===
+# Ready-made codes per card type so handing cards out never waits for
+# generation: a background thread tops each type's deque up to the high
+# watermark whenever it drops below the low one. Codes come from the
+# instance's layouts and unique streams; with a ledger they are recorded as
+# issued only when taken, so codes still waiting in a pool at exit were never
+# handed out and can be issued again later.
+
+RESERVOIR_LOW = 500
+RESERVOIR_HIGH = 5000
+
+
+class CodeReservoir:
+    """
+    Per-type pools of pre-generated codes refilled by a background thread.
+
+    Args:
+        decoy: DecoyCards instance the codes are generated with
+        card_types: Types to keep filled from the start; other types get a
+                    pool on first use (None: all types in CARD_TYPES)
+        low: Refill a pool once it holds fewer codes than this
+        high: Fill pools up to this many codes
+        unique: Fill from the instance's unique streams (generate(unique=True))
+    """
+
+    def __init__(self, decoy, card_types=None, low=RESERVOIR_LOW, high=RESERVOIR_HIGH,
+                 unique=False):
+        import threading
+        from collections import deque
+
+        if not 0 <= low < high:
+            raise ValueError("watermarks need 0 <= low < high")
+        self.decoy = decoy
+        self.low = low
+        self.high = high
+        self.unique = unique
+        if decoy.lock is None:
+            decoy.lock = threading.RLock()
+
+        self._deque = deque
+        self.pools = {}
+        self.stats = {}
+        # Definition each pool was filled from: a reloaded card type config
+        # swaps the CARD_TYPES entry and the old codes are thrown away
+        self._entries = {}
+        if card_types is None:
+            # Plugin types get their pool on first use, not at start-up
+            card_types = [card_type for card_type, entry in CARD_TYPES.items()
+                          if not isinstance(entry, PluginCardType)]
+        for card_type in card_types:
+            self._pool(card_type)
+
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread = None
+
+    def _pool(self, card_type):
+        pool = self.pools.get(card_type)
+        if pool is None:
+            if not known_card_type(card_type):
+                raise ValueError(f"Invalid card type. Available: {', '.join(CARD_TYPES)}")
+            pool = self.pools[card_type] = self._deque()
+            self.stats[card_type] = {'refilled': 0, 'refill_seconds': 0.0, 'misses': 0}
+            self._entries[card_type] = CARD_TYPES.get(card_type)
+        elif CARD_TYPES.get(card_type) is not self._entries[card_type]:
+            pool.clear()
+            self._entries[card_type] = CARD_TYPES.get(card_type)
+        return pool
+
+    def start(self):
+        """Start the refill thread (it fills every pool right away)."""
+        import threading
+
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._refill_loop,
+                                            name='decoycards-reservoir', daemon=True)
+            self._thread.start()
+        self._wake.set()
+        return self
+
+    def stop(self, timeout=None):
+        self._stopped = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def pop(self, card_type):
+        """One code, O(1) from the pool (generated on the spot if it ran dry)."""
+        return self.take(card_type, 1)[0]
+
+    def take(self, card_type, count=1):
+        """
+        Take `count` codes, each one an O(1) pop from the type's pool.
+
+        Whatever the pool can't cover is generated right away (counted as a
+        miss) and the refill thread is woken. With a ledger the codes are
+        recorded as issued here, which writes to its database.
+
+        Returns:
+            list: card strings
+        """
+        pool = self._pool(card_type)
+        cards = []
+        popleft = pool.popleft
+        try:
+            for _ in range(count):
+                cards.append(popleft())
+        except IndexError:
+            pass
+        if self.decoy.ledger is not None and cards:
+            # Drops codes another process handed out while they sat in the pool
+            cards = self.decoy.ledger.issue(card_type, cards)
+        missing = count - len(cards)
+        if missing:
+            self.stats[card_type]['misses'] += missing
+            cards.extend(self.decoy.generate(card_type, missing, unique=self.unique)[0])
+        if len(pool) < self.low:
+            self._wake.set()
+        return cards
+
+    def take_ready(self, card_type, count=1):
+        """
+        Like take(), but only from codes that are ready: returns None (and
+        wakes the refill thread) instead of generating when the pool holds
+        fewer than `count`.
+        """
+        pool = self._pool(card_type)
+        if len(pool) < count:
+            self._wake.set()
+            return None
+        return self.take(card_type, count)
+
+    def generate(self, card_type, count=1):
+        """Drop-in for DecoyCards.generate(card_type, count) served from the pool."""
+        if not known_card_type(card_type):
+            return None, f"Invalid card type. Available: {', '.join(CARD_TYPES)}"
+        return self.take(card_type, count), self.decoy.get_card_info(card_type)
+
+    def depth(self, card_type=None):
+        """Codes ready for one type, or {card_type: depth} for all pools."""
+        if card_type is not None:
+            return len(self.pools.get(card_type, ()))
+        return {card_type: len(pool) for card_type, pool in self.pools.items()}
+
+    def refill_rate(self, card_type):
+        """Codes per second the refill thread generated for card_type so far."""
+        stats = self.stats[card_type]
+        if not stats['refill_seconds']:
+            return 0.0
+        return stats['refilled'] / stats['refill_seconds']
+
+    def report(self):
+        """{card_type: {'depth', 'refilled', 'refill_rate', 'misses'}}"""
+        return {card_type: {'depth': len(pool),
+                            'refilled': self.stats[card_type]['refilled'],
+                            'refill_rate': self.refill_rate(card_type),
+                            'misses': self.stats[card_type]['misses']}
+                for card_type, pool in list(self.pools.items())}
+
+    def _refill_loop(self):
+        while not self._stopped:
+            self._wake.wait()
+            self._wake.clear()
+            for card_type, pool in list(self.pools.items()):
+                if self._stopped:
+                    return
+                if len(pool) < self.low:
+                    self._refill(card_type, pool)
+
+    def _fill(self, card_type, size):
+        decoy = self.decoy
+        if decoy.ledger is None:
+            return decoy.generate(card_type, size, unique=self.unique)[0]
+        # Not recorded in the ledger yet, take() does that
+        with decoy.lock:
+            if self.unique:
+                return decoy.unique_stream(card_type).take(size)
+            return CARD_LAYOUTS[card_type].generate(size, decoy.randbytes())
+
+    def _refill(self, card_type, pool):
+        while not self._stopped:
+            # Measured each step, takes may drain the pool while we fill it
+            size = min(self.high - len(pool), BATCH_CHUNK_SIZE)
+            if size <= 0:
+                break
+            start = time.perf_counter()
+            try:
+                cards = self._fill(card_type, size)
+            except Exception:
+                break  # e.g. ledger closed; take() still generates on demand
+            stats = self.stats[card_type]
+            stats['refill_seconds'] += time.perf_counter() - start
+            stats['refilled'] += len(cards)
+            pool.extend(cards)
+        if METRICS.enabled:
+            labels = (('type', card_type),)
+            METRICS.set_gauge('reservoir_depth', len(pool), labels)
+            METRICS.set_gauge('reservoir_refill_rate', self.refill_rate(card_type), labels)
+
+
+# === TIMER ENGINE ===
+# Store timers count down to a deadline instead of counting ticks: each tick
+# recomputes the time left from the clock and asks to be woken when the
+# displayed second next changes, so slow redraws, dialogs or a busy machine
+# delay one tick but never push the end of the trip back.
+
+# More than this much wall-clock time passing unseen by the timer clock is
+# taken as a suspend (only checked where no suspend-aware clock is known)
+SUSPEND_SLACK = 2.0
+
+
+def _suspend_aware_clock():
+    """
+    A monotonic clock that keeps counting while the machine sleeps, or None.
+
+    time.monotonic() stops during suspend on Linux and macOS, which would
+    make a timer end late by however long the laptop lid was closed.
+    """
+    if sys.platform.startswith('linux') and hasattr(time, 'CLOCK_BOOTTIME'):
+        return functools.partial(time.clock_gettime, time.CLOCK_BOOTTIME)
+    if sys.platform == 'darwin' and hasattr(time, 'CLOCK_MONOTONIC'):
+        # Unlike mach_absolute_time() behind time.monotonic(), this one counts sleep
+        return functools.partial(time.clock_gettime, time.CLOCK_MONOTONIC)
+    if os.name == 'nt':
+        return time.monotonic  # GetTickCount64 counts sleep
+    return None
+
+
+TIMER_CLOCK = _suspend_aware_clock()
+
+
+def format_countdown(seconds):
+    """Format whole seconds left as MM:SS, or HH:MM:SS from an hour up."""
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours > 0:
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+class PhaseTimer:
+    """
+    One timer phase counting down to a fixed deadline.
+
+    The deadline lives on TIMER_CLOCK, which keeps counting through suspend.
+    Where there is no such clock, time.monotonic() is used and reconciled
+    with the wall clock, so time spent suspended still counts.
+
+    Args:
+        total_seconds: Length of the phase
+        clock: Monotonic clock to use instead (e.g. for tests)
+        left: Seconds left when resuming a phase that started earlier
+              (default: the whole phase)
+    """
+    def __init__(self, total_seconds, clock=None, left=None):
+        self.total = total_seconds
+        self.clock = clock or TIMER_CLOCK or time.monotonic
+        self.reconcile = clock is None and TIMER_CLOCK is None
+        if left is None:
+            left = total_seconds
+        left = min(max(0.0, left), total_seconds)
+        self.deadline = self.clock() + left
+        self.wall_deadline = time.time() + left
+        self.shown = None
+
+    def remaining(self):
+        """Seconds left as a float, 0.0 once the deadline has passed."""
+        left = self.deadline - self.clock()
+        if self.reconcile:
+            missed = left - (self.wall_deadline - time.time())
+            if missed > SUSPEND_SLACK:
+                self.deadline -= missed
+                left -= missed
+        return max(0.0, left)
+
+    def tick(self):
+        """
+        Check the timer, for the loop driving it.
+
+        Returns:
+            tuple: (seconds_left, changed) - whole seconds to display, and
+                   whether that differs from the previous tick
+        """
+        seconds = math.ceil(self.remaining())
+        changed = seconds != self.shown
+        self.shown = seconds
+        return seconds, changed
+
+    def delay(self):
+        """
+        Seconds until the display next changes, measured now (after any
+        redraw), so slow redraws don't shift later ticks. None once finished.
+        """
+        if self.shown == 0:
+            return None
+        return max(0.0, self.remaining() - (self.shown - 1))
+
+    @property
+    def progress(self):
+        """Fraction of the phase done, as of the last tick."""
+        if not self.total:
+            return 1.0
+        if self.shown is None:
+            return 0.0
+        return 1 - self.shown / self.total
+
+
+class DecoyCards:
+    """
+    Main class that handles fake gift card generation and scambaiting utilities.
+    
+    This class provides methods to:
+    - Generate fake gift card codes for various platforms
+    - Calculate realistic travel times for "going to store" scenarios  
+    - Play notification sounds when timers complete
+    - Bring the application window to foreground for attention
+    """
+    def __init__(self, ledger=None, seed=None):
+        # Character set for generating fake codes (uppercase letters + digits)
+        self.chars = string.ascii_uppercase + string.digits
+
+        # Optional CodeLedger (or path to one): generate() then never hands out
+        # a code that was issued before, in this or any earlier session
+        if isinstance(ledger, str):
+            ledger = CodeLedger(ledger)
+        self.ledger = ledger
+
+        # Optional instance seed: every thread using this instance then draws
+        # from its own reproducible stream, see randbytes()
+        self.seed = seed
+        self.thread_streams = None
+        if seed is not None:
+            import threading
+
+            self.thread_streams = threading.local()
+
+        # Uniqueness-mode streams per (card type, seed), see unique_stream()
+        self.unique_streams = {}
+        self.unique_seed = int.from_bytes(self.randbytes()(16), 'little')
+
+        # Set to a threading lock by CodeReservoir when a background thread
+        # starts sharing this instance (threading isn't imported before that)
+        self.lock = None
+
+    def randbytes(self):
+        """
+        Random byte source (os.urandom compatible) for the calling thread.
+
+        Unseeded instances use os.urandom, which keeps no state and is safe to
+        share between threads. With an instance seed every thread gets its
+        own SeededStream (thread-local, gone with the thread), seeded from
+        (seed, thread name) on the thread's first call. The cards each thread
+        sees are then reproducible however the threads interleave, and no
+        thread ever touches another's stream.
+        """
+        if self.seed is None:
+            return os.urandom
+        stream = getattr(self.thread_streams, 'stream', None)
+        if stream is None:
+            import threading
+
+            stream = self.thread_streams.stream = SeededStream(
+                (self.seed, threading.current_thread().name))
+        return stream
+
+    def clear_screen(self):
+        """Clear the terminal screen (works on Windows and Unix-like systems)"""
+        os.system('cls' if os.name == 'nt' else 'clear')
+
+    @instrumented('play_sound')
+    def play_sound(self):
+        """
+        Play a notification sound to alert the user when timers complete.
+        Uses playsound3 library for cross-platform compatibility with fallbacks:
+        - Windows: Uses system message beep
+        - macOS: Plays Glass.aiff system sound  
+        - Linux: Tries various system sound files
+        - Fallback: Terminal bell character if all else fails
+        """
+        import platform
+
+        try:
+            from playsound3 import playsound
+            # Try to play a system notification sound
+            system = platform.system().lower()
+            
+            if system == 'windows':
+                # Use Windows system sound
+                import winsound
+                winsound.MessageBeep(winsound.MB_ICONEXCLAMATION)
+            elif system == 'darwin':
+                # Try macOS system sound first
+                try:
+                    playsound('/System/Library/Sounds/Glass.aiff', block=False)
+                except:
+                    os.system('afplay /System/Library/Sounds/Glass.aiff')
+            elif system == 'linux':
+                # Try Linux system sounds
+                sound_files = [
+                    '/usr/share/sounds/alsa/Front_Left.wav',
+                    '/usr/share/sounds/ubuntu/stereo/bell.ogg',
+                    '/usr/share/sounds/gnome/default/alerts/glass.ogg'
+                ]
+                
+                sound_played = False
+                for sound_file in sound_files:
+                    if os.path.exists(sound_file):
+                        try:
+                            playsound(sound_file, block=False)
+                            sound_played = True
+                            break
+                        except:
+                            continue
+                
+                if not sound_played:
+                    # Fallback to terminal bell
+                    print('\a')
+            else:
+                print('\a')
+        except ImportError:
+            # Fallback if playsound3 not available
+            print('\a')
+        except Exception:
+            # Any other error, use terminal bell
+            print('\a')
+
+    @instrumented('bring_to_foreground', labels=lambda self: (('source', 'terminal'),))
+    def bring_to_foreground(self):
+        """
+        Bring the application window to the front to get user's attention.
+        Platform-specific implementations:
+        - Windows: Uses Win32 API to set foreground window
+        - macOS: Activates Terminal application
+        - Linux: Uses wmctrl or xdotool to activate window
+        """
+        import platform
+        import subprocess
+
+        system = platform.system().lower()
+
+        try:
+            if system == 'windows':
+                try:
+                    import ctypes
+                    from ctypes import wintypes
+
+                    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+                    user32 = ctypes.WinDLL('user32', use_last_error=True)
+
+                    hWnd = kernel32.GetConsoleWindow()
+                    if hWnd:
+                        user32.SetForegroundWindow(hWnd)
+                        user32.ShowWindow(hWnd, 9)
+                        user32.SetWindowPos(
+                            hWnd, -1, 0, 0, 0, 0, 0x0001 | 0x0002)
+                except:
+                    pass
+
+            elif system == 'darwin':
+                subprocess.run(['osascript', '-e', 'tell application "Terminal" to activate'],
+                               capture_output=True, check=False)
+
+            elif system == 'linux':
+                try:
+                    subprocess.run(['wmctrl', '-a', 'DecoyCards'],
+                                   capture_output=True, check=False)
+                except:
+                    try:
+                        result = subprocess.run(['xdotool', 'search', '--name', 'DecoyCards'],
+                                                capture_output=True, text=True)
+                        if result.stdout.strip():
+                            window_id = result.stdout.strip().split('\n')[0]
+                            subprocess.run(['xdotool', 'windowactivate', window_id],
+                                           capture_output=True)
+                    except:
+                        pass
+
+        except Exception:
+            pass
+
+    # === FAKE GIFT CARD GENERATORS ===
+    # Each method generates codes in the format expected by that platform
+    # All codes are intentionally fake and should be tested to ensure invalidity
+
+    def _generate_one(self, card_type):
+        """Generate a single code through the compiled template for card_type"""
+        return CARD_LAYOUTS[card_type].generate(1)[0]
+
+    def generate_xbox(self):
+        """Generate fake Xbox Live gift card code (format: XXXXX-XXXXX-XXXXX-XXXXX-XXXXX)"""
+        return self._generate_one('xbox')
+
+    def generate_psn(self):
+        """Generate fake PlayStation Network gift card code (format: XXXX-XXXX-XXXX)"""
+        return self._generate_one('psn')
+
+    def generate_amazon(self):
+        """Generate fake Amazon gift card code (format: XXXX-XXXXXX-XXXXX)"""
+        return self._generate_one('amazon')
+
+    def generate_google_play(self):
+        """Generate fake Google Play gift card code (format: XXXXXXX-XXXXXXX-XXXXX)"""
+        return self._generate_one('google-play')
+
+    def generate_apple(self):
+        """Generate fake Apple/iTunes gift card code (16 characters, starts with X)"""
+        return self._generate_one('apple')
+
+    def generate_steam(self):
+        """Generate fake Steam wallet code (format: XXXXX-XXXXX-XXXXX)"""
+        return self._generate_one('steam')
+
+    def generate_walmart(self):
+        """Generate fake Walmart gift card with card number and PIN"""
+        return self._generate_one('walmart')
+
+    def generate_target(self):
+        """Generate fake Target gift card with card number and PIN"""
+        return self._generate_one('target')
+
+    def generate_visa(self):
+        """Generate fake Visa gift card with full details (card, expiry, CVV, claim code)"""
+        return self._generate_one('visa')
+
+    def get_card_info(self, card_type):
+        """
+        Get metadata about different gift card types including:
+        - Display name
+        - Expected format and the template codes are generated from
+        - Test URL where codes can be validated (if available)
+
+        Unknown types and plugins that fail to load give an empty dict.
+        """
+        try:
+            return dict(CARD_TYPES.get(card_type, {}))
+        except ValueError:
+            return {}  # broken plugin, it removed itself from CARD_TYPES
+
+    @instrumented('generate', labels=_type_label, counted=_cards_returned)
+    def generate(self, card_type, count=1, as_array=False, workers=None, seed=None,
+                 lazy=False, unique=False, records=False, threads=None):
+        """
+        Generate one or more fake gift cards of the specified type.
+        
+        Args:
+            card_type: Type of card to generate (xbox, psn, amazon, etc.)
+            count: Number of cards to generate (default: 1)
+            as_array: Return a NumPy fixed-width byte array (S29 for Xbox, ...)
+                      instead of a list of strings; falls back to a list of
+                      bytes when NumPy is not installed
+            workers: Split the batch across this many worker processes
+            seed: Root seed for reproducible output (same seed and workers
+                  always give the same cards); without one the instance's
+                  seed, if any, makes each thread's calls reproducible
+            lazy: Return a CodeSequence that computes each card on access
+                  (card N for a given seed and type is always the same; a
+                  random seed is chosen and kept on the sequence if none given;
+                  can't be combined with unique or an instance with a ledger)
+            unique: Never repeat a card, within or across batches from this
+                    instance, by walking a keyed permutation of the code space
+
+            records: Return a compact CardBatch of Card records (card.pin,
+                     card.number, ...) instead of formatted strings
+            threads: Like workers, but split the batch across a thread pool
+                     (same cards as that many workers for the same seed)
+
+        Cards already recorded in self.ledger are replaced by fresh ones and
+        every returned card is recorded as issued.
+
+        Returns:
+            tuple: (list_of_cards, card_info_dict) or (None, error_message)
+
+        Raises:
+            ValueError: when unique mode or the ledger has used up every
+                        possible code of the type, or for lazy=True with
+                        unique mode or a ledger
+        """
+        if CARD_CONFIGS:
+            check_card_configs()
+        if card_type not in CARD_TYPES or isinstance(CARD_TYPES[card_type], PluginCardType):
+            error = card_type_error(card_type)
+            if error:
+                return None, error
+
+        if workers is not None and threads is not None:
+            raise ValueError("Pass either workers or threads, not both")
+        if lazy and (unique or self.ledger is not None):
+            # Lazy cards are computed on access, nothing could be checked or recorded
+            raise ValueError("lazy=True can't be combined with unique=True or a ledger")
+
+        card_info = self.get_card_info(card_type)
+        layout = CARD_LAYOUTS[card_type]
+        randbytes = self.randbytes()
+        if lazy:
+            if seed is None:
+                seed = int.from_bytes(randbytes(16), 'little')
+            return CodeSequence(layout, seed, range(count)), card_info
+
+        if records and not unique and self.ledger is None and \
+                workers is None and threads is None and seed is None:
+            # Pack straight from the row buffer, no per-card strings at all
+            rows = layout.generate_rows(count, randbytes)
+            return card_schema(card_type).pack_rows(rows), card_info
+
+        # The ledger checks plain strings, arrays are built afterwards
+        direct_array = as_array and not records and not unique and self.ledger is None
+
+        # Unique streams and the ledger are shared state: once a background
+        # thread (CodeReservoir) uses this instance they are guarded by self.lock
+        stateful = unique or self.ledger is not None
+        with self.lock if stateful and self.lock is not None else _NO_LOCK:
+            if unique:
+                stream = self.unique_stream(card_type, seed)
+                cards = stream.take(count)
+                top_up = stream.take
+            elif workers is not None or threads is not None or seed is not None:
+                if seed is None:
+                    seed = int.from_bytes(randbytes(16), 'little')
+                cards = generate_sharded(card_info['template'], count,
+                                         workers or threads or 1, seed, direct_array,
+                                         threads=threads is not None,
+                                         alphabets=card_info.get('alphabets'))
+                top_up = functools.partial(layout.generate, randbytes=randbytes)
+            elif direct_array:
+                cards = layout.generate_array(count, randbytes)
+            else:
+                cards = layout.generate(count, randbytes)
+                top_up = functools.partial(layout.generate, randbytes=randbytes)
+
+            if self.ledger is not None:
+                cards = self._issue(card_type, cards, count, top_up, layout.space)
+        if records:
+            cards = card_schema(card_type).pack_codes(cards)
+        elif as_array and not direct_array:
+            cards = _bytes_array(cards, layout.width)
+
+        return cards, card_info
+
+    @instrumented('generate_many', counted=_cards_in_groups)
+    def generate_many(self, counts, interleave=False, seed=None, unique=False):
+        """
+        Generate batches of several card types in one pass.
+
+        All types draw from one shared buffer of random bytes, and the small
+        batches among them are rendered together in a few formatting passes,
+        so preparing e.g. {'xbox': 20, 'steam': 10, 'visa': 5} costs much less
+        than one generate() call per type.
+
+        Args:
+            counts: {card_type: count}, e.g. {'xbox': 200, 'steam': 100}
+            interleave: Return one list of (card_type, card) tuples taking a
+                        card of each type in turn, instead of a dict
+            seed: Root seed for reproducible output (same seed and counts
+                  always give the same cards)
+            unique: Use the collision-free streams, as in generate()
+
+        Cards already in self.ledger are replaced and all are recorded, as in
+        generate().
+
+        Returns:
+            dict: {card_type: list_of_cards} in the order of counts, or a list
+                  of (card_type, card) tuples with interleave=True
+
+        Raises:
+            ValueError: for an unknown card type or a negative count
+        """
+        for card_type, count in counts.items():
+            if not known_card_type(card_type):
+                raise ValueError(f"Invalid card type '{card_type}'. "
+                                 f"Available: {', '.join(CARD_TYPES)}")
+            if count < 0:
+                raise ValueError(f"Negative count for {card_type}")
+
+        if unique or self.ledger is not None:
+            # Stateful modes keep their own streams / checks per type
+            groups = {card_type: self.generate(card_type, count, seed=seed,
+                                               unique=unique)[0] if count else []
+                      for card_type, count in counts.items()}
+        else:
+            layouts = {card_type: CARD_LAYOUTS[card_type] for card_type in counts}
+            size = sum(layout.entropy_size(min(counts[card_type], BATCH_CHUNK_SIZE))
+                       for card_type, layout in layouts.items())
+            randbytes = EntropyBuffer(size, self.randbytes() if seed is None
+                                      else SeededStream(seed, 0))
+            # All small batches are rendered together by one _format_batch(),
+            # the rest column by column
+            small = [card_type for card_type, layout in layouts.items()
+                     if counts[card_type] and layout.formats(counts[card_type])]
+            groups = {card_type: [] for card_type in counts}
+            if small:
+                groups.update(zip(small, _format_batch(
+                    [(layouts[card_type], counts[card_type]) for card_type in small],
+                    randbytes)))
+            for card_type, layout in layouts.items():
+                count = counts[card_type]
+                if card_type in small or not count:
+                    continue
+                if count <= BATCH_CHUNK_SIZE:
+                    groups[card_type] = layout._assemble(count, randbytes)
+                else:
+                    groups[card_type] = layout.generate(count, randbytes)
+
+        if not interleave:
+            return groups
+        from itertools import zip_longest
+
+        tagged = [[(card_type, card) for card in cards] for card_type, cards in groups.items()]
+        return [item for row in zip_longest(*tagged) for item in row if item is not None]
+
+    def _issue(self, card_type, cards, count, top_up, space):
+        """
+        Drop cards the ledger has issued before and replace them with new ones.
+
+        Raises:
+            ValueError: once the ledger holds (nearly) every possible code
+        """
+        fresh = self.ledger.issue(card_type, cards)
+        misses = 0
+        while len(fresh) < count:
+            needed = count - len(fresh)
+            if not misses:
+                new = self.ledger.issue(card_type, top_up(needed))
+            else:
+                # Near the end of a small code space most random codes are
+                # taken: draw more and only issue as many unused ones as needed
+                candidates = top_up(min(needed << misses, BATCH_CHUNK_SIZE))
+                taken = self.ledger.existing(candidates)
+                new = self.ledger.issue(card_type, [
+                    code for code in dict.fromkeys(candidates) if code not in taken][:needed])
+            if new:
+                fresh.extend(new)
+                misses = 0
+                continue
+            misses += 1
+            if misses > LEDGER_MAX_MISSES or \
+                    space - self.ledger.count(card_type) < needed:
+                raise ValueError("Not enough unused codes left for this card type")
+        return fresh
+
+    @instrumented('export', labels=_type_label, counted=int)
+    def export(self, card_type, count, out, fmt='txt', compression=None,
+               seed=None, unique=False, header=True, chunk_size=BATCH_CHUNK_SIZE):
+        """
+        Stream generated cards straight into a file or stdout.
+
+        Args:
+            card_type: Type of card to generate (xbox, psn, amazon, etc.)
+            count: Number of cards, or None to write until the output closes
+            out: File path, '-' for stdout, or a binary file object
+            fmt: 'txt' (one per line), 'csv' or 'jsonl'
+            compression: None, 'gzip' or 'zstd'
+            seed: Root seed, same output as generate(..., seed=seed)
+            unique: Use the collision-free stream, as in generate()
+            header: Start with the card metadata from get_card_info()
+            chunk_size: Cards generated and written per step
+
+        Returns:
+            int: number of cards written
+
+        Raises:
+            ValueError: for an unknown card type, format or compression
+        """
+        if not known_card_type(card_type):
+            raise ValueError(f"Invalid card type. Available: {', '.join(CARD_TYPES)}")
+
+        stream, owned = open_export_stream(out, compression)
+        try:
+            exporter = CodeExporter(card_type, stream, fmt, header)
+            if unique or self.ledger is not None:
+                for codes in self._iter_issued(card_type, count, chunk_size, seed, unique):
+                    exporter.write_codes(codes)
+            else:
+                randbytes = self.randbytes()
+                if seed is not None:
+                    # Fixed steps through the seeded stream, as in iter_generate()
+                    randbytes, chunk_size = SeededStream(seed, 0), BATCH_CHUNK_SIZE
+                for rows in exporter.layout.iter_rows(count, chunk_size, randbytes):
+                    exporter.write_rows(rows)
+        finally:
+            if owned:
+                stream.close()
+            else:
+                stream.flush()
+        return exporter.written
+
+    def unique_stream(self, card_type, seed=None):
+        """
+        Get the UniqueCodes stream used by generate(..., unique=True).
+
+        Streams are kept per card type and seed (the instance's own random
+        seed when none is given). Save `stream.seed` and `stream.position` to
+        continue the same collision-free stream in a later session. A type
+        whose layout changed (re-registered, or its config file reloaded)
+        starts a fresh stream over the new code space.
+        """
+        if seed is None:
+            seed = self.unique_seed
+        key = (card_type, seed)
+        layout = CARD_LAYOUTS[card_type]
+        stream = self.unique_streams.get(key)
+        if stream is None or stream.layout is not layout:
+            stream = self.unique_streams[key] = UniqueCodes(
+                layout, seed, card_type=card_type)
+        return stream
+
+    def iter_generate(self, card_type, count=None, chunk_size=BATCH_CHUNK_SIZE,
+                      seed=None, unique=False):
+        """
+        Stream fake gift cards in chunks instead of building one big list.
+
+        Args:
+            card_type: Type of card to generate (xbox, psn, amazon, etc.)
+            count: Total number of cards, or None for an endless stream
+            chunk_size: Maximum number of cards in each yielded list
+            seed: Root seed, same cards as generate(..., seed=seed)
+            unique: Use the collision-free stream, as in generate()
+
+        Returns:
+            iterator: lists of card strings, e.g. for writing straight to a file
+
+        Raises:
+            ValueError: if card_type is unknown
+        """
+        if not known_card_type(card_type):
+            raise ValueError(f"Invalid card type. Available: {', '.join(CARD_TYPES)}")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        if unique or self.ledger is not None:
+            return self._iter_issued(card_type, count, chunk_size, seed, unique)
+        layout = CARD_LAYOUTS[card_type]
+        if seed is None:
+            return layout.iter_chunks(count, chunk_size, self.randbytes())
+        # A seeded stream is consumed in fixed steps so the cards match
+        # generate(seed=...) whatever chunk_size is asked for
+        return _rechunk(layout.iter_chunks(count, BATCH_CHUNK_SIZE, SeededStream(seed, 0)),
+                        chunk_size)
+
+    def _iter_issued(self, card_type, count, chunk_size, seed, unique):
+        """iter_generate() through generate(), for the unique stream and the ledger"""
+        remaining = count
+        while remaining is None or remaining > 0:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            yield self.generate(card_type, size, seed=seed, unique=unique)[0]
+            if remaining is not None:
+                remaining -= size
+
+    async def agenerate(self, card_type, count=1, **kwargs):
+        """
+        Async generate() for event-loop programs such as chat bots.
+
+        Batches of ASYNC_OFFLOAD_MIN_COUNT cards or more, workers= or threads=
+        runs, and every call on an instance with a ledger (SQLite I/O) go to
+        the running loop's default executor so the loop keeps serving other
+        conversations meanwhile; smaller ones are made inline. Unique and
+        ledger batches are serialized with self.lock once one of them has
+        been offloaded.
+
+        Args:
+            card_type: Type of card to generate (xbox, psn, amazon, etc.)
+            count: Number of cards to generate (default: 1)
+            **kwargs: Any other generate() option (seed, unique, records, ...)
+
+        Returns:
+            tuple: (list_of_cards, card_info_dict) or (None, error_message)
+        """
+        stateful = kwargs.get('unique') or self.ledger is not None
+        if count < ASYNC_OFFLOAD_MIN_COUNT and self.ledger is None and \
+                kwargs.get('workers') is None and kwargs.get('threads') is None and \
+                not (stateful and self.lock is not None):
+            return self.generate(card_type, count, **kwargs)
+
+        import asyncio
+
+        if stateful and self.lock is None:
+            import threading
+
+            self.lock = threading.RLock()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.generate, card_type, count, **kwargs))
+
+    # === STORE TIMER UTILITIES ===
+    # These methods help create realistic "going to store" scenarios
+
+    def calculate_travel_time(self, distance, unit, speed_type):
+        """
+        Calculate realistic travel time based on distance and transportation method.
+        
+        Args:
+            distance: Distance to travel
+            unit: 'miles' or 'km' 
+            speed_type: 'walking', 'biking', or 'car'
+            
+        Returns:
+            tuple: (hours, minutes, seconds, total_minutes) or None if invalid
+        """
+        speeds = {
+            'walking': {'mph': 3, 'kmh': 5},
+            'biking': {'mph': 12, 'kmh': 20},
+            'car': {'mph': 30, 'kmh': 50}
+        }
+
+        if speed_type == 'not specified':
+            return None
+
+        if unit == 'miles':
+            speed = speeds[speed_type]['mph']
+        else:
+            speed = speeds[speed_type]['kmh']
+
+        time_hours = distance / speed
+        time_minutes = time_hours * 60
+
+        hours = int(time_minutes // 60)
+        minutes = int(time_minutes % 60)
+        seconds = int((time_minutes % 1) * 60)
+
+        return hours, minutes, seconds, time_minutes
+
+    def format_time(self, hours, minutes, seconds):
+        """Format time duration into human-readable string"""
+        if hours > 0:
+            return f"{hours}h {minutes}m {seconds}s"
+        elif minutes > 0:
+            return f"{minutes}m {seconds}s"
+        else:
+            return f"{seconds}s"
+
+    @instrumented('countdown_timer', labels=_phase_label, buckets=PHASE_BUCKETS,
+                  active=True)
+    def countdown_timer(self, total_minutes, phase):
+        """
+        Run a countdown timer for the specified duration.
+        Shows real-time countdown and plays sound + brings window to foreground when complete.
+        
+        Args:
+            total_minutes: Duration of timer in minutes
+            phase: Description of what phase this timer represents (e.g. "Going to store")
+        """
+        print(f"\n{phase} timer started!")
+        print("Press Ctrl+C to stop the timer early")
+
+        timer = PhaseTimer(int(total_minutes * 60))
+
+        try:
+            while True:
+                remaining, changed = timer.tick()
+                if changed:
+                    print(f"\r{phase}: {format_countdown(remaining)} remaining",
+                          end="", flush=True)
+                delay = timer.delay()
+                if delay is None:
+                    break
+                time.sleep(delay)
+
+            print(f"\n\n{phase} complete!")
+            self.play_sound()
+            self.bring_to_foreground()
+
+        except KeyboardInterrupt:
+            print(f"\n\n{phase} timer stopped early.")
+
+    def store_timer(self):
+        """
+        Interactive store timer that helps create realistic "going to store" scenarios.
+        
+        Prompts user for:
+        - Distance to store and transportation method (for realistic timing)
+        - OR manual time specification
+        
+        Runs two phases:
+        1. "Going to store" timer
+        2. "Returning home" timer
+        
+        This helps scambaiters create believable delays when "buying" gift cards.
+        """
+        self.clear_screen()
+        print("DecoyCards - Store Timer")
+        print("Tell your scammer you're going to the store!")
+        print()
+
+        print("Distance unit:")
+        print("1. Miles")
+        print("2. Kilometers")
+        print("3. Not specified")
+
+        while True:
+            unit_choice = input("Select (1-3): ").strip()
+            if unit_choice == '1':
+                unit = 'miles'
+                break
+            elif unit_choice == '2':
+                unit = 'km'
+                break
+            elif unit_choice == '3':
+                unit = 'not specified'
+                break
+            else:
+                print("Please select 1-3")
+
+        if unit == 'not specified':
+            while True:
+                try:
+                    total_minutes = float(
+                        input("\nEnter travel time in minutes: "))
+                    if total_minutes <= 0:
+                        print("Time must be positive")
+                        continue
+                    hours = int(total_minutes // 60)
+                    minutes = int(total_minutes % 60)
+                    seconds = int((total_minutes % 1) * 60)
+                    time_str = self.format_time(hours, minutes, seconds)
+                    break
+                except ValueError:
+                    print("Please enter a valid number")
+
+            print(f"\nYou can tell the scammer:")
+            print(f"\"I'm going to the store to get the gift card.")
+            print(f"I'll be back in about {time_str}.\"")
+        else:
+            while True:
+                try:
+                    distance = float(
+                        input(f"\nDistance to store in {unit} (enter number): "))
+                    if distance <= 0:
+                        print("Distance must be positive")
+                        continue
+                    break
+                except ValueError:
+                    print("Please enter a valid number")
+
+            print("\nTransportation method:")
+            print("1. Walking")
+            print("2. Biking")
+            print("3. Car")
+
+            while True:
+                transport_choice = input("Select (1-3): ").strip()
+                if transport_choice == '1':
+                    transport = 'walking'
+                    break
+                elif transport_choice == '2':
+                    transport = 'biking'
+                    break
+                elif transport_choice == '3':
+                    transport = 'car'
+                    break
+                else:
+                    print("Please select 1-3")
+
+            travel_time = self.calculate_travel_time(distance, unit, transport)
+            hours, minutes, seconds, total_minutes = travel_time
+            time_str = self.format_time(hours, minutes, seconds)
+            print(f"\nCalculated travel time: {time_str}")
+
+            print(f"\nYou can tell the scammer:")
+            print(
+                f"\"I'm going to the store to get the gift card. It's {distance} {unit} away")
+            print(f"by {transport}, so I'll be back in about {time_str}.\"")
+
+        input("\nPress Enter to start the 'going to store' timer...")
+        self.countdown_timer(total_minutes, "Going to store")
+
+        input("\nPress Enter to start the 'returning home' timer...")
+        self.countdown_timer(total_minutes, "Returning home")
+
+        print("\nYou can now tell the scammer you're back with the gift card!")
+        input("Press Enter to continue...")
+
+    @instrumented('acountdown_timer', labels=_phase_label, buckets=PHASE_BUCKETS,
+                  active=True)
+    async def acountdown_timer(self, total_minutes, phase, on_tick=None, alert=False):
+        """
+        Async countdown_timer(): one timer phase as a cancellable coroutine.
+
+        Sleeps on the event loop between ticks instead of blocking a thread,
+        so one loop can run hundreds of timers. Ticks follow a PhaseTimer
+        deadline and never add up drift; if the loop falls behind, the missed
+        seconds are skipped rather than replayed. Cancelling the task stops
+        the timer.
+
+        Args:
+            total_minutes: Duration of timer in minutes
+            phase: Description of what phase this timer represents (e.g. "Going to store")
+            on_tick: Called as on_tick(phase, remaining_seconds) once per second,
+                     from the full duration down to 0; may be a coroutine function
+            alert: Play the sound and raise the window when the phase ends
+                   (both run in the executor)
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        timer = PhaseTimer(int(total_minutes * 60))
+        while True:
+            remaining, changed = timer.tick()
+            if changed and on_tick is not None:
+                result = on_tick(phase, remaining)
+                if result is not None and hasattr(result, '__await__'):
+                    await result
+            delay = timer.delay()
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+
+        if alert:
+            await loop.run_in_executor(None, self.play_sound)
+            await loop.run_in_executor(None, self.bring_to_foreground)
+
+    @instrumented('arun_store_timer', buckets=PHASE_BUCKETS)
+    async def arun_store_timer(self, total_minutes, on_tick=None, alert=False,
+                               phases=("Going to store", "Returning home")):
+        """
+        Async store_timer() without the prompts: runs the timer phases in turn.
+
+        Args:
+            total_minutes: Duration of each phase in minutes, e.g. the
+                           total_minutes from calculate_travel_time()
+            on_tick: Called as on_tick(phase, remaining_seconds), see
+                     acountdown_timer(); a tick with the full duration marks
+                     the start of each phase and one with 0 its end
+            alert: Play the sound and raise the window after each phase
+            phases: Names of the phases to run
+        """
+        for phase in phases:
+            await self.acountdown_timer(total_minutes, phase, on_tick, alert)
+
+
+def build_parser():
+    """Command line options for scripted (non-interactive) use."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog='gift_card_generator.py',
+        description="DecoyCards - fake gift card codes for scambaiting. "
+                    "Without options the interactive menu starts.",
+        epilog="Example: gift_card_generator.py --type xbox --count 500000 "
+               "--format jsonl --out codes.jsonl --seed 42")
+    parser.add_argument('mode', nargs='?', choices=['gui'], help=argparse.SUPPRESS)
+    parser.add_argument('--gui', '-g', action='store_true',
+                        help="open the graphical interface")
+    parser.add_argument('--type', '-t', dest='card_type', metavar='TYPE',
+                        help="generate this card type without the menu: "
+                             f"{', '.join(CARD_TYPES)} or a plugin type")
+    parser.add_argument('--count', '-n', type=int, default=1,
+                        help="number of cards to generate (default: 1)")
+    parser.add_argument('--format', '-f', dest='fmt', choices=EXPORT_FORMATS,
+                        default='txt', help="output format (default: txt)")
+    parser.add_argument('--out', '-o', default='-',
+                        help="output file, '-' for stdout (default)")
+    parser.add_argument('--compress', choices=['gzip', 'zstd'],
+                        help="compress the output")
+    parser.add_argument('--seed',
+                        help="seed for reproducible output")
+    parser.add_argument('--unique', action='store_true',
+                        help="never repeat a code within this run; with --seed the "
+                             "stream can be continued in a later run with --unique-from")
+    parser.add_argument('--unique-from', type=int, default=0, metavar='POSITION',
+                        help="with --unique --seed, continue the stream at this "
+                             "position (printed at the end of the previous run)")
+    parser.add_argument('--ledger', nargs='?', const=DEFAULT_LEDGER_PATH,
+                        metavar='PATH',
+                        help="skip and record previously issued codes "
+                             f"(default path: {DEFAULT_LEDGER_PATH})")
+    parser.add_argument('--no-header', action='store_true',
+                        help="leave out the card metadata header ('#' lines, or the "
+                             "jsonl meta line); csv keeps its column names")
+    parser.add_argument('--card-types', action='append', metavar='FILE', default=[],
+                        help="load extra card types from a JSON/TOML file "
+                             "(can be repeated)")
+    parser.add_argument('--serve', nargs='?', type=int, const=8765, metavar='PORT',
+                        help="run the local HTTP/JSON card server on 127.0.0.1 "
+                             "(default port: 8765)")
+    parser.add_argument('--stats', action='store_true',
+                        help="print generation, timer and notification stats on exit")
+    parser.add_argument('--metrics-port', type=int, metavar='PORT',
+                        help="serve Prometheus metrics on http://127.0.0.1:PORT/metrics")
+    parser.add_argument('--profile', nargs='?', const='.', metavar='DIR',
+                        help="profile the session with cProfile, reports go to DIR "
+                             "(default: current directory); SIGUSR1 writes one early")
+    parser.add_argument('--profile-memory', action='store_true',
+                        help="with --profile, also trace memory allocations")
+    return parser
+
+
+def run_batch(args):
+    """Generate cards for the non-interactive command line, returns the exit status."""
+    try:
+        decoy = DecoyCards(ledger=args.ledger)
+    except Exception as e:
+        print(f"Error: could not open ledger {args.ledger}: {e}", file=sys.stderr)
+        return 1
+
+    if args.unique_from:
+        decoy.unique_stream(args.card_type, args.seed).position = args.unique_from
+
+    try:
+        written = decoy.export(args.card_type, args.count, args.out,
+                               fmt=args.fmt, compression=args.compress,
+                               seed=args.seed, unique=args.unique,
+                               header=not args.no_header)
+    except BrokenPipeError:
+        # Reader went away (e.g. "| head"): silence the final flush at exit
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 141
+    except (ValueError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if decoy.ledger is not None:
+            decoy.ledger.close()
+
+    if args.out != '-':
+        print(f"Wrote {written} {args.card_type} cards to {args.out}", file=sys.stderr)
+    if args.unique and args.seed is not None:
+        position = decoy.unique_stream(args.card_type, args.seed).position
+        print(f"Next unique position: {position} (add --unique-from {position} "
+              f"to continue)", file=sys.stderr)
+    return 0
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.stats:
+        METRICS.enable()
+    if args.metrics_port is not None:
+        try:
+            METRICS.serve(args.metrics_port)
+        except OSError as e:
+            print(f"Error: could not serve metrics on port {args.metrics_port}: {e}",
+                  file=sys.stderr)
+            return 1
+
+    profiler = None
+    if args.profile is not None or args.profile_memory:
+        from decoy_profiler import SessionProfiler
+
+        profiler = SessionProfiler(args.profile or '.', memory=args.profile_memory)
+        try:
+            profiler.start()
+        except OSError as e:
+            print(f"Error: could not write profiles to {profiler.directory}: {e}",
+                  file=sys.stderr)
+            return 1
+
+    try:
+        return run_command(parser, args)
+    finally:
+        if profiler is not None:
+            profiler.stop()
+        if args.stats:
+            print(METRICS.summary(), file=sys.stderr)
+
+
+def run_command(parser, args):
+    """Run the GUI, the server, a batch or the interactive menu for parsed options."""
+    for path in args.card_types:
+        try:
+            load_card_config(path)
+        except (ValueError, OSError) as e:
+            print(f"Error: could not load card types from {path}: {e}", file=sys.stderr)
+            return 1
+
+    if args.gui or args.mode == 'gui':
+        if GUI_AVAILABLE:
+            from decoy_gui import DecoyCardsGUI
+
+            app = DecoyCardsGUI()
+            app.run()
+            return 0
+        else:
+            print("GUI not available. Please install customtkinter:")
+            print("pip install customtkinter")
+            return 1
+
+    if args.unique_from and not (args.unique and args.seed is not None):
+        parser.error("--unique-from needs --unique and --seed")
+    if args.unique_from < 0:
+        parser.error("--unique-from can't be negative")
+
+    if args.card_type and not known_card_type(args.card_type):
+        if args.card_type in PLUGIN_ERRORS:
+            parser.error(f"argument --type/-t: {PLUGIN_ERRORS[args.card_type]}")
+        parser.error(f"argument --type/-t: invalid choice: '{args.card_type}' "
+                     f"(choose from {', '.join(CARD_TYPES)})")
+
+    if args.serve is not None:
+        if args.card_type:
+            parser.error("--serve and --type cannot be combined")
+        from decoy_server import serve
+
+        return serve(args.serve, ledger=args.ledger)
+
+    batch_options = [name for name in ('count', 'fmt', 'out', 'compress', 'seed',
+                                       'unique', 'ledger', 'no_header')
+                     if getattr(args, name) != parser.get_default(name)]
+    if batch_options and not args.card_type:
+        parser.error("--type is required for non-interactive generation")
+
+    if args.card_type:
+        if args.count < 1:
+            parser.error("--count must be at least 1")
+        try:
+            return run_batch(args)
+        except KeyboardInterrupt:
+            return 130
+
+    decoy = DecoyCards(ledger=open_default_ledger())
+
+    decoy.clear_screen()
+    print("DecoyCards - Made by Baitrix")
+    print("WARNING: These are fake codes for scambaiting only")
+    if GUI_AVAILABLE:
+        print("Tip: Run with '--gui' or '-g' for graphical interface")
+    print()
+
+    discover_plugins()
+
+    while True:
+        # Menu numbers follow the registry, so plugin and config types show up
+        # after the built-ins (and edits to a config file on the next round)
+        check_card_configs()
+        menu = card_menu()
+        card_types = {str(number): card_type
+                      for number, (card_type, _, _) in enumerate(menu, 1)}
+
+        print("GIFT CARDS:")
+        for number, (_, label, _) in enumerate(menu, 1):
+            print(f"{number}. {label}")
+        print()
+        print("TOOLS:")
+        print("T. Store Timer")
+        if GUI_AVAILABLE:
+            print("G. Launch GUI")
+        print("0. Exit")
+
+        choice = input(
+            f"\nSelect (1-{len(menu)}, T{', G' if GUI_AVAILABLE else ''}) or 0 to exit: ").strip().lower()
+
+        if choice == '0':
+            break
+
+        if choice == 'g' and GUI_AVAILABLE:
+            from decoy_gui import DecoyCardsGUI
+
+            app = DecoyCardsGUI()
+            app.run()
+            decoy.clear_screen()
+            print("DecoyCards - Made by Baitrix")
+            print("WARNING: These are fake codes for scambaiting only")
+            if GUI_AVAILABLE:
+                print("Tip: Run with '--gui' or '-g' for graphical interface")
+            print()
+            continue
+
+        if choice == 't':
+            decoy.store_timer()
+            decoy.clear_screen()
+            print("DecoyCards - Made by Baitrix")
+            print("WARNING: These are fake codes for scambaiting only")
+            if GUI_AVAILABLE:
+                print("Tip: Run with '--gui' or '-g' for graphical interface")
+            print()
+            continue
+
+        if choice not in card_types:
+            print("Invalid choice")
+            input("Press Enter to continue...")
+            decoy.clear_screen()
+            print("DecoyCards - Made by Baitrix")
+            print("WARNING: These are fake codes for scambaiting only")
+            if GUI_AVAILABLE:
+                print("Tip: Run with '--gui' or '-g' for graphical interface")
+            print()
+            continue
+
+        card_type = card_types[choice]
+
+        try:
+            count = int(input("How many cards? (default 1): ") or "1")
+            if count <= 0:
+                count = 1
+        except ValueError:
+            count = 1
+
+        cards, card_info = decoy.generate(card_type, count)
+
+        if cards:
+            print(f"\nGenerated {len(cards)} {card_type} cards:")
+            for i, card in enumerate(cards, 1):
+                print(f"{i}. {card}")
+
+            test_url = card_info.get('test_url')
+            if test_url:
+                print(f"\nTest at: {test_url}")
+
+            print("IMPORTANT: Test these codes first to ensure they are invalid")
+        else:
+            print(f"\nError: {card_info}")
+
+        input("\nPress Enter to continue...")
+        decoy.clear_screen()
+        print("DecoyCards - Made by Baitrix")
+        print("WARNING: These are fake codes for scambaiting only")
+        if GUI_AVAILABLE:
+            print("Tip: Run with '--gui' or '-g' for graphical interface")
+        print()
+
+    return 0
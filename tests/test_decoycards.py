@@ -0,0 +1,492 @@
+"""
+Regression tests for DecoyCards.
+
+Run with `python -m unittest discover tests` (or pytest) from the repo root.
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import decoycards  # noqa: E402
+from decoy_timers import TICK_SLACK, TIMER_STATE_VERSION, TimerManager  # noqa: E402
+from decoycards import (CARD_TYPES, CodeLedger, CodeReservoir, DecoyCards,  # noqa: E402
+                        FeistelPermutation)
+
+
+class CardTypeTestCase(unittest.TestCase):
+    """Registers throwaway card types and removes them again afterwards."""
+
+    def setUp(self):
+        self._card_types = dict(CARD_TYPES)
+
+    def tearDown(self):
+        for card_type in set(CARD_TYPES) - set(self._card_types):
+            del CARD_TYPES[card_type]
+            decoycards.CARD_LAYOUTS.pop(card_type, None)
+        CARD_TYPES.update(self._card_types)
+
+
+class FeistelPermutationTest(unittest.TestCase):
+    def test_large_domain_round_trips(self):
+        # 120 alphanumeric symbols, far beyond a 256-bit round function
+        permutation = FeistelPermutation(36 ** 120, b'k' * 32)
+        images = [permutation.permute(index) for index in range(50)]
+        self.assertEqual(len(set(images)), 50)
+        self.assertEqual([permutation.invert(image) for image in images], list(range(50)))
+        # The high half gets mixed too, not just the low 256 bits
+        self.assertGreater(max(images).bit_length(), 400)
+
+
+class UniqueModeTest(CardTypeTestCase):
+    def test_long_template(self):
+        decoycards.register_card_type('longcard', {'template': '{alnum:120}'})
+        cards, _ = DecoyCards().generate('longcard', 20, unique=True, seed=1)
+        self.assertEqual(len(set(cards)), 20)
+        self.assertTrue(all(len(card) == 120 for card in cards))
+
+    def test_types_sharing_a_template_get_their_own_streams(self):
+        decoycards.register_card_type('xbox-uk', {'template': CARD_TYPES['xbox']['template']})
+        decoy = DecoyCards()
+        self.assertNotEqual(decoy.generate('xbox', 3, unique=True, seed=1)[0],
+                            decoy.generate('xbox-uk', 3, unique=True, seed=1)[0])
+
+
+class ConfigAlphabetTest(CardTypeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, 'card_types.json')
+        with open(self.path, 'w') as f:
+            json.dump({'alphabets': {'hex': '0123456789ABCDEF', 'alnum': 'XYZ'},
+                       'card_types': {'hexcard': {'template': 'HX-{hex:8}-{alnum:4}'}}}, f)
+        decoycards.load_card_config(self.path, cache_dir=None)
+
+    def tearDown(self):
+        decoycards.CARD_CONFIGS.pop(os.path.abspath(self.path), None)
+        shutil.rmtree(self.tmp, ignore_errors=True)
+        super().tearDown()
+
+    def assertCustomAlphabet(self, cards):
+        self.assertEqual(len(cards), 40)
+        for card in cards:
+            prefix, hex_part, alnum_part = card.split('-')
+            self.assertEqual(prefix, 'HX')
+            self.assertTrue(set(hex_part) <= set('0123456789ABCDEF'), card)
+            self.assertTrue(set(alnum_part) <= set('XYZ'), card)
+
+    def test_seeded_sharded_and_threaded(self):
+        decoy = DecoyCards()
+        seeded, _ = decoy.generate('hexcard', 40, seed=42)
+        self.assertCustomAlphabet(seeded)
+        # Small batches normally stay in-process, make them use real pools
+        with mock.patch.object(decoycards, 'PARALLEL_MIN_COUNT', 0), \
+                mock.patch.object(decoycards, 'THREADED_MIN_COUNT', 0):
+            sharded, _ = decoy.generate('hexcard', 40, seed=42, workers=2)
+            threaded, _ = decoy.generate('hexcard', 40, seed=42, threads=2)
+        self.assertCustomAlphabet(sharded)
+        self.assertEqual(sharded, threaded)
+
+    def test_reload_replaces_unique_stream_and_schema(self):
+        decoy = DecoyCards()
+        decoy.generate('hexcard', 5, unique=True, seed=1)
+        decoy.generate('hexcard', 5, records=True)
+        with open(self.path, 'w') as f:
+            json.dump({'alphabets': {'hex': 'QZ'},
+                       'card_types': {'hexcard': {'template': 'NEW-{hex:3}'}}}, f)
+        decoycards.load_card_config(self.path, cache_dir=None)
+
+        cards, _ = decoy.generate('hexcard', 8, unique=True, seed=1)
+        self.assertEqual(len(set(cards)), 8)  # all of the new 2**3 codes
+        self.assertTrue(all(card[:4] == 'NEW-' and set(card[4:]) <= set('QZ')
+                            for card in cards), cards)
+        batch, _ = decoy.generate('hexcard', 5, records=True)
+        self.assertTrue(all(record.code.startswith('NEW-') for record in batch))
+        out = io.BytesIO()
+        decoy.export('hexcard', 3, out, fmt='csv', unique=True, seed=2, header=False)
+        self.assertTrue(all(line.startswith('NEW-')
+                            for line in out.getvalue().decode().splitlines()[1:]))
+
+    def test_replacing_a_type_replaces_its_unique_stream(self):
+        decoy = DecoyCards()
+        decoy.generate('hexcard', 5, unique=True, seed=1)
+        decoycards.register_card_type('hexcard', {'template': 'R-{digit:1}'}, replace=True)
+        cards, _ = decoy.generate('hexcard', 10, unique=True, seed=1)
+        self.assertEqual(sorted(cards), [f'R-{digit}' for digit in range(10)])
+
+
+class PluginTest(CardTypeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp = tempfile.mkdtemp()
+        with open(os.path.join(self.tmp, 'broken_card.py'), 'w') as f:
+            f.write("raise RuntimeError('plugin is broken')\n")
+        decoycards.discover_plugins(self.tmp)
+
+    def tearDown(self):
+        decoycards.PLUGIN_ERRORS.pop('broken-card', None)
+        shutil.rmtree(self.tmp, ignore_errors=True)
+        super().tearDown()
+
+    def test_broken_plugin_gives_error_tuple(self):
+        decoy = DecoyCards()
+        cards, error = decoy.generate('broken-card', 3)
+        self.assertIsNone(cards)
+        self.assertIn("failed to load", error)
+        self.assertIn("plugin is broken", error)
+        # Same answer once the placeholder is gone, and no exceptions either
+        self.assertEqual(decoy.generate('broken-card')[1], error)
+        self.assertFalse(decoycards.known_card_type('broken-card'))
+        self.assertEqual(decoy.get_card_info('broken-card'), {})
+        self.assertTrue(decoy.generate('xbox')[0])
+
+
+class CardRecordTest(unittest.TestCase):
+    def test_code_is_the_formatted_code(self):
+        batch, _ = DecoyCards().generate('xbox', 3, records=True, seed=5)
+        cards, _ = DecoyCards().generate('xbox', 3, seed=5)
+        self.assertEqual([card.code for card in batch], cards)
+        self.assertEqual(batch[0].symbols, cards[0].replace('-', ''))
+
+
+class GenerateManyTest(unittest.TestCase):
+    def test_empty_groups_are_separate_lists(self):
+        groups = DecoyCards().generate_many({'xbox': 0, 'steam': 0, 'psn': 2})
+        groups['xbox'].append('x')
+        self.assertEqual(groups['steam'], [])
+        self.assertEqual(len(groups['psn']), 2)
+
+
+class ExportTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def export(self, fmt, **kwargs):
+        out = io.BytesIO()
+        self.assertEqual(DecoyCards().export('xbox', 5, out, fmt=fmt, seed=3, **kwargs), 5)
+        return out.getvalue().decode('ascii')
+
+    def test_txt(self):
+        cards, _ = DecoyCards().generate('xbox', 5, seed=3)
+        self.assertEqual(self.export('txt', header=False).splitlines(), cards)
+        lines = self.export('txt').splitlines()
+        self.assertTrue(lines[0].startswith('#'))
+        self.assertEqual([line for line in lines if not line.startswith('#')], cards)
+
+    def test_csv_always_has_column_names(self):
+        cards, _ = DecoyCards().generate('xbox', 5, seed=3)
+        rows = list(csv.DictReader(io.StringIO(self.export('csv', header=False))))
+        self.assertEqual([row['code'] for row in rows], cards)
+        lines = self.export('csv').splitlines()
+        body = [line for line in lines if not line.startswith('#')]
+        self.assertTrue(lines[0].startswith('#'))
+        self.assertEqual(body[0], 'code')
+        self.assertEqual(body[1:], cards)
+
+    def test_jsonl(self):
+        cards, _ = DecoyCards().generate('xbox', 5, seed=3)
+        lines = [json.loads(line) for line in self.export('jsonl').splitlines()]
+        self.assertIn('meta', lines[0])
+        self.assertEqual([line['code'] for line in lines[1:]], cards)
+        lines = [json.loads(line) for line in self.export('jsonl', header=False).splitlines()]
+        self.assertEqual([line['code'] for line in lines], cards)
+
+    def test_gzip_round_trip(self):
+        path = os.path.join(self.tmp, 'cards.csv.gz')
+        DecoyCards().export('xbox', 500, path, fmt='csv', compression='gzip', header=False)
+        with gzip.open(path, 'rt') as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), 500)
+        self.assertEqual(len({row['code'] for row in rows}), 500)
+
+    def test_zstd_round_trip(self):
+        path = os.path.join(self.tmp, 'cards.txt.zst')
+        try:
+            DecoyCards().export('xbox', 500, path, compression='zstd', header=False)
+        except ValueError:
+            self.skipTest("no zstd support installed")
+        try:
+            from compression import zstd
+            with zstd.open(path, 'rt') as f:
+                lines = f.read().splitlines()
+        except ImportError:
+            import zstandard
+            with open(path, 'rb') as f:
+                lines = zstandard.ZstdDecompressor().stream_reader(f).read().decode().splitlines()
+        self.assertEqual(len(lines), 500)
+
+    def test_unknown_compression(self):
+        with self.assertRaises(ValueError):
+            DecoyCards().export('xbox', 5, io.BytesIO(), compression='lz4')
+
+
+class SeededThreadsTest(unittest.TestCase):
+    def test_same_named_threads_get_their_own_streams(self):
+        import threading
+
+        decoy = DecoyCards(seed=7)
+        results = []
+
+        def work():
+            results.append(decoy.generate('xbox', 20)[0])
+
+        for _ in range(2):
+            thread = threading.Thread(target=work, name='worker')
+            thread.start()
+            thread.join()
+        # Both start from the stream of (seed, 'worker'), nothing is shared
+        self.assertEqual(results[0], results[1])
+        self.assertNotEqual(results[0], decoy.generate('xbox', 20)[0])
+
+
+class LedgerTest(CardTypeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp = tempfile.mkdtemp()
+        self.ledger = CodeLedger(os.path.join(self.tmp, 'issued.db'))
+
+    def tearDown(self):
+        self.ledger.close()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+        super().tearDown()
+
+    def test_exhausted_code_space_raises(self):
+        # Only 100 possible codes
+        decoycards.register_card_type('twodigit', {'template': '{digit:2}'})
+        decoy = DecoyCards(ledger=self.ledger)
+        first, _ = decoy.generate('twodigit', 60)
+        rest, _ = decoy.generate('twodigit', 40)
+        self.assertEqual(len(set(first + rest)), 100)
+        with self.assertRaisesRegex(ValueError, "Not enough unused codes"):
+            decoy.generate('twodigit', 1)
+
+    def test_lazy_refuses_ledger_and_unique(self):
+        with self.assertRaises(ValueError):
+            DecoyCards(ledger=self.ledger).generate('xbox', 5, lazy=True)
+        with self.assertRaises(ValueError):
+            DecoyCards().generate('xbox', 5, lazy=True, unique=True)
+        self.assertEqual(len(self.ledger), 0)
+
+    def test_reservoir_records_codes_when_taken(self):
+        decoy = DecoyCards(ledger=self.ledger)
+        reservoir = CodeReservoir(decoy, ['xbox'], low=10, high=50)
+        reservoir._refill('xbox', reservoir.pools['xbox'])
+        self.assertEqual(reservoir.depth('xbox'), 50)
+        self.assertEqual(len(self.ledger), 0)
+        cards = reservoir.take('xbox', 5)
+        self.assertEqual(len(self.ledger), 5)
+        self.assertEqual(self.ledger.existing(cards), set(cards))
+
+    def test_agenerate_with_ledger_runs_in_executor(self):
+        import asyncio
+        import threading
+
+        decoy = DecoyCards(ledger=self.ledger)
+        generate, threads = decoy.generate, []
+
+        def recording(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return generate(*args, **kwargs)
+
+        decoy.generate = recording
+        cards, _ = asyncio.run(decoy.agenerate('xbox', 2))
+        self.assertIsNot(threads[0], threading.main_thread())
+        self.assertEqual(self.ledger.existing(cards), set(cards))
+
+    def test_take_ready_never_generates(self):
+        reservoir = CodeReservoir(DecoyCards(), ['xbox'], low=10, high=50)
+        self.assertIsNone(reservoir.take_ready('xbox', 5))
+        self.assertEqual(reservoir.stats['xbox']['misses'], 0)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TimerManagerTestCase(unittest.TestCase):
+    """TimerManager on a fake clock, driven by calling run_due()."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.events = []
+        self.wakeups = 0
+
+    def manager(self, **kwargs):
+        return TimerManager(
+            on_tick=lambda s: self.events.append((s.name, s.phase_index, s.remaining)),
+            on_phase_end=lambda s: self.events.append((s.name, s.phase_index, s.state)),
+            clock=self.clock, **kwargs)
+
+    def run_until(self, manager, until):
+        """Sleep-and-run_due loop like the drivers', returns the number of wake-ups."""
+        wakeups = 0
+        while self.clock.now < until:
+            delay = manager.run_due()
+            wakeups += 1
+            if delay is None:
+                break
+            self.clock.now = min(until, self.clock.now + delay)
+        return wakeups
+
+
+class TimerSchedulerTest(TimerManagerTestCase):
+    def test_auto_advance_shows_final_zero_before_next_phase(self):
+        manager = self.manager()
+        manager.add('a', 2, auto_advance=True)
+        self.run_until(manager, 1010)
+        self.assertEqual(self.events, [
+            ('a', 0, 2), ('a', 0, 1), ('a', 0, 0), ('a', 1, 'running'),
+            ('a', 1, 2), ('a', 1, 1), ('a', 1, 0), ('a', 1, 'done')])
+
+    def test_stopped_session_is_skipped(self):
+        manager = self.manager()
+        manager.add('a', 5)
+        manager.run_due()
+        manager.stop('a')
+        manager.add('a', 3)
+        self.run_until(manager, 1010)
+        # Only the first tick of the stopped session, then the new one alone
+        self.assertEqual(self.events, [
+            ('a', 0, 5), ('a', 0, 3), ('a', 0, 2), ('a', 0, 1), ('a', 0, 0),
+            ('a', 0, 'waiting')])
+        self.assertEqual(manager._heap, [])
+
+    def test_stop_from_on_tick_keeps_phase_from_ending(self):
+        manager = TimerManager(on_tick=lambda s: s.remaining == 0 and manager.stop(s.name),
+                               on_phase_end=self.events.append, clock=self.clock)
+        session = manager.add('a', 1, auto_advance=True)
+        self.run_until(manager, 1005)
+        self.assertEqual((session.state, session.phase_index), ('stopped', 0))
+        self.assertEqual(self.events, [])
+
+    def test_advance_ticks_each_second_once(self):
+        manager = self.manager()
+        manager.add('a', 2)
+        self.run_until(manager, 1005)
+        self.assertEqual(manager.sessions['a'].state, 'waiting')
+        del self.events[:]
+        manager.advance('a')
+        manager.advance('a')  # already running again: no second schedule
+        self.run_until(manager, 1010)
+        self.assertEqual(self.events, [
+            ('a', 1, 2), ('a', 1, 1), ('a', 1, 0), ('a', 1, 'done')])
+
+    def test_500_sessions_wake_the_driver_rarely(self):
+        manager = self.manager()
+        for index in range(500):
+            # Started over five seconds, so their ticks fall all over each second
+            self.clock.now = 1000 + index / 100
+            manager.add(f'call {index}', 750)
+            manager.run_due()
+        del self.events[:]
+        wakeups = self.run_until(manager, 1025)
+        # Every session shows each of the 20 seconds (give or take the last)
+        self.assertAlmostEqual(len(self.events), 500 * 20, delta=500)
+        # At most one wake-up per TICK_SLACK, not one per session tick
+        self.assertLessEqual(wakeups, 20 / TICK_SLACK + 1)
+        self.assertLessEqual(len(manager._heap), 500)
+
+
+class TimerCheckpointTest(TimerManagerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, 'timers.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def write_state(self, sessions, version=TIMER_STATE_VERSION):
+        with open(self.path, 'w') as f:
+            json.dump({'version': version, 'saved_at': time.time(),
+                       'sessions': sessions}, f)
+
+    def entry(self, name, left, **kwargs):
+        entry = {'name': name, 'total_seconds': 60, 'phases': ['Out', 'Back'],
+                 'phase_index': 0, 'state': 'running',
+                 'wall_deadline': time.time() + left, 'details': {}}
+        entry.update(kwargs)
+        return entry
+
+    def test_save_and_restore(self):
+        manager = self.manager(state_path=self.path)
+        manager.add('a', 60, details={'distance': 2})
+        manager.add('b', 60)
+        manager.stop('b')
+        restored = self.manager(state_path=self.path).restore()
+        self.assertEqual([session.name for session in restored], ['a'])
+        self.assertEqual(restored[0].details, {'distance': 2})
+        self.assertAlmostEqual(restored[0].timer.remaining(), 60, delta=1)
+
+    def test_expired_phase_ends_on_first_tick(self):
+        self.write_state([self.entry('a', -30)])
+        manager = self.manager(state_path=self.path)
+        session, = manager.restore()
+        self.assertEqual(session.remaining, 0)
+        manager.run_due()
+        self.assertEqual(self.events, [('a', 0, 0), ('a', 0, 'waiting')])
+
+    def test_auto_advance_catches_up(self):
+        # First phase ended 10 s ago: 50 s left of the second one
+        self.write_state([self.entry('a', -10, auto_advance=True)])
+        session, = self.manager(state_path=self.path).restore()
+        self.assertEqual((session.phase_index, session.state), (1, 'running'))
+        self.assertAlmostEqual(session.timer.remaining(), 50, delta=1)
+        # Overdue past the last phase: ends on the first tick
+        self.write_state([self.entry('b', -500, auto_advance=True)])
+        manager = self.manager(state_path=self.path)
+        session, = manager.restore()
+        manager.run_due()
+        self.assertEqual((session.phase_index, session.state), (1, 'done'))
+
+    def test_damaged_entries_are_skipped(self):
+        self.write_state([self.entry('a', 30), {'name': 'b'},
+                          self.entry('c', 30, phase_index=7),
+                          self.entry('d', 30, state='exploded'),
+                          self.entry('e', 30, wall_deadline='soon'),
+                          self.entry('f', 0, state='waiting', phase_index=1)])
+        restored = self.manager(state_path=self.path).restore()
+        self.assertEqual([(s.name, s.state) for s in restored],
+                         [('a', 'running'), ('f', 'waiting')])
+
+    def test_unreadable_state_restores_nothing(self):
+        self.write_state([self.entry('a', 30)], version=TIMER_STATE_VERSION + 1)
+        self.assertEqual(self.manager(state_path=self.path).restore(), [])
+        with open(self.path, 'w') as f:
+            f.write('{"version": 1, "sessions": [')
+        self.assertEqual(self.manager(state_path=self.path).restore(), [])
+        os.remove(self.path)
+        self.assertEqual(self.manager(state_path=self.path).restore(), [])
+
+    def test_removing_a_finished_session_does_not_save(self):
+        manager = self.manager(state_path=self.path)
+        manager.add('a', 1, phases=['Out'])
+        manager.add('b', 1)
+        manager.stop('b')
+        self.run_until(manager, 1005)
+        os.remove(self.path)
+        manager.remove('a')
+        manager.remove('b')
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(manager.sessions, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
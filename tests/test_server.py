@@ -0,0 +1,77 @@
+"""
+Tests for the --serve HTTP card service.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from decoy_server import STREAM_MIN_COUNT, CardServer  # noqa: E402
+from decoycards import DecoyCards  # noqa: E402
+
+
+class ServerTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.decoy = DecoyCards()
+        self.server = CardServer(self.decoy, port=0, workers=1)
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        self.server.server.close()
+        await self.server.server.wait_closed()
+        self.server.pool.shutdown(wait=False)
+        self.server.serial.shutdown(wait=False)
+
+    async def request(self, raw):
+        """Send raw request bytes, returns everything read until the server closes."""
+        reader, writer = await asyncio.open_connection('127.0.0.1', self.server.port)
+        writer.write(raw)
+        await writer.drain()
+        data = await asyncio.wait_for(reader.read(), 10)
+        writer.close()
+        return data
+
+
+class RequestParsingTest(ServerTestCase):
+    async def test_malformed_content_length_is_400(self):
+        data = await self.request(b'GET /health HTTP/1.1\r\nContent-Length: abc\r\n\r\n')
+        self.assertTrue(data.startswith(b'HTTP/1.1 400 '))
+        self.assertIn(b'Content-Length', data)
+
+
+class StreamingTest(ServerTestCase):
+    async def test_failure_mid_stream_closes_without_error_body(self):
+        def failing(card_type, count, **kwargs):
+            yield self.decoy.generate(card_type, 10)[0]
+            raise RuntimeError("generator broke")
+
+        self.decoy.iter_generate = failing
+        data = await self.request(
+            f'GET /cards/xbox?count={STREAM_MIN_COUNT} HTTP/1.1\r\n'
+            f'Connection: close\r\n\r\n'.encode('ascii'))
+        head, _, body = data.partition(b'\r\n\r\n')
+        self.assertIn(b'200 OK', head)
+        self.assertNotIn(b'"error"', body)
+        # Cut off: no terminating zero-length chunk
+        self.assertFalse(body.endswith(b'0\r\n\r\n'))
+
+    async def test_failure_before_first_chunk_is_an_error_response(self):
+        def failing(card_type, count, **kwargs):
+            raise ValueError("Not enough unused codes left for this card type")
+            yield
+
+        self.decoy.iter_generate = failing
+        data = await self.request(
+            f'GET /cards/xbox?count={STREAM_MIN_COUNT} HTTP/1.1\r\n'
+            f'Connection: close\r\n\r\n'.encode('ascii'))
+        head, _, body = data.partition(b'\r\n\r\n')
+        self.assertIn(b'500', head.split(b'\r\n')[0])
+        self.assertIn('Not enough unused codes', json.loads(body)['error'])
+
+
+if __name__ == '__main__':
+    unittest.main()